@@ -13,6 +13,7 @@ from app.db.session import get_db_session
 from app.models.enums import UserRole
 from app.repositories.user_repository import UserRepository
 from app.schemas.auth import AuthenticatedUser, TokenPayload
+from app.services.auth_service import PRINCIPAL_PREFIX, principal_cache
 from app.services.token_blacklist_service import is_token_blacklisted
 
 
@@ -41,12 +42,16 @@ async def _get_token_payload(
 async def get_current_user(
     payload: Annotated[TokenPayload, Depends(_get_token_payload)],
     db: Annotated[AsyncSession, Depends(get_db_session)],
+    redis: Annotated[Redis, Depends(get_redis)],
 ) -> AuthenticatedUser:
-    repo = UserRepository(db)
-    user = await repo.get_by_id(payload.sub)
-    if not user:
+    async def load() -> str | None:
+        user = await UserRepository(db).get_by_id(payload.sub)
+        return AuthenticatedUser.model_validate(user).model_dump_json() if user else None
+
+    principal = await principal_cache.get(redis, f"{PRINCIPAL_PREFIX}{payload.sub}", load)
+    if principal is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
-    return AuthenticatedUser.model_validate(user)
+    return AuthenticatedUser.model_validate_json(principal)
 
 
 async def get_current_active_user(
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import HTTPException, Query, status
+
+
+MAX_BATCH_IDS = 100
+
+
+async def batch_ids(
+    ids: list[str] = Query(
+        ...,
+        description=f"Up to {MAX_BATCH_IDS} ids, comma-separated and/or as repeated parameters",
+    ),
+) -> list[UUID]:
+    """Parse the `ids` query parameter into unique UUIDs, keeping request order."""
+
+    parsed: dict[UUID, None] = {}
+    for chunk in ids:
+        for raw in chunk.split(","):
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                parsed[UUID(raw)] = None
+            except ValueError:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid id: {raw}")
+    if not parsed:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="At least one id is required")
+    if len(parsed) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_IDS} ids per request",
+        )
+    return list(parsed)
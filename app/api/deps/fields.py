@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+
+
+def sparse_fields(
+    model: type[BaseModel],
+    *,
+    always: tuple[str, ...] = ("id",),
+) -> Callable[..., Awaitable[frozenset[str] | None]]:
+    """Build a dependency parsing `?fields=a,b` into a set of `model` field names.
+
+    Returns None when the parameter is absent, meaning the full representation.
+    Fields in `always` are included in every sparse response.
+    """
+
+    allowed = frozenset(model.model_fields)
+    listed = ", ".join(sorted(allowed))
+
+    async def dependency(
+        fields: str | None = Query(
+            default=None,
+            description=f"Comma-separated subset of fields to return: {listed}",
+        ),
+    ) -> frozenset[str] | None:
+        if fields is None:
+            return None
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested - allowed
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+        return frozenset(requested | set(always))
+
+    return dependency
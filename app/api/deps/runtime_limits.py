@@ -26,3 +26,12 @@ async def rate_limit_booking_create(
     key = f"booking_create:user:{current_user.id}"
     await check_rate_limit(redis, key, max_requests=5, window_seconds=60)
 
+
+async def rate_limit_booking_hold(
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
+    redis: Redis = Depends(get_redis),
+) -> None:
+    """Rate limit reservation holds per user."""
+
+    key = f"booking_hold:user:{current_user.id}"
+    await check_rate_limit(redis, key, max_requests=20, window_seconds=60)
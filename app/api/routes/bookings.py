@@ -3,18 +3,33 @@ from __future__ import annotations
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Header, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 
 from app.api.deps.auth import get_current_active_user
-from app.api.deps.runtime_limits import rate_limit_booking_create
+from app.api.deps.runtime_limits import rate_limit_booking_create, rate_limit_booking_hold
+from app.core.exceptions import ConflictError
+from app.core.http_cache import PRIVATE_CACHE, is_not_modified
 from app.db.session import get_db_session
 from app.db.redis import get_redis
 from app.models.enums import BookingStatus, UserRole
 from app.schemas.auth import AuthenticatedUser
-from app.schemas.booking import BookingCreate, BookingListResponse, BookingRead
+from app.schemas.booking import (
+    AvailabilityBatchRequest,
+    AvailabilityBatchResponse,
+    BookingBulkStatusResponse,
+    BookingBulkStatusUpdate,
+    BookingCreate,
+    BookingHoldCreate,
+    BookingHoldRead,
+    BookingListResponse,
+    BookingRead,
+)
+from app.services.availability_service import AvailabilityService
 from app.services.booking_service import BookingService
+from app.services.export_service import ExportFormat, ExportService
 
 
 router = APIRouter(prefix="/bookings", tags=["bookings"])
@@ -27,6 +42,17 @@ def get_booking_service(
     return BookingService(db, redis)
 
 
+def get_availability_service(
+    db: Annotated[AsyncSession, Depends(get_db_session)],
+    redis: Annotated[Redis, Depends(get_redis)],
+) -> AvailabilityService:
+    return AvailabilityService(db, redis)
+
+
+def get_export_service() -> ExportService:
+    return ExportService()
+
+
 @router.post(
     "",
     response_model=BookingRead,
@@ -37,40 +63,129 @@ async def create_booking(
     payload: BookingCreate,
     current_user: Annotated[AuthenticatedUser, Depends(get_current_active_user)],
     service: Annotated[BookingService, Depends(get_booking_service)],
-    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ) -> BookingRead:
     try:
         return await service.create_booking(
             renter_id=current_user.id,
             payload=payload,
-            idempotency_key=idempotency_key,
         )
+    except ConflictError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+    except (ValueError, PermissionError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+@router.post("/availability:batch", response_model=AvailabilityBatchResponse)
+async def check_availability_batch(
+    body: AvailabilityBatchRequest,
+    service: Annotated[AvailabilityService, Depends(get_availability_service)],
+) -> AvailabilityBatchResponse:
+    return await service.check_batch(body.queries)
+
+
+@router.post(
+    "/holds",
+    response_model=BookingHoldRead,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit_booking_hold)],
+)
+async def create_booking_hold(
+    payload: BookingHoldCreate,
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_active_user)],
+    service: Annotated[BookingService, Depends(get_booking_service)],
+) -> BookingHoldRead:
+    try:
+        return await service.create_hold(renter_id=current_user.id, payload=payload)
+    except ConflictError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
     except (ValueError, PermissionError) as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
 
+@router.delete("/holds/{hold_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def release_booking_hold(
+    hold_id: str,
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_active_user)],
+    service: Annotated[BookingService, Depends(get_booking_service)],
+) -> None:
+    try:
+        await service.release_hold(hold_id=hold_id, renter_id=current_user.id)
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    except PermissionError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc))
+
+
 @router.get("/me/renter", response_model=BookingListResponse)
 async def list_my_renter_bookings(
+    request: Request,
+    response: Response,
     current_user: Annotated[AuthenticatedUser, Depends(get_current_active_user)],
     service: Annotated[BookingService, Depends(get_booking_service)],
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-) -> BookingListResponse:
+) -> BookingListResponse | Response:
+    version = await service.renter_bookings_version(current_user.id)
+    headers = PRIVATE_CACHE.headers(version)
+    if is_not_modified(request, version):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
     return await service.list_bookings_for_renter(renter_id=current_user.id, skip=skip, limit=limit)
 
 
 @router.get("/me/owner", response_model=BookingListResponse)
 async def list_my_owner_bookings(
+    request: Request,
+    response: Response,
     current_user: Annotated[AuthenticatedUser, Depends(get_current_active_user)],
     service: Annotated[BookingService, Depends(get_booking_service)],
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-) -> BookingListResponse:
+) -> BookingListResponse | Response:
     if current_user.role not in (UserRole.OWNER, UserRole.ADMIN):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only owners can view owner bookings")
+    version = await service.owner_bookings_version(current_user.id)
+    headers = PRIVATE_CACHE.headers(version)
+    if is_not_modified(request, version):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
     return await service.list_bookings_for_owner(owner_id=current_user.id, skip=skip, limit=limit)
 
 
+@router.get("/me/owner/export", response_class=StreamingResponse)
+async def export_my_owner_bookings(
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_active_user)],
+    service: Annotated[ExportService, Depends(get_export_service)],
+    format: ExportFormat = Query(default=ExportFormat.CSV),
+) -> StreamingResponse:
+    if current_user.role not in (UserRole.OWNER, UserRole.ADMIN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only owners can export owner bookings")
+    return StreamingResponse(
+        service.bookings_for_owner(current_user.id, format),
+        media_type=format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="bookings.{format.value}"'},
+    )
+
+
+@router.post("/status:bulk", response_model=BookingBulkStatusResponse)
+async def bulk_update_booking_status(
+    body: BookingBulkStatusUpdate,
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_active_user)],
+    service: Annotated[BookingService, Depends(get_booking_service)],
+) -> BookingBulkStatusResponse:
+    if current_user.role not in (UserRole.OWNER, UserRole.ADMIN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only owners can bulk update bookings")
+    try:
+        return await service.bulk_update_status(
+            booking_ids=body.booking_ids,
+            actor_id=current_user.id,
+            role=current_user.role,
+            new_status=body.status,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
 @router.patch("/{booking_id}/status", response_model=BookingRead)
 async def update_booking_status(
     booking_id: UUID,
@@ -87,6 +202,8 @@ async def update_booking_status(
         )
     except LookupError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    except ConflictError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
     except PermissionError as exc:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc))
     except ValueError as exc:
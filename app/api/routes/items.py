@@ -3,21 +3,40 @@ from __future__ import annotations
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 
 from app.api.deps.auth import require_roles
+from app.api.deps.batch import batch_ids
+from app.api.deps.fields import sparse_fields
+from app.core.http_cache import BROWSE_CACHE, is_not_modified
+from app.core.responses import RawJSONResponse
 from app.db.session import get_db_session
 from app.db.redis import get_redis
 from app.models.enums import UserRole
 from app.schemas.auth import AuthenticatedUser
-from app.schemas.item import ItemCreate, ItemListResponse, ItemRead, ItemUpdate
+from app.schemas.item import (
+    ItemBatchResponse,
+    ItemCalendarRead,
+    ItemCreate,
+    ItemListResponse,
+    ItemPageRead,
+    ItemRead,
+    ItemUpdate,
+)
+from app.schemas.pricing import QuoteRequest, QuoteResponse
+from app.services.export_service import ExportFormat, ExportService
+from app.services.item_page_service import ItemPageService
 from app.services.item_service import ItemService
+from app.services.pricing_service import PricingService
 
 
 router = APIRouter(prefix="/items", tags=["items"])
 
+item_fields = sparse_fields(ItemRead)
+
 
 def get_item_service(
     db: Annotated[AsyncSession, Depends(get_db_session)],
@@ -26,6 +45,18 @@ def get_item_service(
     return ItemService(db, redis)
 
 
+def get_pricing_service(db: Annotated[AsyncSession, Depends(get_db_session)]) -> PricingService:
+    return PricingService(db)
+
+
+def get_item_page_service(redis: Annotated[Redis, Depends(get_redis)]) -> ItemPageService:
+    return ItemPageService(redis)
+
+
+def get_export_service() -> ExportService:
+    return ExportService()
+
+
 @router.post(
     "",
     response_model=ItemRead,
@@ -45,31 +76,106 @@ async def create_item(
 
 @router.get("", response_model=ItemListResponse)
 async def list_items(
+    request: Request,
     service: Annotated[ItemService, Depends(get_item_service)],
+    fields: Annotated[frozenset[str] | None, Depends(item_fields)],
     owner_id: UUID | None = Query(default=None),
     category_id: UUID | None = Query(default=None),
     is_active: bool | None = Query(default=True),
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-) -> ItemListResponse:
-    return await service.list_items(
+) -> Response:
+    version, content = await service.list_items_json(
         owner_id=owner_id,
         category_id=category_id,
         is_active=is_active,
         skip=skip,
         limit=limit,
+        fields=fields,
+        not_modified=lambda version: is_not_modified(request, version),
+    )
+    headers = BROWSE_CACHE.headers(version)
+    if content is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    # Already validated and serialized; returning a response skips response_model
+    return RawJSONResponse(content, headers=headers)
+
+
+@router.get(":batch", response_model=ItemBatchResponse)
+async def get_items_batch(
+    ids: Annotated[list[UUID], Depends(batch_ids)],
+    service: Annotated[ItemService, Depends(get_item_service)],
+) -> RawJSONResponse:
+    return RawJSONResponse(await service.get_items_json(ids))
+
+
+@router.get("/me/export", response_class=StreamingResponse)
+async def export_my_items(
+    current_user: Annotated[AuthenticatedUser, Depends(require_roles(UserRole.OWNER, UserRole.ADMIN))],
+    service: Annotated[ExportService, Depends(get_export_service)],
+    format: ExportFormat = Query(default=ExportFormat.CSV),
+) -> StreamingResponse:
+    return StreamingResponse(
+        service.items_for_owner(current_user.id, format),
+        media_type=format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="items.{format.value}"'},
     )
 
 
 @router.get("/{item_id}", response_model=ItemRead)
 async def get_item(
     item_id: UUID,
+    request: Request,
     service: Annotated[ItemService, Depends(get_item_service)],
-) -> ItemRead:
+) -> Response:
     try:
-        return await service.get_item(item_id)
+        content = await service.get_item_json(item_id)
     except LookupError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    version = service.item_version(content)
+    headers = BROWSE_CACHE.headers(version)
+    if is_not_modified(request, version):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return RawJSONResponse(content, headers=headers)
+
+
+@router.get("/{item_id}/page", response_model=ItemPageRead)
+async def get_item_page(
+    item_id: UUID,
+    service: Annotated[ItemPageService, Depends(get_item_page_service)],
+) -> ItemPageRead:
+    try:
+        return await service.get_page(item_id)
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+
+
+@router.get("/{item_id}/calendar", response_model=ItemCalendarRead)
+async def get_item_calendar(
+    item_id: UUID,
+    service: Annotated[ItemService, Depends(get_item_service)],
+    month: str = Query(pattern=r"^\d{4}-\d{2}$", description="Month as YYYY-MM"),
+) -> ItemCalendarRead:
+    try:
+        return await service.get_calendar(item_id, month)
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+@router.post("/{item_id}/quote", response_model=QuoteResponse)
+async def quote_item(
+    item_id: UUID,
+    body: QuoteRequest,
+    service: Annotated[PricingService, Depends(get_pricing_service)],
+) -> QuoteResponse:
+    try:
+        return await service.quote(item_id, body.ranges)
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
 
 @router.patch(
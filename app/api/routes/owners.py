@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps.auth import require_roles
+from app.db.session import get_db_session
+from app.models.enums import UserRole
+from app.schemas.auth import AuthenticatedUser
+from app.schemas.owner_stats import OwnerStatsRead
+from app.services.owner_stats_service import OwnerStatsService
+
+
+router = APIRouter(prefix="/owners", tags=["owners"])
+
+
+def get_owner_stats_service(db: Annotated[AsyncSession, Depends(get_db_session)]) -> OwnerStatsService:
+    return OwnerStatsService(db)
+
+
+@router.get("/me/stats", response_model=OwnerStatsRead)
+async def get_my_owner_stats(
+    current_user: Annotated[AuthenticatedUser, Depends(require_roles(UserRole.OWNER, UserRole.ADMIN))],
+    service: Annotated[OwnerStatsService, Depends(get_owner_stats_service)],
+    start_date: date | None = Query(default=None),
+    end_date: date | None = Query(default=None),
+) -> OwnerStatsRead:
+    default_start, default_end = OwnerStatsService.default_range()
+    try:
+        return await service.get_owner_stats(
+            owner_id=current_user.id,
+            start_date=start_date or default_start,
+            end_date=end_date or default_end,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
@@ -3,21 +3,33 @@ from __future__ import annotations
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
 
 from app.api.deps.auth import get_current_active_user
+from app.core.http_cache import BROWSE_CACHE, is_not_modified
 from app.db.session import get_db_session
+from app.db.redis import get_redis
 from app.schemas.auth import AuthenticatedUser
-from app.schemas.review import ReviewCreate, ReviewListResponse, ReviewRead
+from app.schemas.review import ReviewCreate, ReviewListResponse, ReviewRead, ReviewSummaryRead
+from app.services.export_service import ExportFormat, ExportService
 from app.services.review_service import ReviewService
 
 
 router = APIRouter(prefix="/reviews", tags=["reviews"])
 
 
-def get_review_service(db: Annotated[AsyncSession, Depends(get_db_session)]) -> ReviewService:
-    return ReviewService(db)
+def get_review_service(
+    db: Annotated[AsyncSession, Depends(get_db_session)],
+    redis: Annotated[Redis, Depends(get_redis)],
+) -> ReviewService:
+    return ReviewService(db, redis)
+
+
+def get_export_service() -> ExportService:
+    return ExportService()
 
 
 @router.post("", response_model=ReviewRead, status_code=status.HTTP_201_CREATED)
@@ -43,19 +55,56 @@ async def create_review(
 @router.get("/items/{item_id}", response_model=ReviewListResponse)
 async def list_item_reviews(
     item_id: UUID,
+    request: Request,
+    response: Response,
     service: Annotated[ReviewService, Depends(get_review_service)],
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-) -> ReviewListResponse:
+) -> ReviewListResponse | Response:
+    version = await service.item_reviews_version(item_id)
+    headers = BROWSE_CACHE.headers(version)
+    if is_not_modified(request, version):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
     return await service.list_item_reviews(item_id=item_id, skip=skip, limit=limit)
 
 
+@router.get("/items/{item_id}/summary", response_model=ReviewSummaryRead)
+async def get_item_review_summary(
+    item_id: UUID,
+    service: Annotated[ReviewService, Depends(get_review_service)],
+) -> ReviewSummaryRead:
+    try:
+        return await service.get_item_summary(item_id)
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+
+
 @router.get("/users/{user_id}", response_model=ReviewListResponse)
 async def list_user_reviews(
     user_id: UUID,
+    request: Request,
+    response: Response,
     service: Annotated[ReviewService, Depends(get_review_service)],
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-) -> ReviewListResponse:
+) -> ReviewListResponse | Response:
+    version = await service.user_reviews_version(user_id)
+    headers = BROWSE_CACHE.headers(version)
+    if is_not_modified(request, version):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
     return await service.list_user_reviews(user_id=user_id, skip=skip, limit=limit)
 
+
+@router.get("/me/export", response_class=StreamingResponse)
+async def export_my_reviews(
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_active_user)],
+    service: Annotated[ExportService, Depends(get_export_service)],
+    format: ExportFormat = Query(default=ExportFormat.CSV),
+) -> StreamingResponse:
+    return StreamingResponse(
+        service.reviews_for_user(current_user.id, format),
+        media_type=format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="reviews.{format.value}"'},
+    )
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps.auth import get_current_active_user
+from app.api.deps.batch import batch_ids
+from app.core.responses import RawJSONResponse
+from app.db.redis import get_redis
+from app.db.session import get_db_session
+from app.schemas.user import UserPublicListResponse
+from app.services.user_service import UserService
+
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+
+def get_user_service(
+    db: Annotated[AsyncSession, Depends(get_db_session)],
+    redis: Annotated[Redis, Depends(get_redis)],
+) -> UserService:
+    return UserService(db, redis)
+
+
+@router.get(
+    ":batch",
+    response_model=UserPublicListResponse,
+    dependencies=[Depends(get_current_active_user)],
+)
+async def get_users_batch(
+    ids: Annotated[list[UUID], Depends(batch_ids)],
+    service: Annotated[UserService, Depends(get_user_service)],
+) -> RawJSONResponse:
+    return RawJSONResponse(await service.get_public_users_json(ids))
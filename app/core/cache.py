@@ -0,0 +1,290 @@
+"""Read-through caches in front of Redis."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from app.core.config import get_settings
+from app.core.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+_LOCK_SUFFIX = ":lock"
+# Write a loaded value only if no invalidation ran since the load began.
+# KEYS[1] = entry, KEYS[2] = the cache's epoch counter
+# ARGV = value, expiry in seconds, epoch read before the load
+_STORE_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[3] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return 1
+"""
+# A caller that loses the load lock polls for the winner's value this long before loading itself
+_LOCK_POLL_INTERVAL_SECONDS = 0.05
+_LOCK_POLL_ATTEMPTS = 20
+
+_caches: dict[str, TieredCache] = {}
+
+
+class TieredCache:
+    """Process-local TTL LRU in front of Redis, for JSON text values.
+
+    Lookups go local LRU -> Redis -> `load()`. Concurrent misses for one key
+    share a single load within the process (single-flight), and a Redis
+    lock keeps other processes waiting for that load instead of repeating
+    it. Redis entries live `ttl + stale` seconds; in the stale tail they are
+    still served while the one caller that wins the lock refreshes them, so
+    a popular key never expires for everyone at once. `load()` returning
+    None means "does not exist" and is not cached.
+
+    Every invalidation bumps a per-cache epoch in Redis, and a loaded value
+    is only stored if the epoch is unchanged since the load began. A load
+    that raced a write therefore cannot put the pre-write value back after
+    the write invalidated it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        ttl_seconds: int,
+        stale_seconds: int | None = None,
+        local_ttl_seconds: float | None = None,
+        local_max_entries: int | None = None,
+    ) -> None:
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = settings.cache_stale_seconds if stale_seconds is None else stale_seconds
+        self.local_ttl_seconds = settings.cache_local_ttl_seconds if local_ttl_seconds is None else local_ttl_seconds
+        self.local_max_entries = local_max_entries or settings.cache_local_max_entries
+        self.metrics: Counter[str] = Counter()
+        self._epoch_key = f"cache:{name}:epoch"
+        self._local: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[str | None]] = {}
+        _caches[name] = self
+
+    async def get(self, redis: Redis, key: str, load: Callable[[], Awaitable[str | None]]) -> str | None:
+        entry = self._local.get(key)
+        if entry is not None:
+            if entry[1] > time.monotonic():
+                self._local.move_to_end(key)
+                self.metrics["local_hits"] += 1
+                return entry[0]
+            del self._local[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.metrics["coalesced"] += 1
+        else:
+            task = asyncio.ensure_future(self._fetch(redis, key, load))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller going away does not cancel the load for the others
+        return await asyncio.shield(task)
+
+    async def peek(self, redis: Redis, key: str) -> str | None:
+        """Return the cached value without loading it; None on a miss or in the stale tail."""
+
+        entry = self._local.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            self._local.move_to_end(key)
+            self.metrics["local_hits"] += 1
+            return entry[0]
+
+        pipe = redis.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.pttl(key)
+        raw, pttl_ms = await pipe.execute()
+        if raw is None or 0 <= pttl_ms <= self.stale_seconds * 1000:
+            return None
+        self.metrics["redis_hits"] += 1
+        self._remember(key, raw)
+        return raw
+
+    async def get_many(
+        self,
+        redis: Redis,
+        *,
+        prefix: str,
+        ids: Sequence[UUID],
+        load_missing: Callable[[list[UUID]], Awaitable[dict[UUID, str]]],
+    ) -> dict[UUID, str]:
+        """Batch `get` of `{prefix}{id}` keys; ids that exist nowhere are absent from the result.
+
+        Local hits are served first and the rest come from one Redis round
+        trip. Misses and entries in their stale tail are loaded together in
+        one `load_missing` call and stored like `get` stores them. There is
+        no single-flight here: a batch load is one query whatever it covers.
+        """
+
+        found: dict[UUID, str] = {}
+        remote: list[UUID] = []
+        now = time.monotonic()
+        for entity_id in ids:
+            entry = self._local.get(f"{prefix}{entity_id}")
+            if entry is not None and entry[1] > now:
+                self._local.move_to_end(f"{prefix}{entity_id}")
+                self.metrics["local_hits"] += 1
+                found[entity_id] = entry[0]
+            else:
+                remote.append(entity_id)
+        if not remote:
+            return found
+
+        pipe = redis.pipeline(transaction=False)
+        pipe.get(self._epoch_key)
+        pipe.mget([f"{prefix}{i}" for i in remote])
+        for entity_id in remote:
+            pipe.pttl(f"{prefix}{entity_id}")
+        epoch, raws, *pttls = await pipe.execute()
+        epoch = epoch or "0"
+
+        missing: list[UUID] = []
+        for entity_id, raw, pttl_ms in zip(remote, raws, pttls):
+            if raw is None:
+                self.metrics["misses"] += 1
+                missing.append(entity_id)
+            elif 0 <= pttl_ms <= self.stale_seconds * 1000:
+                self.metrics["refreshes"] += 1
+                missing.append(entity_id)
+            else:
+                self.metrics["redis_hits"] += 1
+                self._remember(f"{prefix}{entity_id}", raw)
+                found[entity_id] = raw
+        if not missing:
+            return found
+
+        self.metrics["loads"] += 1
+        loaded = await load_missing(missing)
+        if loaded:
+            store = redis.register_script(_STORE_SCRIPT)
+            pipe = redis.pipeline(transaction=False)
+            for entity_id, value in loaded.items():
+                await store(
+                    keys=[f"{prefix}{entity_id}", self._epoch_key],
+                    args=[value, self.ttl_seconds + self.stale_seconds, epoch],
+                    client=pipe,
+                )
+            for (entity_id, value), stored in zip(loaded.items(), await pipe.execute()):
+                if stored:
+                    self._remember(f"{prefix}{entity_id}", value)
+                else:
+                    self.metrics["fenced"] += 1
+            found.update(loaded)
+        return found
+
+    async def invalidate(self, redis: Redis, *keys: str) -> None:
+        for key in keys:
+            self._local.pop(key, None)
+        if keys:
+            pipe = redis.pipeline(transaction=False)
+            pipe.incr(self._epoch_key)
+            pipe.delete(*keys)
+            await pipe.execute()
+
+    async def invalidate_prefix(self, redis: Redis, prefix: str) -> None:
+        for key in [k for k in self._local if k.startswith(prefix)]:
+            del self._local[key]
+        await redis.incr(self._epoch_key)
+        async for key in redis.scan_iter(f"{prefix}*"):
+            await redis.delete(key)
+
+    async def _fetch(self, redis: Redis, key: str, load: Callable[[], Awaitable[str | None]]) -> str | None:
+        pipe = redis.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.pttl(key)
+        pipe.get(self._epoch_key)
+        raw, pttl_ms, epoch = await pipe.execute()
+        epoch = epoch or "0"
+
+        if raw is not None:
+            # A negative PTTL means no expiry; treat as fresh
+            if pttl_ms < 0 or pttl_ms > self.stale_seconds * 1000:
+                self.metrics["redis_hits"] += 1
+            else:
+                self.metrics["stale_hits"] += 1
+                if await self._try_lock(redis, key):
+                    raw = await self._refresh(redis, key, load, stale=raw, epoch=epoch)
+            self._remember(key, raw)
+            return raw
+
+        self.metrics["misses"] += 1
+        locked = await self._try_lock(redis, key)
+        if not locked:
+            for _ in range(_LOCK_POLL_ATTEMPTS):
+                await asyncio.sleep(_LOCK_POLL_INTERVAL_SECONDS)
+                raw = await redis.get(key)
+                if raw is not None:
+                    self.metrics["coalesced"] += 1
+                    self._remember(key, raw)
+                    return raw
+        try:
+            self.metrics["loads"] += 1
+            value = await load()
+            if value is not None:
+                await self._store(redis, key, value, epoch)
+            return value
+        finally:
+            if locked:
+                await redis.delete(f"{key}{_LOCK_SUFFIX}")
+
+    async def _refresh(
+        self,
+        redis: Redis,
+        key: str,
+        load: Callable[[], Awaitable[str | None]],
+        *,
+        stale: str,
+        epoch: str,
+    ) -> str | None:
+        try:
+            self.metrics["refreshes"] += 1
+            try:
+                value = await load()
+            except Exception:
+                self.metrics["refresh_errors"] += 1
+                logger.exception("cache_refresh_failed", cache=self.name, key=key)
+                return stale
+            if value is None:
+                await self.invalidate(redis, key)
+            else:
+                await self._store(redis, key, value, epoch)
+            return value
+        finally:
+            await redis.delete(f"{key}{_LOCK_SUFFIX}")
+
+    async def _try_lock(self, redis: Redis, key: str) -> bool:
+        return bool(await redis.set(f"{key}{_LOCK_SUFFIX}", "1", nx=True, ex=settings.cache_lock_ttl_seconds))
+
+    async def _store(self, redis: Redis, key: str, value: str, epoch: str) -> None:
+        store = redis.register_script(_STORE_SCRIPT)
+        if await store(keys=[key, self._epoch_key], args=[value, self.ttl_seconds + self.stale_seconds, epoch]):
+            self._remember(key, value)
+        else:
+            self.metrics["fenced"] += 1
+
+    def _remember(self, key: str, value: str | None) -> None:
+        if value is None or self.local_ttl_seconds <= 0:
+            return
+        self._local[key] = (value, time.monotonic() + self.local_ttl_seconds)
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_max_entries:
+            self._local.popitem(last=False)
+
+
+def cache_metrics() -> dict[str, dict[str, int]]:
+    """Per-process counters of every TieredCache, keyed by cache name."""
+
+    return {
+        name: {**cache.metrics, "local_entries": len(cache._local)}
+        for name, cache in sorted(_caches.items())
+    }
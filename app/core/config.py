@@ -46,6 +46,62 @@ class Settings(BaseSettings):
     celery_broker_url: AnyUrl = Field(default="redis://redis:6379/1", alias="CELERY_BROKER_URL")
     celery_result_backend: AnyUrl = Field(default="redis://redis:6379/2", alias="CELERY_RESULT_BACKEND")
 
+    # Bookings
+    booking_hold_ttl_seconds: int = Field(default=600, alias="BOOKING_HOLD_TTL_SECONDS")
+    item_calendar_cache_ttl_seconds: int = Field(default=3600, alias="ITEM_CALENDAR_CACHE_TTL_SECONDS")
+
+    # Escrow
+    escrow_dispute_window_hours: int = Field(default=24, alias="ESCROW_DISPUTE_WINDOW_HOURS")
+    escrow_release_batch_size: int = Field(default=1000, alias="ESCROW_RELEASE_BATCH_SIZE")
+    escrow_release_interval_seconds: int = Field(default=900, alias="ESCROW_RELEASE_INTERVAL_SECONDS")
+
+    # Owner stats rollups
+    owner_stats_refresh_interval_seconds: int = Field(default=300, alias="OWNER_STATS_REFRESH_INTERVAL_SECONDS")
+    # Changes younger than this are left for the next run so in-flight transactions can commit
+    owner_stats_refresh_lag_seconds: int = Field(default=60, alias="OWNER_STATS_REFRESH_LAG_SECONDS")
+
+    # Item detail page and per-entity caches: time budget and cache lifetimes
+    item_page_part_timeout_seconds: float = Field(default=2.0, alias="ITEM_PAGE_PART_TIMEOUT_SECONDS")
+    item_detail_cache_ttl_seconds: int = Field(default=60, alias="ITEM_DETAIL_CACHE_TTL_SECONDS")
+    user_public_cache_ttl_seconds: int = Field(default=300, alias="USER_PUBLIC_CACHE_TTL_SECONDS")
+    owner_trust_cache_ttl_seconds: int = Field(default=300, alias="OWNER_TRUST_CACHE_TTL_SECONDS")
+    item_list_cache_ttl_seconds: int = Field(default=60, alias="ITEM_LIST_CACHE_TTL_SECONDS")
+    category_cache_ttl_seconds: int = Field(default=600, alias="CATEGORY_CACHE_TTL_SECONDS")
+    principal_cache_ttl_seconds: int = Field(default=30, alias="PRINCIPAL_CACHE_TTL_SECONDS")
+
+    # Two-tier cache (core.cache.TieredCache): in-process LRU in front of Redis.
+    # Local entries are not invalidated across processes, so keep their TTL short.
+    cache_local_ttl_seconds: float = Field(default=5.0, alias="CACHE_LOCAL_TTL_SECONDS")
+    cache_local_max_entries: int = Field(default=10000, alias="CACHE_LOCAL_MAX_ENTRIES")
+    # Expired Redis entries are still served this long while one caller refreshes them
+    cache_stale_seconds: int = Field(default=30, alias="CACHE_STALE_SECONDS")
+    cache_lock_ttl_seconds: int = Field(default=5, alias="CACHE_LOCK_TTL_SECONDS")
+
+    # Reviews: per-item summary cache (histogram + latest snippets)
+    review_summary_ttl_seconds: int = Field(default=86400, alias="REVIEW_SUMMARY_TTL_SECONDS")
+    review_summary_latest: int = Field(default=5, alias="REVIEW_SUMMARY_LATEST")
+    # Reviews: how often incrementally maintained rating aggregates are reconciled
+    rating_reconcile_interval_seconds: int = Field(default=3600, alias="RATING_RECONCILE_INTERVAL_SECONDS")
+
+    # Nightly trust score recomputation (see services.trust_score_service)
+    trust_score_recompute_hour_utc: int = Field(default=3, alias="TRUST_SCORE_RECOMPUTE_HOUR_UTC")
+    trust_score_prior_weight: float = Field(default=5.0, alias="TRUST_SCORE_PRIOR_WEIGHT")
+    trust_score_half_life_days: float = Field(default=365.0, alias="TRUST_SCORE_HALF_LIFE_DAYS")
+    trust_score_write_batch_size: int = Field(default=10000, alias="TRUST_SCORE_WRITE_BATCH_SIZE")
+
+    # Streaming exports: rows fetched per server-side cursor round trip
+    export_chunk_size: int = Field(default=1000, alias="EXPORT_CHUNK_SIZE")
+
+    # HTTP caching of anonymous browse responses (items, reviews); see core.http_cache
+    http_cache_max_age_seconds: int = Field(default=30, alias="HTTP_CACHE_MAX_AGE_SECONDS")
+    http_cache_stale_while_revalidate_seconds: int = Field(
+        default=60, alias="HTTP_CACHE_STALE_WHILE_REVALIDATE_SECONDS"
+    )
+
+    # Idempotency-Key replay for mutating requests
+    idempotency_ttl_seconds: int = Field(default=86400, alias="IDEMPOTENCY_TTL_SECONDS")
+    idempotency_lock_ttl_seconds: int = Field(default=60, alias="IDEMPOTENCY_LOCK_TTL_SECONDS")
+
     # CORS (comma-separated origins, e.g. "https://app.example.com,https://admin.example.com")
     cors_origins: str = Field(default="*", alias="CORS_ORIGINS")
 
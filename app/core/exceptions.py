@@ -6,14 +6,21 @@ from typing import Any
 
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.core.logging_config import get_logger
+from app.core.responses import ORJSONResponse
 
 logger = get_logger(__name__)
 
 
+class ConflictError(Exception):
+    """A write lost against concurrent state (e.g. an overlapping booking).
+
+    Routes map this to HTTP 409.
+    """
+
+
 def error_response(
     status_code: int,
     detail: str | list[dict[str, Any]],
@@ -32,7 +39,7 @@ def error_response(
 async def http_exception_handler(
     request: Request,
     exc: StarletteHTTPException,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle FastAPI/Starlette HTTPException → consistent JSON and logging."""
     request_id = getattr(request.state, "request_id", None) or request.headers.get("X-Request-ID")
     status_code = exc.status_code
@@ -43,7 +50,7 @@ async def http_exception_handler(
     else:
         logger.warning("http_error", status_code=status_code, detail=detail, path=request.url.path)
 
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=status_code,
         content=error_response(status_code, detail, request_id=request_id),
     )
@@ -55,7 +62,7 @@ async def http_exception_handler(
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle Pydantic validation errors (422) with structured detail."""
     request_id = getattr(request.state, "request_id", None) or request.headers.get("X-Request-ID")
     errors = exc.errors()
@@ -64,7 +71,7 @@ async def validation_exception_handler(
         path=request.url.path,
         errors=errors,
     )
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=error_response(
             status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -81,7 +88,7 @@ async def validation_exception_handler(
 async def unhandled_exception_handler(
     request: Request,
     exc: Exception,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Catch-all for unhandled exceptions; log full traceback, return 500."""
     request_id = getattr(request.state, "request_id", None) or request.headers.get("X-Request-ID")
     logger.exception(
@@ -90,7 +97,7 @@ async def unhandled_exception_handler(
         method=request.method,
         exc_info=exc,
     )
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=error_response(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
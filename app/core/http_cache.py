@@ -0,0 +1,97 @@
+"""HTTP validators (ETag / Last-Modified) and per-route Cache-Control policies."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request
+from sqlalchemy import Row
+
+from app.core.config import get_settings
+
+
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class ResourceVersion:
+    etag: str
+    last_modified: datetime | None = None
+
+    @classmethod
+    def of(cls, *parts: object, last_modified: datetime | None = None) -> ResourceVersion:
+        """Build a version whose strong ETag is a digest of `parts`."""
+
+        digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=12).hexdigest()
+        return cls(etag=f'"{digest}"', last_modified=last_modified)
+
+    @classmethod
+    def of_body(cls, body: bytes, *, last_modified: datetime | None = None) -> ResourceVersion:
+        """Version of a representation served from a cache, taken from the exact bytes sent.
+
+        A version read from the database can run ahead of a cached body;
+        hashing the body keeps the ETag describing what the client holds.
+        """
+
+        return cls(etag=f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"', last_modified=last_modified)
+
+    @classmethod
+    def of_collection(cls, row: Row) -> ResourceVersion:
+        """Version of a list from a `repositories.versions.collection_version` row.
+
+        Lists carry no Last-Modified: a delete does not move `max(updated_at)`,
+        so only the ETag can tell that the list changed.
+        """
+
+        return cls.of(row.count, row.last_modified.isoformat() if row.last_modified else None, row.checksum)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    cache_control: str
+    vary: str
+
+    def headers(self, version: ResourceVersion) -> dict[str, str]:
+        headers = {"ETag": version.etag, "Cache-Control": self.cache_control, "Vary": self.vary}
+        if version.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(version.last_modified.astimezone(timezone.utc), usegmt=True)
+        return headers
+
+
+# Anonymous browse traffic: identical for every caller, so shared caches may store it
+BROWSE_CACHE = CachePolicy(
+    cache_control=(
+        f"public, max-age={settings.http_cache_max_age_seconds}, "
+        f"stale-while-revalidate={settings.http_cache_stale_while_revalidate_seconds}"
+    ),
+    vary="Accept-Encoding",
+)
+# Per-user data: the browser may keep it but must revalidate every time
+PRIVATE_CACHE = CachePolicy(cache_control="private, no-cache", vary="Authorization, Accept-Encoding")
+
+
+def is_not_modified(request: Request, version: ResourceVersion) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since when it is absent (RFC 9110 13.2.2)."""
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison: W/"x" matches "x"
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return version.etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or version.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have one-second resolution
+    return version.last_modified.replace(microsecond=0) <= since
@@ -0,0 +1,269 @@
+"""ASGI idempotency layer for mutating requests carrying an `Idempotency-Key`.
+
+The first request with a given key claims it in Redis with `SET NX` and an
+in-progress marker, runs normally, and stores the serialized response. Retries
+with the same key are answered from Redis byte-for-byte without reaching the
+route (or the database). Keys are scoped to the authenticated subject (so
+retries survive an access-token refresh), method and path, and bound to a
+fingerprint of the request body.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import uuid
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging_config import get_logger
+from app.core.security import TokenType, decode_token
+
+logger = get_logger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+IDEMPOTENCY_PREFIX = "idempotency:"
+IDEMPOTENT_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+MAX_KEY_LENGTH = 255
+# Responses larger than this are passed through but not stored for replay
+MAX_STORED_BODY_BYTES = 1024 * 1024
+
+_IN_PROGRESS = "in_progress"
+_COMPLETED = "completed"
+
+# Settle a claim only while it is still ours: a claim that outlived the lock
+# TTL may have been taken over by a retry, whose record must not be clobbered.
+# KEYS[1] = record; ARGV = our in-progress value, final record ('' to release), ttl
+_FINISH_SCRIPT = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+if ARGV[2] == '' then
+    redis.call('DEL', KEYS[1])
+else
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+end
+return 1
+"""
+
+
+def _header(scope: Scope, name: bytes) -> bytes | None:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return None
+
+
+class IdempotencyMiddleware:
+    """Claim, record and replay responses of mutating requests by idempotency key."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        redis: Redis,
+        ttl_seconds: int,
+        lock_ttl_seconds: int,
+    ) -> None:
+        self.app = app
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.lock_ttl_seconds = lock_ttl_seconds
+        self._finish_script = redis.register_script(_FINISH_SCRIPT)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in IDEMPOTENT_METHODS:
+            await self.app(scope, receive, send)
+            return
+        raw_key = _header(scope, IDEMPOTENCY_HEADER.lower().encode())
+        if raw_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not raw_key or len(raw_key) > MAX_KEY_LENGTH:
+            await self._send_error(send, 400, "Invalid Idempotency-Key header")
+            return
+
+        body = await self._read_body(receive)
+        cache_key = self._cache_key(scope, raw_key)
+        fingerprint = hashlib.sha256(body).hexdigest()
+        claim = json.dumps({"state": _IN_PROGRESS, "fingerprint": fingerprint, "claim": uuid.uuid4().hex})
+
+        try:
+            claimed = await self.redis.set(
+                cache_key,
+                claim,
+                nx=True,
+                ex=self.lock_ttl_seconds,
+            )
+            stored = None if claimed else await self.redis.get(cache_key)
+        except RedisError:
+            logger.warning("idempotency_unavailable", path=scope["path"])
+            await self.app(scope, self._replay_body(body), send)
+            return
+
+        if not claimed:
+            if stored is None:
+                # The previous attempt released its claim between our SET and GET
+                await self._send_error(send, 409, "A request with this Idempotency-Key is in progress")
+                return
+            record = json.loads(stored)
+            if record["fingerprint"] != fingerprint:
+                await self._send_error(send, 422, "Idempotency-Key was reused with a different request")
+            elif record["state"] == _IN_PROGRESS:
+                await self._send_error(send, 409, "A request with this Idempotency-Key is in progress")
+            else:
+                await self._replay(send, record)
+            return
+
+        await self._run_and_record(scope, body, send, cache_key, fingerprint, claim)
+
+    async def _run_and_record(
+        self,
+        scope: Scope,
+        body: bytes,
+        send: Send,
+        cache_key: str,
+        fingerprint: str,
+        claim: str,
+    ) -> None:
+        start: Message | None = None
+        chunks: list[bytes] = []
+        size = 0
+        complete = False
+
+        async def capture(message: Message) -> None:
+            nonlocal start, size, complete
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                if size <= MAX_STORED_BODY_BYTES:
+                    chunks.append(chunk)
+                if not message.get("more_body", False):
+                    complete = True
+            await send(message)
+
+        try:
+            await self.app(scope, self._replay_body(body), capture)
+        finally:
+            await self._finish(cache_key, fingerprint, claim, start, chunks, size, complete)
+
+    async def _finish(
+        self,
+        cache_key: str,
+        fingerprint: str,
+        claim: str,
+        start: Message | None,
+        chunks: list[bytes],
+        size: int,
+        complete: bool,
+    ) -> None:
+        try:
+            # Server errors and unfinished responses are not final: let the client retry
+            if start is None or not complete or start["status"] >= 500 or size > MAX_STORED_BODY_BYTES:
+                released = await self._finish_script(keys=[cache_key], args=[claim, "", 0])
+                if not released:
+                    logger.warning("idempotency_claim_lost", key=cache_key)
+                return
+            record = {
+                "state": _COMPLETED,
+                "fingerprint": fingerprint,
+                "status": start["status"],
+                "headers": [
+                    [base64.b64encode(k).decode(), base64.b64encode(v).decode()]
+                    for k, v in start.get("headers", [])
+                ],
+                "body": base64.b64encode(b"".join(chunks)).decode(),
+            }
+            stored = await self._finish_script(keys=[cache_key], args=[claim, json.dumps(record), self.ttl_seconds])
+            if not stored:
+                logger.warning("idempotency_claim_lost", key=cache_key)
+        except RedisError:
+            logger.warning("idempotency_store_failed", key=cache_key)
+
+    @staticmethod
+    def _caller(scope: Scope) -> bytes:
+        """Who the key belongs to: the access token's subject when it verifies.
+
+        Anything else (no credentials, an expired or foreign token) is scoped
+        to the raw Authorization header, as the route will reject it anyway.
+        """
+
+        authorization = _header(scope, b"authorization")
+        if authorization is None:
+            return b""
+        scheme, _, token = authorization.decode("latin-1").partition(" ")
+        if scheme.lower() == "bearer" and token:
+            try:
+                payload = decode_token(token)
+            except ValueError:
+                payload = {}
+            if payload.get("type") == TokenType.ACCESS and payload.get("sub"):
+                return f"sub:{payload['sub']}".encode()
+        return b"authorization:" + authorization
+
+    @classmethod
+    def _cache_key(cls, scope: Scope, raw_key: bytes) -> str:
+        digest = hashlib.sha256()
+        for part in (
+            cls._caller(scope),
+            scope["method"].encode(),
+            scope["path"].encode(),
+            raw_key,
+        ):
+            digest.update(part)
+            digest.update(b"\0")
+        return f"{IDEMPOTENCY_PREFIX}{digest.hexdigest()}"
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> bytes:
+        chunks: list[bytes] = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    @staticmethod
+    def _replay_body(body: bytes) -> Receive:
+        sent = False
+
+        async def receive() -> Message:
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return {"type": "http.disconnect"}
+
+        return receive
+
+    @staticmethod
+    async def _replay(send: Send, record: dict[str, Any]) -> None:
+        headers = [(base64.b64decode(k), base64.b64decode(v)) for k, v in record["headers"]]
+        headers.append((REPLAYED_HEADER.lower().encode(), b"true"))
+        await send({"type": "http.response.start", "status": record["status"], "headers": headers})
+        await send({"type": "http.response.body", "body": base64.b64decode(record["body"])})
+
+    @staticmethod
+    async def _send_error(send: Send, status_code: int, detail: str) -> None:
+        body = json.dumps({"detail": detail}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
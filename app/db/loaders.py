@@ -0,0 +1,78 @@
+"""Session-scoped deduplication of primary-key lookups.
+
+Repeated `get_by_id` calls for the same id on one session are answered from
+the first result without another query. Since each request gets its own
+session, loaders are effectively request-scoped. Lookups are not batched: no
+code path issues concurrent lookups on one session, so collecting them into
+one `IN (...)` query would only add scheduling.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Generic, TypeVar
+from uuid import UUID
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.base import Base
+
+
+ModelT = TypeVar("ModelT", bound=Base)
+
+_SESSION_INFO_KEY = "loaders"
+
+
+class EntityLoader(Generic[ModelT]):
+    """Remembers primary-key loads of one model, including misses."""
+
+    def __init__(self, session: AsyncSession, model: type[ModelT]) -> None:
+        self.session = session
+        self.model = model
+        self._loaded: dict[UUID, ModelT | None] = {}
+
+    async def load(self, key: UUID | str) -> ModelT | None:
+        key = key if isinstance(key, UUID) else UUID(str(key))
+        if key in self._loaded:
+            return self._loaded[key]
+        res = await self.session.execute(select(self.model).where(self.model.id == key))
+        entity = self._loaded[key] = res.scalar_one_or_none()
+        return entity
+
+    def clear(self, key: UUID | None = None) -> None:
+        if key is None:
+            self._loaded.clear()
+        else:
+            self._loaded.pop(key, None)
+
+
+class Loaders:
+    """Registry of per-model loaders bound to one session."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self._loaders: dict[type[Any], EntityLoader[Any]] = {}
+        # Rolled-back entities are expired and must not be served again
+        event.listen(session.sync_session, "after_rollback", self._on_rollback)
+
+    def of(self, model: type[ModelT]) -> EntityLoader[ModelT]:
+        loader = self._loaders.get(model)
+        if loader is None:
+            loader = self._loaders[model] = EntityLoader(self.session, model)
+        return loader
+
+    def clear(self) -> None:
+        for loader in self._loaders.values():
+            loader.clear()
+
+    def _on_rollback(self, _session: Any) -> None:
+        self.clear()
+
+
+def loaders_for(session: AsyncSession) -> Loaders:
+    """Return the loader registry attached to `session`, creating it on first use."""
+
+    loaders = session.info.get(_SESSION_INFO_KEY)
+    if loaders is None:
+        loaders = session.info[_SESSION_INFO_KEY] = Loaders(session)
+    return loaders
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
@@ -45,3 +46,18 @@ async def get_db_session() -> AsyncIterator[AsyncSession]:
         finally:
             await session.close()
 
+
+@asynccontextmanager
+async def unit_of_work(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """Run a block of writes as one transaction.
+
+    Commits once when the block exits cleanly and rolls everything back if it
+    raises, so callers never leave partial writes behind.
+    """
+
+    try:
+        yield session
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        raise
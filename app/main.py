@@ -5,10 +5,11 @@ from pathlib import Path
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.core.cache import cache_metrics
 from app.core.config import get_settings
 from app.core.logging_config import configure_logging
 from app.core.middleware import RequestLoggingMiddleware, SecurityHeadersMiddleware
@@ -18,12 +19,17 @@ from app.core.exceptions import (
     unhandled_exception_handler,
 )
 from app.core.health import check_readiness
+from app.core.idempotency import IdempotencyMiddleware
+from app.core.responses import ORJSONResponse
+from app.db.redis import redis_client
 from app.api.routes import auth as auth_routes
 from app.api.routes import items as items_routes
 from app.api.routes import bookings as bookings_routes
 from app.api.routes import escrow as escrow_routes
 from app.api.routes import reviews as reviews_routes
 from app.api.routes import chat as chat_routes
+from app.api.routes import owners as owners_routes
+from app.api.routes import users as users_routes
 
 
 def create_app() -> FastAPI:
@@ -41,6 +47,7 @@ def create_app() -> FastAPI:
         docs_url="/docs" if settings.app_env != "prod" else None,
         redoc_url="/redoc" if settings.app_env != "prod" else None,
         openapi_url="/openapi.json" if settings.app_env != "prod" else None,
+        default_response_class=ORJSONResponse,
     )
 
     # Exception handlers (consistent JSON and logging)
@@ -48,7 +55,14 @@ def create_app() -> FastAPI:
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
     app.add_exception_handler(Exception, unhandled_exception_handler)
 
-    # Middleware (last added = outermost): security headers, CORS, then request logging
+    # Middleware (last added = outermost): security headers, CORS, request logging,
+    # then idempotency replay innermost so replays still get fresh request IDs and headers
+    app.add_middleware(
+        IdempotencyMiddleware,
+        redis=redis_client,
+        ttl_seconds=settings.idempotency_ttl_seconds,
+        lock_ttl_seconds=settings.idempotency_lock_ttl_seconds,
+    )
     app.add_middleware(RequestLoggingMiddleware)
     origins = [o.strip() for o in settings.cors_origins.split(",") if o.strip()]
     app.add_middleware(
@@ -67,18 +81,25 @@ def create_app() -> FastAPI:
     app.include_router(escrow_routes.router)
     app.include_router(reviews_routes.router)
     app.include_router(chat_routes.router)
+    app.include_router(owners_routes.router)
+    app.include_router(users_routes.router)
 
     @app.get("/health", tags=["health"])
     async def health_liveness() -> dict[str, str]:
         """Liveness: is the process up? No dependencies."""
         return {"status": "ok"}
 
+    @app.get("/health/cache", tags=["health"])
+    async def health_cache() -> dict[str, dict[str, int]]:
+        """Hit, miss and coalescing counters of the two-tier caches in this process."""
+        return cache_metrics()
+
     @app.get("/health/ready", tags=["health"], response_model=None)
-    async def health_readiness() -> dict | JSONResponse:
+    async def health_readiness() -> dict | ORJSONResponse:
         """Readiness: can we serve traffic? Checks DB and Redis."""
         result = await check_readiness()
         if result["status"] != "ok":
-            return JSONResponse(status_code=503, content=result)
+            return ORJSONResponse(status_code=503, content=result)
         return result
 
     # Simple frontend: serve from /app so API and UI are same origin
@@ -8,4 +8,4 @@ from app.models.message import Message  # noqa: F401
 from app.models.review import Review  # noqa: F401
 from app.models.user import User  # noqa: F401
 from app.models.escrow import EscrowRecord  # noqa: F401
-
+from app.models.owner_stats import ItemDailyStats, RollupWatermark  # noqa: F401
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import uuid
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 
-from sqlalchemy import CheckConstraint, Date, ForeignKey, Index, Numeric, Text
+from sqlalchemy import DDL, CheckConstraint, Date, DateTime, ForeignKey, Index, Numeric, Text, event, func, literal_column, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDPrimaryKeyMixin
@@ -19,6 +20,8 @@ class Booking(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     total_price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     status: Mapped[BookingStatus] = mapped_column(default=BookingStatus.REQUESTED, nullable=False)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Set when the booking moves to COMPLETED; anchors the escrow dispute window
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     item_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("items.id", ondelete="CASCADE"),
@@ -45,9 +48,19 @@ class Booking(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     __table_args__ = (
         CheckConstraint("end_date >= start_date", name="ck_bookings_end_after_start"),
         CheckConstraint("total_price >= 0", name="ck_bookings_total_price_non_negative"),
-        Index("ix_bookings_item_id", "item_id"),
-        Index("ix_bookings_renter_id", "renter_id"),
-        Index("ix_bookings_owner_id", "owner_id"),
         Index("ix_bookings_status", "status"),
+        # No two live bookings of the same item may share a day. Enforced by
+        # Postgres so concurrent requests cannot double-book.
+        ExcludeConstraint(
+            ("item_id", "="),
+            (func.daterange(literal_column("start_date"), literal_column("end_date"), text("'[]'")), "&&"),
+            where=text("status IN ('REQUESTED', 'APPROVED', 'ACTIVE')"),
+            using="gist",
+            name="ex_bookings_item_no_overlap",
+        ),
     )
 
+
+# `item_id WITH =` inside a GiST exclusion constraint needs btree_gist.
+event.listen(Booking.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import Index, String
+from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDPrimaryKeyMixin
@@ -15,7 +15,3 @@ class Category(UUIDPrimaryKeyMixin, TimestampMixin, Base):
 
     items = relationship("Item", back_populates="category", lazy="selectin")
 
-    __table_args__ = (
-        Index("ix_categories_slug", "slug"),
-    )
-
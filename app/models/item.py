@@ -4,7 +4,7 @@ from datetime import date
 import uuid
 from decimal import Decimal
 
-from sqlalchemy import CheckConstraint, Date, ForeignKey, Index, Numeric, String, Text
+from sqlalchemy import CheckConstraint, Date, ForeignKey, Numeric, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -25,6 +25,7 @@ class Item(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     available_from: Mapped[date | None] = mapped_column(Date, nullable=True)
     available_until: Mapped[date | None] = mapped_column(Date, nullable=True)
     images: Mapped[dict | None] = mapped_column(JSONB, nullable=True)  # store image metadata/URLs
+    pricing_rules: Mapped[dict | None] = mapped_column(JSONB, nullable=True)  # see schemas.pricing.PricingRules
     avg_rating: Mapped[float | None] = mapped_column(Numeric(3, 2), nullable=True)
     rating_count: Mapped[int] = mapped_column(default=0, nullable=False)
 
@@ -47,7 +48,5 @@ class Item(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     __table_args__ = (
         CheckConstraint("daily_price >= 0", name="ck_items_daily_price_non_negative"),
         CheckConstraint("security_deposit >= 0", name="ck_items_security_deposit_non_negative"),
-        Index("ix_items_owner_id", "owner_id"),
-        Index("ix_items_category_id", "category_id"),
     )
 
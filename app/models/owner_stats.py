@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ItemDailyStats(Base):
+    """Per-item, per-day rollup of bookings and escrow outcomes.
+
+    Maintained by the `stats.refresh_owner_rollups` task; never written by
+    request handlers.
+    """
+
+    __tablename__ = "item_daily_stats"
+
+    item_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("items.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    owner_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    booked_nights: Mapped[int] = mapped_column(default=0, nullable=False)
+    bookings_started: Mapped[int] = mapped_column(default=0, nullable=False)
+    # Booking revenue spread evenly over its nights, hence the extra precision
+    earnings: Mapped[Decimal] = mapped_column(Numeric(14, 4), nullable=False, default=0)
+    damage_fees: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_item_daily_stats_owner_day", "owner_id", "day"),
+    )
+
+
+class RollupWatermark(Base):
+    """High-water mark of source rows already folded into a rollup."""
+
+    __tablename__ = "rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    processed_until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -1,14 +1,52 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Sequence
+from typing import Any, AsyncIterator, Iterable, Sequence
 from uuid import UUID
 
-from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy import Date, Row, Select, and_, cast, column, exists, func, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
+from app.core.exceptions import ConflictError
+from app.db.loaders import loaders_for
 from app.models.booking import Booking
 from app.models.enums import BookingStatus
+from app.models.item import Item
+from app.repositories.versions import collection_version
+
+
+# SQLSTATE raised by Postgres when ex_bookings_item_no_overlap is violated
+EXCLUSION_VIOLATION = "23P01"
+
+# Statuses that occupy an item's dates
+LIVE_BOOKING_STATUSES: tuple[BookingStatus, ...] = (
+    BookingStatus.REQUESTED,
+    BookingStatus.APPROVED,
+    BookingStatus.ACTIVE,
+)
+
+EXPORT_COLUMNS = (
+    Booking.id,
+    Booking.item_id,
+    Booking.renter_id,
+    Booking.start_date,
+    Booking.end_date,
+    Booking.status,
+    Booking.total_price,
+    Booking.notes,
+    Booking.created_at,
+    Booking.updated_at,
+)
+
+
+def _status_values(new_status: BookingStatus) -> dict[str, Any]:
+    values: dict[str, Any] = {"status": new_status}
+    if new_status == BookingStatus.COMPLETED:
+        values["completed_at"] = func.now()
+    return values
 
 
 class BookingRepository:
@@ -16,10 +54,87 @@ class BookingRepository:
         self.session = session
 
     async def get_by_id(self, booking_id: UUID) -> Booking | None:
-        stmt = select(Booking).where(Booking.id == booking_id)
+        return await loaders_for(self.session).of(Booking).load(booking_id)
+
+    async def get_status_row(self, booking_id: UUID) -> Row | None:
+        """Return `(status, item_id, renter_id, owner_id)` without loading relationships."""
+
+        stmt = select(Booking.status, Booking.item_id, Booking.renter_id, Booking.owner_id).where(
+            Booking.id == booking_id
+        )
+        res = await self.session.execute(stmt)
+        return res.one_or_none()
+
+    async def transition_status(
+        self,
+        *,
+        booking_id: UUID,
+        new_status: BookingStatus,
+        allowed_from: Iterable[BookingStatus],
+        participant_id: UUID | None = None,
+    ) -> Booking | None:
+        """Move a booking to `new_status` only if it is currently in `allowed_from`.
+
+        Runs as a single conditional `UPDATE ... RETURNING`. When
+        `participant_id` is given the booking must also belong to that user as
+        renter or owner. Returns None when no row matched.
+        """
+
+        conditions = [Booking.id == booking_id, Booking.status.in_(list(allowed_from))]
+        if participant_id is not None:
+            conditions.append(or_(Booking.renter_id == participant_id, Booking.owner_id == participant_id))
+        stmt = (
+            update(Booking)
+            .where(*conditions)
+            .values(**_status_values(new_status))
+            .returning(Booking)
+            .options(lazyload("*"))
+            .execution_options(populate_existing=True)
+        )
         res = await self.session.execute(stmt)
         return res.scalar_one_or_none()
 
+    async def transition_status_many(
+        self,
+        *,
+        booking_ids: Sequence[UUID],
+        new_status: BookingStatus,
+        allowed_from: Iterable[BookingStatus],
+        owner_id: UUID | None = None,
+    ) -> Sequence[Row]:
+        """Set-based variant of `transition_status` restricted to one owner's bookings.
+
+        Returns `(id, item_id, start_date, end_date)` of the rows that moved.
+        """
+
+        conditions = [Booking.id.in_(list(booking_ids)), Booking.status.in_(list(allowed_from))]
+        if owner_id is not None:
+            conditions.append(Booking.owner_id == owner_id)
+        stmt = (
+            update(Booking)
+            .where(*conditions)
+            .values(**_status_values(new_status))
+            .returning(Booking.id, Booking.item_id, Booking.start_date, Booking.end_date)
+            .execution_options(synchronize_session=False)
+        )
+        res = await self.session.execute(stmt)
+        return res.all()
+
+    async def list_status_rows(self, booking_ids: Sequence[UUID]) -> Sequence[Row]:
+        """Return `(id, status, renter_id, owner_id)` for the given bookings."""
+
+        stmt = select(Booking.id, Booking.status, Booking.renter_id, Booking.owner_id).where(
+            Booking.id.in_(list(booking_ids))
+        )
+        res = await self.session.execute(stmt)
+        return res.all()
+
+    async def list_version_for_renter(self, renter_id: UUID) -> Row:
+        return await collection_version(self.session, Booking, Booking.renter_id == renter_id)
+
+    async def list_version_for_owner(self, owner_id: UUID) -> Row:
+        return await collection_version(self.session, Booking, Booking.owner_id == owner_id)
+
     async def list_for_renter(
         self,
         renter_id: UUID,
@@ -50,6 +165,42 @@ class BookingRepository:
         res = await self.session.execute(stmt)
         return total, res.scalars().all()
 
+    async def list_upcoming_for_owner(self, owner_id: UUID, *, from_date: date, limit: int) -> Sequence[Row]:
+        """Return the owner's next live bookings starting on or after `from_date`."""
+
+        stmt = (
+            select(
+                Booking.id,
+                Booking.item_id,
+                Booking.start_date,
+                Booking.end_date,
+                Booking.status,
+                Booking.total_price,
+            )
+            .where(
+                Booking.owner_id == owner_id,
+                Booking.start_date >= from_date,
+                Booking.status.in_(LIVE_BOOKING_STATUSES),
+            )
+            .order_by(Booking.start_date, Booking.id)
+            .limit(limit)
+        )
+        res = await self.session.execute(stmt)
+        return res.all()
+
+    async def stream_for_owner(self, owner_id: UUID, *, chunk_size: int) -> AsyncIterator[Row]:
+        """Yield the owner's bookings as `EXPORT_COLUMNS` rows from a server-side cursor."""
+
+        stmt = (
+            select(*EXPORT_COLUMNS)
+            .where(Booking.owner_id == owner_id)
+            .order_by(Booking.created_at, Booking.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self.session.stream(stmt)
+        async for row in result:
+            yield row
+
     async def has_overlapping_booking(
         self,
         *,
@@ -59,15 +210,10 @@ class BookingRepository:
     ) -> bool:
         """Return True if there is any non-cancelled/non-completed booking overlapping the given range."""
 
-        active_statuses: list[BookingStatus] = [
-            BookingStatus.REQUESTED,
-            BookingStatus.APPROVED,
-            BookingStatus.ACTIVE,
-        ]
         stmt = select(func.count()).select_from(Booking).where(
             and_(
                 Booking.item_id == item_id,
-                Booking.status.in_(active_statuses),
+                Booking.status.in_(LIVE_BOOKING_STATUSES),
                 # overlapping ranges: (start <= existing_end) and (end >= existing_start)
                 Booking.start_date <= end_date,
                 Booking.end_date >= start_date,
@@ -77,6 +223,74 @@ class BookingRepository:
         count = int(res.scalar_one() or 0)
         return count > 0
 
+    async def list_live_ranges(
+        self,
+        *,
+        item_id: UUID,
+        start_date: date,
+        end_date: date,
+    ) -> Sequence[Row]:
+        """Return `(start_date, end_date)` of live bookings of an item overlapping the window."""
+
+        stmt = select(Booking.start_date, Booking.end_date).where(
+            Booking.item_id == item_id,
+            Booking.status.in_(LIVE_BOOKING_STATUSES),
+            Booking.start_date <= end_date,
+            Booking.end_date >= start_date,
+        )
+        res = await self.session.execute(stmt)
+        return res.all()
+
+    async def check_availability_batch(
+        self,
+        queries: Sequence[tuple[UUID, date, date]],
+    ) -> Sequence[Row]:
+        """Check many `(item_id, start_date, end_date)` ranges in one round trip.
+
+        The ranges are unnested into a derived table and joined against items
+        (activity and availability window) and bookings (overlap). Rows come
+        back in input order with columns `found`, `is_active`, `in_window`
+        and `booked`.
+        """
+
+        q = (
+            func.unnest(
+                cast([item_id for item_id, _, _ in queries], ARRAY(PGUUID(as_uuid=True))),
+                cast([start for _, start, _ in queries], ARRAY(Date)),
+                cast([end for _, _, end in queries], ARRAY(Date)),
+            )
+            .table_valued(
+                column("item_id", PGUUID(as_uuid=True)),
+                column("start_date", Date),
+                column("end_date", Date),
+                with_ordinality="idx",
+            )
+            .render_derived(name="q")
+        )
+        booked = exists().where(
+            Booking.item_id == q.c.item_id,
+            Booking.status.in_(LIVE_BOOKING_STATUSES),
+            Booking.start_date <= q.c.end_date,
+            Booking.end_date >= q.c.start_date,
+        )
+        stmt = (
+            select(
+                q.c.idx,
+                Item.id.is_not(None).label("found"),
+                Item.is_active,
+                and_(
+                    func.coalesce(Item.available_from <= q.c.start_date, True),
+                    func.coalesce(Item.available_until >= q.c.end_date, True),
+                ).label("in_window"),
+                booked.label("booked"),
+            )
+            .select_from(q)
+            .outerjoin(Item, Item.id == q.c.item_id)
+            .order_by(q.c.idx)
+        )
+        res = await self.session.execute(stmt)
+        return res.all()
+
     async def create(
         self,
         *,
@@ -88,17 +302,25 @@ class BookingRepository:
         total_price,
         notes: str | None,
     ) -> Booking:
-        booking = Booking(
-            item_id=item_id,
-            renter_id=renter_id,
-            owner_id=owner_id,
-            start_date=start_date,
-            end_date=end_date,
-            total_price=total_price,
-            notes=notes,
+        stmt = (
+            insert(Booking)
+            .values(
+                item_id=item_id,
+                renter_id=renter_id,
+                owner_id=owner_id,
+                start_date=start_date,
+                end_date=end_date,
+                total_price=total_price,
+                notes=notes,
+            )
+            .returning(Booking)
+            # Server defaults come back in the same statement; skip relationship loads
+            .options(lazyload("*"))
         )
-        self.session.add(booking)
-        await self.session.flush()
-        await self.session.refresh(booking)
-        return booking
-
+        try:
+            res = await self.session.execute(stmt)
+        except IntegrityError as exc:
+            if getattr(exc.orig, "sqlstate", None) == EXCLUSION_VIOLATION:
+                raise ConflictError("Item is already booked for the selected dates") from exc
+            raise
+        return res.scalar_one()
@@ -3,9 +3,11 @@ from __future__ import annotations
 from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
+from app.db.loaders import loaders_for
 from app.models.category import Category
 
 
@@ -14,9 +16,7 @@ class CategoryRepository:
         self.session = session
 
     async def get_by_id(self, category_id: UUID) -> Category | None:
-        stmt = select(Category).where(Category.id == category_id)
-        res = await self.session.execute(stmt)
-        return res.scalar_one_or_none()
+        return await loaders_for(self.session).of(Category).load(category_id)
 
     async def get_by_slug(self, slug: str) -> Category | None:
         stmt = select(Category).where(Category.slug == slug)
@@ -29,9 +29,12 @@ class CategoryRepository:
         return res.scalars().all()
 
     async def create(self, name: str, slug: str, description: str | None) -> Category:
-        category = Category(name=name, slug=slug, description=description)
-        self.session.add(category)
-        await self.session.flush()
-        await self.session.refresh(category)
-        return category
+        stmt = (
+            insert(Category)
+            .values(name=name, slug=slug, description=description)
+            .returning(Category)
+            .options(lazyload("*"))
+        )
+        res = await self.session.execute(stmt)
+        return res.scalar_one()
 
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+from datetime import datetime
 from decimal import Decimal
+from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
+from app.core.exceptions import ConflictError
+from app.models.booking import Booking
 from app.models.escrow import EscrowRecord
-from app.models.enums import EscrowStatus
+from app.models.enums import BookingStatus, EscrowStatus
+
+
+# Escrows that can still be settled, cancelled or released
+OPEN_ESCROW_STATUSES = (EscrowStatus.PENDING, EscrowStatus.HELD)
 
 
 class EscrowRepository:
@@ -27,38 +36,101 @@ class EscrowRepository:
         owner_id: UUID,
         item_id: UUID,
         amount_held: Decimal,
+        status: EscrowStatus = EscrowStatus.PENDING,
     ) -> EscrowRecord:
-        escrow = EscrowRecord(
-            booking_id=booking_id,
-            renter_id=renter_id,
-            owner_id=owner_id,
-            item_id=item_id,
-            amount_held=amount_held,
-            status=EscrowStatus.PENDING,
+        stmt = (
+            insert(EscrowRecord)
+            .values(
+                booking_id=booking_id,
+                renter_id=renter_id,
+                owner_id=owner_id,
+                item_id=item_id,
+                amount_held=amount_held,
+                status=status,
+            )
+            .returning(EscrowRecord)
+            .options(lazyload("*"))
         )
-        self.session.add(escrow)
-        await self.session.flush()
-        await self.session.refresh(escrow)
-        return escrow
+        res = await self.session.execute(stmt)
+        return res.scalar_one()
 
-    async def mark_held(self, escrow: EscrowRecord) -> EscrowRecord:
-        escrow.status = EscrowStatus.HELD
-        await self.session.flush()
-        await self.session.refresh(escrow)
-        return escrow
+    async def _finalize(self, escrow: EscrowRecord, **values) -> EscrowRecord:
+        """Apply a final state to an escrow that is still PENDING or HELD.
+
+        The status check is part of the UPDATE, so it cannot race the
+        release batch or another settle/cancel; the loser gets ConflictError.
+        """
+
+        stmt = (
+            update(EscrowRecord)
+            .where(EscrowRecord.id == escrow.id, EscrowRecord.status.in_(OPEN_ESCROW_STATUSES))
+            .values(**values)
+            .returning(EscrowRecord)
+            .options(lazyload("*"))
+            .execution_options(populate_existing=True)
+        )
+        res = await self.session.execute(stmt)
+        finalized = res.scalar_one_or_none()
+        if finalized is None:
+            raise ConflictError("Escrow already finalized")
+        return finalized
 
     async def cancel(self, escrow: EscrowRecord) -> EscrowRecord:
-        escrow.status = EscrowStatus.CANCELLED
-        escrow.amount_released = escrow.amount_held
-        await self.session.flush()
-        await self.session.refresh(escrow)
-        return escrow
+        return await self._finalize(
+            escrow,
+            status=EscrowStatus.CANCELLED,
+            amount_released=EscrowRecord.amount_held,
+        )
 
     async def settle(self, escrow: EscrowRecord, damage_fee: Decimal) -> EscrowRecord:
-        escrow.damage_fee = damage_fee
-        escrow.amount_released = escrow.amount_held - damage_fee
-        escrow.status = EscrowStatus.RELEASED
-        await self.session.flush()
-        await self.session.refresh(escrow)
-        return escrow
+        return await self._finalize(
+            escrow,
+            damage_fee=damage_fee,
+            amount_released=EscrowRecord.amount_held - damage_fee,
+            status=EscrowStatus.RELEASED,
+        )
 
+    async def release_due_batch(
+        self,
+        *,
+        completed_before: datetime,
+        batch_size: int,
+        booking_ids: Sequence[UUID] | None = None,
+    ) -> Sequence[Row]:
+        """Release up to `batch_size` HELD escrows whose booking completed before the cutoff.
+
+        A single `UPDATE ... RETURNING` does the work. Rows are claimed with
+        `FOR UPDATE SKIP LOCKED` and re-checked for HELD status, so concurrent or
+        repeated runs never release the same escrow twice.
+        """
+
+        due = (
+            select(EscrowRecord.id)
+            .join(Booking, Booking.id == EscrowRecord.booking_id)
+            .where(
+                EscrowRecord.status == EscrowStatus.HELD,
+                Booking.status == BookingStatus.COMPLETED,
+                Booking.completed_at <= completed_before,
+            )
+            .order_by(EscrowRecord.id)
+            .limit(batch_size)
+            .with_for_update(of=EscrowRecord, skip_locked=True)
+        )
+        if booking_ids is not None:
+            due = due.where(EscrowRecord.booking_id.in_(list(booking_ids)))
+
+        stmt = (
+            update(EscrowRecord)
+            .where(
+                EscrowRecord.id.in_(due.scalar_subquery()),
+                EscrowRecord.status == EscrowStatus.HELD,
+            )
+            .values(
+                status=EscrowStatus.RELEASED,
+                amount_released=EscrowRecord.amount_held - EscrowRecord.damage_fee,
+            )
+            .returning(EscrowRecord.id, EscrowRecord.booking_id, EscrowRecord.amount_released)
+            .execution_options(synchronize_session=False)
+        )
+        res = await self.session.execute(stmt)
+        return res.all()
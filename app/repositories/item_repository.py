@@ -1,12 +1,41 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Any, AsyncIterator, Iterable, Sequence
 from uuid import UUID
 
-from sqlalchemy import Select, and_, func, select
+from sqlalchemy import Numeric, Row, RowMapping, Select, and_, cast, exists, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload, selectinload
 
+from app.db.loaders import loaders_for
+from app.models.category import Category
 from app.models.item import Item
+from app.models.review import Review
+from app.models.user import User
+from app.repositories.versions import collection_version
+
+
+# Only the category is needed for ItemRead; used for writes via RETURNING and batch reads
+_ITEM_READ_OPTIONS = (lazyload("*"), selectinload(Item.category).lazyload("*"))
+
+# Columns behind CategoryRead, selected when a sparse item list asks for `category`
+_CATEGORY_READ_FIELDS = ("id", "name", "slug", "description")
+
+EXPORT_COLUMNS = (
+    Item.id,
+    Item.title,
+    Item.category_id,
+    Item.daily_price,
+    Item.security_deposit,
+    Item.location_text,
+    Item.is_active,
+    Item.available_from,
+    Item.available_until,
+    Item.avg_rating,
+    Item.rating_count,
+    Item.created_at,
+    Item.updated_at,
+)
 
 
 class ItemRepository:
@@ -14,19 +43,87 @@ class ItemRepository:
         self.session = session
 
     async def get_by_id(self, item_id: UUID) -> Item | None:
-        stmt = select(Item).where(Item.id == item_id)
+        return await loaders_for(self.session).of(Item).load(item_id)
+
+    async def list_by_ids(self, ids: Sequence[UUID]) -> Sequence[Item]:
+        stmt = select(Item).where(Item.id.in_(list(ids))).options(*_ITEM_READ_OPTIONS)
         res = await self.session.execute(stmt)
-        return res.scalar_one_or_none()
+        return res.scalars().all()
 
-    async def list_items(
+    async def list_version(
         self,
         *,
         owner_id: UUID | None = None,
         category_id: UUID | None = None,
         is_active: bool | None = True,
-        skip: int = 0,
-        limit: int = 20,
-    ) -> tuple[int, Sequence[Item]]:
+    ) -> Row:
+        return await collection_version(self.session, Item, *self._list_conditions(owner_id, category_id, is_active))
+
+    async def get_availability_window(self, item_id: UUID) -> Row | None:
+        """Return `(is_active, available_from, available_until)` without loading the entity."""
+
+        stmt = select(Item.is_active, Item.available_from, Item.available_until).where(Item.id == item_id)
+        res = await self.session.execute(stmt)
+        return res.one_or_none()
+
+    async def get_booking_row(self, item_id: UUID) -> Row | None:
+        """Return the columns booking creation checks and prices, without loading the entity.
+
+        A loaded Item would pull in its bookings and owner through the
+        selectin relationships, which grows with every booking of the item.
+        """
+
+        stmt = select(
+            Item.id,
+            Item.owner_id,
+            Item.is_active,
+            Item.available_from,
+            Item.available_until,
+            Item.security_deposit,
+            Item.updated_at,
+            Item.daily_price,
+            Item.pricing_rules,
+        ).where(Item.id == item_id)
+        res = await self.session.execute(stmt)
+        return res.one_or_none()
+
+    async def get_owner_trust(self, item_id: UUID) -> Row | None:
+        """Return the owner's `(id, full_name, avg_rating, rating_count, trust_score)` joined on the item."""
+
+        stmt = (
+            select(User.id, User.full_name, User.avg_rating, User.rating_count, User.trust_score)
+            .join(Item, Item.owner_id == User.id)
+            .where(Item.id == item_id)
+        )
+        res = await self.session.execute(stmt)
+        return res.one_or_none()
+
+    async def get_pricing_row(self, item_id: UUID) -> Row | None:
+        """Return the columns the pricing engine needs without loading the entity."""
+
+        stmt = select(Item.id, Item.updated_at, Item.daily_price, Item.pricing_rules).where(Item.id == item_id)
+        res = await self.session.execute(stmt)
+        return res.one_or_none()
+
+    async def stream_for_owner(self, owner_id: UUID, *, chunk_size: int) -> AsyncIterator[Row]:
+        """Yield the owner's items as `EXPORT_COLUMNS` rows from a server-side cursor."""
+
+        stmt = (
+            select(*EXPORT_COLUMNS)
+            .where(Item.owner_id == owner_id)
+            .order_by(Item.created_at, Item.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self.session.stream(stmt)
+        async for row in result:
+            yield row
+
+    @staticmethod
+    def _list_conditions(
+        owner_id: UUID | None,
+        category_id: UUID | None,
+        is_active: bool | None,
+    ) -> list[Any]:
         conditions = []
         if owner_id is not None:
             conditions.append(Item.owner_id == owner_id)
@@ -34,21 +131,71 @@ class ItemRepository:
             conditions.append(Item.category_id == category_id)
         if is_active is not None:
             conditions.append(Item.is_active == is_active)
+        return conditions
 
-        base_stmt: Select[tuple[Item]] = select(Item)
+    async def _count(self, conditions: list[Any]) -> int:
+        count_stmt = select(func.count(Item.id))
         if conditions:
-            base_stmt = base_stmt.where(and_(*conditions))
-
-        # Count
-        count_stmt = select(func.count()).select_from(base_stmt.subquery())
+            count_stmt = count_stmt.where(and_(*conditions))
         total_res = await self.session.execute(count_stmt)
-        total = int(total_res.scalar_one() or 0)
+        return int(total_res.scalar_one() or 0)
 
-        # Page
-        stmt = base_stmt.order_by(Item.created_at.desc()).offset(skip).limit(limit)
-        res = await self.session.execute(stmt)
-        items = res.scalars().all()
-        return total, items
+    @staticmethod
+    def _projection(fields: Iterable[str]) -> tuple[Select, list[str]]:
+        # Sorted so each field set compiles to one cached statement
+        names = sorted(set(fields))
+        stmt = select(*(getattr(Item, name) for name in names if name != "category"))
+        if "category" in names:
+            stmt = stmt.add_columns(
+                *(getattr(Category, name).label(f"category__{name}") for name in _CATEGORY_READ_FIELDS)
+            ).outerjoin(Category, Category.id == Item.category_id)
+        return stmt, names
+
+    @staticmethod
+    def _projected_row(mapping: RowMapping, names: list[str]) -> dict[str, Any]:
+        row = {name: mapping[name] for name in names if name != "category"}
+        if "category" in names:
+            row["category"] = (
+                {name: mapping[f"category__{name}"] for name in _CATEGORY_READ_FIELDS}
+                if mapping["category__id"] is not None
+                else None
+            )
+        return row
+
+    async def get_item_row(self, item_id: UUID, fields: Iterable[str]) -> dict[str, Any] | None:
+        """One item as a dict of the `ItemRead` fields in `fields`, without loading the entity."""
+
+        stmt, names = self._projection(fields)
+        res = await self.session.execute(stmt.where(Item.id == item_id))
+        mapping = res.mappings().one_or_none()
+        return self._projected_row(mapping, names) if mapping is not None else None
+
+    async def list_item_rows(
+        self,
+        fields: Iterable[str],
+        *,
+        owner_id: UUID | None = None,
+        category_id: UUID | None = None,
+        is_active: bool | None = True,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> tuple[int, list[dict[str, Any]]]:
+        """Page of items selecting only the columns behind `fields`.
+
+        `fields` are `ItemRead` field names. Rows are plain dicts rather than
+        entities, so nothing enters the identity map. Categories are joined
+        only when `category` is requested; it comes back as a nested dict or None.
+        """
+
+        stmt, names = self._projection(fields)
+        conditions = self._list_conditions(owner_id, category_id, is_active)
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+
+        total = await self._count(conditions)
+
+        res = await self.session.execute(stmt.order_by(Item.created_at.desc()).offset(skip).limit(limit))
+        return total, [self._projected_row(mapping, names) for mapping in res.mappings()]
 
     async def create_item(
         self,
@@ -64,25 +211,103 @@ class ItemRepository:
         available_from,
         available_until,
         category_id: UUID | None,
+        pricing_rules: dict | None = None,
     ) -> Item:
-        item = Item(
-            owner_id=owner_id,
-            title=title,
-            description=description,
-            daily_price=daily_price,
-            security_deposit=security_deposit,
-            location_lat=location_lat,
-            location_lng=location_lng,
-            location_text=location_text,
-            available_from=available_from,
-            available_until=available_until,
-            category_id=category_id,
+        stmt = (
+            insert(Item)
+            .values(
+                owner_id=owner_id,
+                title=title,
+                description=description,
+                daily_price=daily_price,
+                security_deposit=security_deposit,
+                location_lat=location_lat,
+                location_lng=location_lng,
+                location_text=location_text,
+                available_from=available_from,
+                available_until=available_until,
+                category_id=category_id,
+                pricing_rules=pricing_rules,
+            )
+            .returning(Item)
+            .options(*_ITEM_READ_OPTIONS)
+        )
+        res = await self.session.execute(stmt)
+        return res.scalar_one()
+
+    async def update_item(self, item_id: UUID, values: dict[str, Any]) -> Item | None:
+        stmt = (
+            update(Item)
+            .where(Item.id == item_id)
+            .values(**values)
+            .returning(Item)
+            .options(*_ITEM_READ_OPTIONS)
+            .execution_options(populate_existing=True)
+        )
+        res = await self.session.execute(stmt)
+        return res.scalar_one_or_none()
+
+    async def add_rating(self, item_id: UUID, rating: int) -> int | None:
+        """Fold one new rating into the item's aggregates in a single UPDATE.
+
+        Returns the new `rating_count`. The UPDATE holds the item's row lock
+        until commit, so concurrent reviews of one item get consecutive
+        counts in commit order.
+        """
+
+        new_count = Item.rating_count + 1
+        stmt = (
+            update(Item)
+            .where(Item.id == item_id)
+            .values(
+                rating_count=new_count,
+                avg_rating=func.round(
+                    (func.coalesce(Item.avg_rating, 0) * Item.rating_count + cast(rating, Numeric)) / new_count,
+                    2,
+                ),
+            )
+            .returning(Item.rating_count)
+            .execution_options(synchronize_session=False)
+        )
+        res = await self.session.execute(stmt)
+        return res.scalar_one_or_none()
+
+    async def reconcile_ratings(self) -> int:
+        """Recompute rating aggregates from reviews where they drifted; returns rows fixed."""
+
+        totals = (
+            select(
+                Review.item_id,
+                func.round(func.avg(Review.rating), 2).label("avg_rating"),
+                func.count().label("rating_count"),
+            )
+            .group_by(Review.item_id)
+            .subquery("totals")
+        )
+        fixed = await self.session.execute(
+            update(Item)
+            .where(
+                Item.id == totals.c.item_id,
+                or_(
+                    Item.rating_count != totals.c.rating_count,
+                    Item.avg_rating.is_distinct_from(totals.c.avg_rating),
+                ),
+            )
+            .values(avg_rating=totals.c.avg_rating, rating_count=totals.c.rating_count)
+            .execution_options(synchronize_session=False)
+        )
+        emptied = await self.session.execute(
+            update(Item)
+            .where(
+                or_(Item.rating_count != 0, Item.avg_rating.is_not(None)),
+                ~exists().where(Review.item_id == Item.id),
+            )
+            .values(avg_rating=None, rating_count=0)
+            .execution_options(synchronize_session=False)
         )
-        self.session.add(item)
-        await self.session.flush()
-        await self.session.refresh(item)
-        return item
+        return fixed.rowcount + emptied.rowcount
 
     async def delete(self, item: Item) -> None:
         await self.session.delete(item)
+        loaders_for(self.session).of(Item).clear(item.id)
 
@@ -3,8 +3,9 @@ from __future__ import annotations
 from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy import Select, and_, func, insert, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from app.models.message import Message
 
@@ -21,16 +22,19 @@ class MessageRepository:
         content: str,
         conversation_id: str | None,
     ) -> Message:
-        message = Message(
-            sender_id=sender_id,
-            receiver_id=receiver_id,
-            content=content,
-            conversation_id=conversation_id,
+        stmt = (
+            insert(Message)
+            .values(
+                sender_id=sender_id,
+                receiver_id=receiver_id,
+                content=content,
+                conversation_id=conversation_id,
+            )
+            .returning(Message)
+            .options(lazyload("*"))
         )
-        self.session.add(message)
-        await self.session.flush()
-        await self.session.refresh(message)
-        return message
+        res = await self.session.execute(stmt)
+        return res.scalar_one()
 
     async def list_conversation(
         self,
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Sequence
+from uuid import UUID
+
+from sqlalchemy import Date, Integer, Row, and_, cast, column, delete, func, select, true, union_all
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.booking import Booking
+from app.models.enums import BookingStatus, EscrowStatus
+from app.models.escrow import EscrowRecord
+from app.models.item import Item
+from app.models.owner_stats import ItemDailyStats, RollupWatermark
+
+
+# Bookings that count towards occupancy and earnings
+EARNING_BOOKING_STATUSES = (BookingStatus.APPROVED, BookingStatus.ACTIVE, BookingStatus.COMPLETED)
+
+
+class OwnerStatsRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def try_lock(self, key: int) -> bool:
+        """Take a transaction-scoped advisory lock without waiting."""
+
+        res = await self.session.execute(select(func.pg_try_advisory_xact_lock(key)))
+        return bool(res.scalar_one())
+
+    async def get_watermark(self, name: str) -> datetime | None:
+        stmt = select(RollupWatermark.processed_until).where(RollupWatermark.name == name)
+        res = await self.session.execute(stmt)
+        return res.scalar_one_or_none()
+
+    async def set_watermark(self, name: str, processed_until: datetime) -> None:
+        stmt = insert(RollupWatermark).values(name=name, processed_until=processed_until)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RollupWatermark.name],
+            set_={"processed_until": stmt.excluded.processed_until},
+        )
+        await self.session.execute(stmt)
+
+    async def list_changed_windows(self, *, since: datetime | None, until: datetime) -> Sequence[Row]:
+        """Return `(item_id, start_date, end_date)` per item touched by booking or escrow changes.
+
+        The window spans every booking of that item changed in `(since, until]`.
+        """
+
+        def changed(updated_at):
+            return updated_at <= until if since is None else and_(updated_at > since, updated_at <= until)
+
+        touched = union_all(
+            select(Booking.item_id, Booking.start_date, Booking.end_date).where(changed(Booking.updated_at)),
+            select(Booking.item_id, Booking.start_date, Booking.end_date)
+            .join(EscrowRecord, EscrowRecord.booking_id == Booking.id)
+            .where(changed(EscrowRecord.updated_at)),
+        ).subquery("touched")
+        stmt = select(
+            touched.c.item_id,
+            func.min(touched.c.start_date).label("start_date"),
+            func.max(touched.c.end_date).label("end_date"),
+        ).group_by(touched.c.item_id)
+        res = await self.session.execute(stmt)
+        return res.all()
+
+    async def rebuild_windows(self, windows: Sequence[tuple[UUID, date, date]]) -> None:
+        """Recompute the daily rows of each `(item_id, start_date, end_date)` window from source tables."""
+
+        w = (
+            func.unnest(
+                cast([item_id for item_id, _, _ in windows], ARRAY(PGUUID(as_uuid=True))),
+                cast([start for _, start, _ in windows], ARRAY(Date)),
+                cast([end for _, _, end in windows], ARRAY(Date)),
+            )
+            .table_valued(
+                column("item_id", PGUUID(as_uuid=True)),
+                column("start_date", Date),
+                column("end_date", Date),
+            )
+            .render_derived(name="w")
+        )
+
+        await self.session.execute(
+            delete(ItemDailyStats).where(
+                ItemDailyStats.item_id == w.c.item_id,
+                ItemDailyStats.day.between(w.c.start_date, w.c.end_date),
+            )
+        )
+
+        # One row per charged night; same-day rentals are charged as one night
+        nights = func.greatest(Booking.end_date - Booking.start_date, 1)
+        night = func.generate_series(0, nights - 1).table_valued(column("n", Integer)).lateral("night")
+        day = Booking.start_date + night.c.n
+        booked = (
+            select(
+                Booking.item_id,
+                day.label("day"),
+                Booking.owner_id,
+                func.count().label("booked_nights"),
+                func.count().filter(night.c.n == 0).label("bookings_started"),
+                func.sum(Booking.total_price / nights).label("earnings"),
+            )
+            .select_from(w)
+            .join(Booking, Booking.item_id == w.c.item_id)
+            .join(night, true())
+            .where(
+                Booking.status.in_(EARNING_BOOKING_STATUSES),
+                day.between(w.c.start_date, w.c.end_date),
+            )
+            .group_by(Booking.item_id, day, Booking.owner_id)
+        )
+        await self.session.execute(
+            insert(ItemDailyStats).from_select(
+                ["item_id", "day", "owner_id", "booked_nights", "bookings_started", "earnings"],
+                booked,
+            )
+        )
+
+        # Damage fees are booked on the day the rental ends
+        fees = (
+            select(
+                Booking.item_id,
+                Booking.end_date,
+                Booking.owner_id,
+                func.sum(EscrowRecord.damage_fee),
+            )
+            .select_from(w)
+            .join(Booking, Booking.item_id == w.c.item_id)
+            .join(EscrowRecord, EscrowRecord.booking_id == Booking.id)
+            .where(
+                EscrowRecord.status == EscrowStatus.RELEASED,
+                EscrowRecord.damage_fee > 0,
+                Booking.end_date.between(w.c.start_date, w.c.end_date),
+            )
+            .group_by(Booking.item_id, Booking.end_date, Booking.owner_id)
+        )
+        stmt = insert(ItemDailyStats).from_select(["item_id", "day", "owner_id", "damage_fees"], fees)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ItemDailyStats.item_id, ItemDailyStats.day],
+            set_={"damage_fees": stmt.excluded.damage_fees},
+        )
+        await self.session.execute(stmt)
+
+    async def summarize_items(self, *, owner_id: UUID, start_date: date, end_date: date) -> Sequence[Row]:
+        """Per-item totals over `[start_date, end_date]` for every item of the owner."""
+
+        stmt = (
+            select(
+                Item.id.label("item_id"),
+                Item.title,
+                func.coalesce(func.sum(ItemDailyStats.booked_nights), 0).label("booked_nights"),
+                func.coalesce(func.sum(ItemDailyStats.bookings_started), 0).label("bookings_started"),
+                func.coalesce(func.sum(ItemDailyStats.earnings), 0).label("earnings"),
+                func.coalesce(func.sum(ItemDailyStats.damage_fees), 0).label("damage_fees"),
+            )
+            .outerjoin(
+                ItemDailyStats,
+                and_(
+                    ItemDailyStats.item_id == Item.id,
+                    ItemDailyStats.day.between(start_date, end_date),
+                ),
+            )
+            .where(Item.owner_id == owner_id)
+            .group_by(Item.id, Item.title)
+            .order_by(Item.title)
+        )
+        res = await self.session.execute(stmt)
+        return res.all()
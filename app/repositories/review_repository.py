@@ -1,12 +1,26 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import AsyncIterator, Sequence
 from uuid import UUID
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import Integer, Row, Select, cast, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
+from app.db.loaders import loaders_for
 from app.models.review import Review
+from app.repositories.versions import collection_version
+
+
+EXPORT_COLUMNS = (
+    Review.id,
+    Review.item_id,
+    Review.booking_id,
+    Review.author_id,
+    Review.rating,
+    Review.comment,
+    Review.created_at,
+)
 
 
 class ReviewRepository:
@@ -14,9 +28,13 @@ class ReviewRepository:
         self.session = session
 
     async def get_by_id(self, review_id: UUID) -> Review | None:
-        stmt = select(Review).where(Review.id == review_id)
-        res = await self.session.execute(stmt)
-        return res.scalar_one_or_none()
+        return await loaders_for(self.session).of(Review).load(review_id)
+
+    async def list_version_for_item(self, item_id: UUID) -> Row:
+        return await collection_version(self.session, Review, Review.item_id == item_id)
+
+    async def list_version_for_user(self, user_id: UUID) -> Row:
+        return await collection_version(self.session, Review, Review.target_user_id == user_id)
 
     async def list_for_item(self, item_id: UUID, skip: int, limit: int) -> tuple[int, Sequence[Review]]:
         base: Select[tuple[Review]] = select(Review).where(Review.item_id == item_id)
@@ -28,6 +46,23 @@ class ReviewRepository:
         res = await self.session.execute(stmt)
         return total, res.scalars().all()
 
+    async def rating_histogram(self, item_id: UUID) -> dict[int, int]:
+        stmt = select(Review.rating, func.count()).where(Review.item_id == item_id).group_by(Review.rating)
+        res = await self.session.execute(stmt)
+        return {rating: count for rating, count in res.all()}
+
+    async def list_latest_for_item(self, item_id: UUID, limit: int) -> Sequence[Row]:
+        """Return `(id, rating, comment, author_id, created_at)` of the newest reviews of an item."""
+
+        stmt = (
+            select(Review.id, Review.rating, Review.comment, Review.author_id, Review.created_at)
+            .where(Review.item_id == item_id)
+            .order_by(Review.created_at.desc())
+            .limit(limit)
+        )
+        res = await self.session.execute(stmt)
+        return res.all()
+
     async def list_for_user(self, user_id: UUID, skip: int, limit: int) -> tuple[int, Sequence[Review]]:
         base: Select[tuple[Review]] = select(Review).where(Review.target_user_id == user_id)
         count_stmt = select(func.count()).select_from(base.subquery())
@@ -38,6 +73,45 @@ class ReviewRepository:
         res = await self.session.execute(stmt)
         return total, res.scalars().all()
 
+    async def stream_for_user(self, user_id: UUID, *, chunk_size: int) -> AsyncIterator[Row]:
+        """Yield reviews about a user as `EXPORT_COLUMNS` rows from a server-side cursor."""
+
+        stmt = (
+            select(*EXPORT_COLUMNS)
+            .where(Review.target_user_id == user_id)
+            .order_by(Review.created_at, Review.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self.session.stream(stmt)
+        async for row in result:
+            yield row
+
+    async def stream_rating_buckets(self, *, bucket_days: int, chunk_size: int) -> AsyncIterator[Row]:
+        """Yield `(user_id, bucket, review_count, rating_sum)` per reviewed user and age bucket.
+
+        `bucket` is the review age in whole multiples of `bucket_days`; rows
+        arrive ordered by user so callers can assemble arrays in one pass.
+        """
+
+        bucket = cast(
+            func.floor(func.extract("epoch", func.now() - Review.created_at) / (86400 * bucket_days)),
+            Integer,
+        ).label("bucket")
+        stmt = (
+            select(
+                Review.target_user_id.label("user_id"),
+                bucket,
+                func.count().label("review_count"),
+                func.sum(Review.rating).label("rating_sum"),
+            )
+            .group_by(Review.target_user_id, bucket)
+            .order_by(Review.target_user_id)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self.session.stream(stmt)
+        async for row in result:
+            yield row
+
     async def create(
         self,
         *,
@@ -48,16 +122,19 @@ class ReviewRepository:
         author_id: UUID,
         target_user_id: UUID,
     ) -> Review:
-        review = Review(
-            rating=rating,
-            comment=comment,
-            item_id=item_id,
-            booking_id=booking_id,
-            author_id=author_id,
-            target_user_id=target_user_id,
+        stmt = (
+            insert(Review)
+            .values(
+                rating=rating,
+                comment=comment,
+                item_id=item_id,
+                booking_id=booking_id,
+                author_id=author_id,
+                target_user_id=target_user_id,
+            )
+            .returning(Review)
+            .options(lazyload("*"))
         )
-        self.session.add(review)
-        await self.session.flush()
-        await self.session.refresh(review)
-        return review
+        res = await self.session.execute(stmt)
+        return res.scalar_one()
 
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Numeric, cast, column, exists, func, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
+from app.db.loaders import loaders_for
 from app.models.enums import UserRole
+from app.models.review import Review
 from app.models.user import User
 
 
@@ -17,9 +21,7 @@ class UserRepository:
         self.session = session
 
     async def get_by_id(self, user_id: UUID) -> User | None:
-        stmt = select(User).where(User.id == user_id)
-        res = await self.session.execute(stmt)
-        return res.scalar_one_or_none()
+        return await loaders_for(self.session).of(User).load(user_id)
 
     async def get_by_email(self, email: str) -> User | None:
         stmt = select(User).where(User.email == email)
@@ -34,25 +36,118 @@ class UserRepository:
         full_name: str | None,
         role: UserRole,
     ) -> User:
-        user = User(
-            email=email,
-            hashed_password=hashed_password,
-            full_name=full_name,
-            role=role,
+        stmt = (
+            insert(User)
+            .values(
+                email=email,
+                hashed_password=hashed_password,
+                full_name=full_name,
+                role=role,
+            )
+            .returning(User)
+            .options(lazyload("*"))
         )
-        self.session.add(user)
-        await self.session.flush()
-        await self.session.refresh(user)
-        return user
+        res = await self.session.execute(stmt)
+        return res.scalar_one()
 
-    async def update_last_login(self, user: User) -> None:
-        from datetime import datetime, timezone
+    async def update_last_login(self, user: User) -> User:
+        stmt = (
+            update(User)
+            .where(User.id == user.id)
+            .values(last_login_at=func.now())
+            .returning(User)
+            .options(lazyload("*"))
+            .execution_options(populate_existing=True)
+        )
+        res = await self.session.execute(stmt)
+        return res.scalar_one()
 
-        user.last_login_at = datetime.now(timezone.utc)
-        await self.session.flush()
+    async def update_access(self, user_id: UUID, *, is_active: bool, role: UserRole) -> User | None:
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(is_active=is_active, role=role)
+            .returning(User)
+            .options(lazyload("*"))
+            .execution_options(populate_existing=True)
+        )
+        res = await self.session.execute(stmt)
+        return res.scalar_one_or_none()
 
     async def list_by_ids(self, ids: Iterable[UUID]) -> list[User]:
-        stmt = select(User).where(User.id.in_(list(ids)))
+        stmt = select(User).where(User.id.in_(list(ids))).options(lazyload("*"))
         res = await self.session.execute(stmt)
         return list(res.scalars().all())
 
+    async def add_rating(self, user_id: UUID, rating: int) -> None:
+        """Fold one new received rating into the user's aggregates in a single UPDATE."""
+
+        new_count = User.rating_count + 1
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(
+                rating_count=new_count,
+                avg_rating=func.round(
+                    (func.coalesce(User.avg_rating, 0) * User.rating_count + cast(rating, Numeric)) / new_count,
+                    2,
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
+
+    async def reconcile_ratings(self) -> int:
+        """Recompute rating aggregates from reviews where they drifted; returns rows fixed."""
+
+        totals = (
+            select(
+                Review.target_user_id.label("user_id"),
+                func.round(func.avg(Review.rating), 2).label("avg_rating"),
+                func.count().label("rating_count"),
+            )
+            .group_by(Review.target_user_id)
+            .subquery("totals")
+        )
+        fixed = await self.session.execute(
+            update(User)
+            .where(
+                User.id == totals.c.user_id,
+                or_(
+                    User.rating_count != totals.c.rating_count,
+                    User.avg_rating.is_distinct_from(totals.c.avg_rating),
+                ),
+            )
+            .values(avg_rating=totals.c.avg_rating, rating_count=totals.c.rating_count)
+            .execution_options(synchronize_session=False)
+        )
+        emptied = await self.session.execute(
+            update(User)
+            .where(
+                or_(User.rating_count != 0, User.avg_rating.is_not(None)),
+                ~exists().where(Review.target_user_id == User.id),
+            )
+            .values(avg_rating=None, rating_count=0, trust_score=None)
+            .execution_options(synchronize_session=False)
+        )
+        return fixed.rowcount + emptied.rowcount
+
+    async def bulk_set_trust_scores(self, user_ids: Sequence[UUID], scores: Sequence[float]) -> int:
+        """Write many trust scores in one UPDATE joined to unnested arrays; returns rows changed."""
+
+        v = (
+            func.unnest(
+                cast(list(user_ids), ARRAY(PGUUID(as_uuid=True))),
+                cast(list(scores), ARRAY(Numeric(4, 2))),
+            )
+            .table_valued(column("user_id", PGUUID(as_uuid=True)), column("trust_score", Numeric(4, 2)))
+            .render_derived(name="v")
+        )
+        stmt = (
+            update(User)
+            .where(User.id == v.c.user_id, User.trust_score.is_distinct_from(v.c.trust_score))
+            .values(trust_score=v.c.trust_score)
+            .execution_options(synchronize_session=False)
+        )
+        res = await self.session.execute(stmt)
+        return res.rowcount
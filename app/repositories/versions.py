@@ -0,0 +1,26 @@
+"""Cheap version lookups backing HTTP validators (see core.http_cache)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Row, extract, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def collection_version(session: AsyncSession, model: type[Any], *conditions: Any) -> Row:
+    """Return `(count, last_modified, checksum)` over the rows of `model` matching `conditions`.
+
+    The count catches deletes and `max(updated_at)` catches most writes.
+    The checksum (the exact sum of every `updated_at` epoch) also changes
+    when a long-running transaction commits an update stamped earlier than
+    the current maximum.
+    """
+
+    stmt = select(
+        func.count().label("count"),
+        func.max(model.updated_at).label("last_modified"),
+        func.sum(extract("epoch", model.updated_at)).label("checksum"),
+    ).where(*conditions)
+    res = await session.execute(stmt)
+    return res.one()
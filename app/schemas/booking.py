@@ -9,10 +9,13 @@ from pydantic import BaseModel, Field, field_validator
 from app.models.enums import BookingStatus
 
 
-class BookingBase(BaseModel):
+MAX_AVAILABILITY_BATCH = 100
+MAX_BULK_STATUS_UPDATE = 100
+
+
+class DateRange(BaseModel):
     start_date: date
     end_date: date
-    notes: str | None = None
 
     @field_validator("end_date")
     @classmethod
@@ -23,8 +26,14 @@ class BookingBase(BaseModel):
         return v
 
 
+class BookingBase(DateRange):
+    notes: str | None = None
+
+
 class BookingCreate(BookingBase):
     item_id: UUID
+    # Converts a reservation hold from POST /bookings/holds into the booking
+    hold_id: str | None = None
 
 
 class BookingRead(BaseModel):
@@ -51,3 +60,52 @@ class BookingListResponse(BaseModel):
 class BookingStatusUpdate(BaseModel):
     status: BookingStatus
 
+
+class BookingBulkStatusUpdate(BaseModel):
+    booking_ids: list[UUID] = Field(min_length=1, max_length=MAX_BULK_STATUS_UPDATE)
+    status: BookingStatus
+
+
+class BookingBulkStatusResult(BaseModel):
+    booking_id: UUID
+    ok: bool
+    status: BookingStatus | None = None
+    error: str | None = None
+
+
+class BookingBulkStatusResponse(BaseModel):
+    results: list[BookingBulkStatusResult]
+
+
+class BookingHoldCreate(DateRange):
+    item_id: UUID
+
+
+class BookingHoldRead(BaseModel):
+    id: str
+    item_id: UUID
+    start_date: date
+    end_date: date
+    expires_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class AvailabilityQuery(DateRange):
+    item_id: UUID
+
+
+class AvailabilityBatchRequest(BaseModel):
+    queries: list[AvailabilityQuery] = Field(min_length=1, max_length=MAX_AVAILABILITY_BATCH)
+
+
+class AvailabilityResult(BaseModel):
+    item_id: UUID
+    start_date: date
+    end_date: date
+    available: bool
+    reason: str | None = None
+
+
+class AvailabilityBatchResponse(BaseModel):
+    results: list[AvailabilityResult]
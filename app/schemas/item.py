@@ -2,11 +2,16 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
+from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, create_model
 
 from app.schemas.category import CategoryRead
+from app.schemas.pricing import PricingRules
+from app.schemas.review import ReviewSummaryRead
+from app.schemas.user import UserTrustRead
 
 
 class ItemBase(BaseModel):
@@ -20,6 +25,7 @@ class ItemBase(BaseModel):
     available_from: date | None = None
     available_until: date | None = None
     category_id: UUID | None = None
+    pricing_rules: PricingRules | None = None
 
 
 class ItemCreate(ItemBase):
@@ -38,6 +44,7 @@ class ItemUpdate(BaseModel):
     available_until: date | None = None
     category_id: UUID | None = None
     is_active: bool | None = None
+    pricing_rules: PricingRules | None = None
 
 
 class ItemRead(BaseModel):
@@ -54,6 +61,7 @@ class ItemRead(BaseModel):
     is_active: bool
     available_from: date | None
     available_until: date | None
+    pricing_rules: PricingRules | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -64,3 +72,59 @@ class ItemListResponse(BaseModel):
     total: int
     items: list[ItemRead]
 
+
+ITEM_READ_FIELDS = frozenset(ItemRead.model_fields)
+
+
+@lru_cache(maxsize=128)
+def item_list_partial_model(fields: frozenset[str]) -> type[BaseModel]:
+    """`ItemListResponse` restricted to the given `ItemRead` fields.
+
+    Models are built once per distinct field set; field order follows `ItemRead`.
+    """
+
+    if fields == ITEM_READ_FIELDS:
+        return ItemListResponse
+    item_fields: dict[str, Any] = {
+        name: (info.annotation, info)
+        for name, info in ItemRead.model_fields.items()
+        if name in fields
+    }
+    partial = create_model("ItemReadPartial", __config__={"from_attributes": True}, **item_fields)
+    return create_model("ItemListPartialResponse", total=(int, ...), items=(list[partial], ...))
+
+
+class ItemBatchResponse(BaseModel):
+    items: list[ItemRead]
+    missing: list[UUID]
+
+
+class ItemCalendarRead(BaseModel):
+    item_id: UUID
+    month: str
+    booked: list[date]
+    held: list[date]
+    unavailable: list[date]
+
+
+class ItemAvailabilityWindow(BaseModel):
+    item_id: UUID
+    start_date: date
+    end_date: date
+    booked: list[date]
+    held: list[date]
+    unavailable: list[date]
+
+
+class ItemPageRead(BaseModel):
+    """Everything the item detail page needs in one response.
+
+    Optional parts are null when they failed or timed out; their names are
+    listed in `unavailable_parts`.
+    """
+
+    item: ItemRead
+    owner: UserTrustRead | None = None
+    reviews: ReviewSummaryRead | None = None
+    availability: ItemAvailabilityWindow | None = None
+    unavailable_parts: list[str] = Field(default_factory=list)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.models.enums import BookingStatus
+
+
+class ItemStats(BaseModel):
+    item_id: UUID
+    title: str
+    booked_nights: int
+    bookings_started: int
+    occupancy_rate: float
+    earnings: Decimal
+    damage_fees: Decimal
+
+
+class UpcomingBooking(BaseModel):
+    id: UUID
+    item_id: UUID
+    start_date: date
+    end_date: date
+    status: BookingStatus
+    total_price: Decimal
+
+    model_config = {"from_attributes": True}
+
+
+class OwnerStatsRead(BaseModel):
+    start_date: date
+    end_date: date
+    booked_nights: int
+    bookings_started: int
+    occupancy_rate: float
+    earnings: Decimal
+    damage_fees: Decimal
+    items: list[ItemStats]
+    upcoming: list[UpcomingBooking]
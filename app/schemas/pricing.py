@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.schemas.booking import DateRange
+
+
+MAX_QUOTE_RANGES = 100
+
+
+class SeasonalRate(DateRange):
+    daily_price: Decimal = Field(gt=0)
+
+
+class PricingRules(BaseModel):
+    """Owner-defined pricing on top of an item's daily price."""
+
+    weekend_daily_price: Decimal | None = Field(default=None, gt=0)
+    weekly_discount_percent: Decimal = Field(default=Decimal("0"), ge=0, le=90)
+    monthly_discount_percent: Decimal = Field(default=Decimal("0"), ge=0, le=90)
+    # Later entries win where seasons overlap
+    seasonal_rates: list[SeasonalRate] = Field(default_factory=list, max_length=50)
+
+
+class QuoteRequest(BaseModel):
+    ranges: list[DateRange] = Field(min_length=1, max_length=MAX_QUOTE_RANGES)
+
+
+class Quote(BaseModel):
+    start_date: date
+    end_date: date
+    nights: int
+    subtotal: Decimal
+    discount: Decimal
+    total: Decimal
+
+
+class QuoteResponse(BaseModel):
+    item_id: UUID
+    quotes: list[Quote]
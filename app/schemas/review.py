@@ -34,3 +34,19 @@ class ReviewListResponse(BaseModel):
     total: int
     reviews: list[ReviewRead]
 
+
+class ReviewSnippet(BaseModel):
+    id: UUID
+    rating: int
+    comment: str | None
+    author_id: UUID
+    created_at: datetime
+
+
+class ReviewSummaryRead(BaseModel):
+    item_id: UUID
+    count: int
+    avg_rating: float | None
+    # Number of reviews per star rating, keys 1..5
+    histogram: dict[int, int]
+    latest: list[ReviewSnippet]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from decimal import Decimal
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field
@@ -29,6 +30,35 @@ class UserRead(UserBase):
     model_config = {"from_attributes": True}
 
 
+class UserPublicRead(BaseModel):
+    """What any authenticated user may see about another user."""
+
+    id: UUID
+    full_name: str | None
+    role: UserRole
+    avg_rating: Decimal | None
+    rating_count: int
+    trust_score: Decimal | None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class UserPublicListResponse(BaseModel):
+    users: list[UserPublicRead]
+    missing: list[UUID]
+
+
+class UserTrustRead(BaseModel):
+    id: UUID
+    full_name: str | None
+    avg_rating: Decimal | None
+    rating_count: int
+    trust_score: Decimal | None
+
+    model_config = {"from_attributes": True}
+
+
 class UserInDB(UserRead):
     hashed_password: str
 
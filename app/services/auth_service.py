@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from typing import Iterable
+from uuid import UUID
 
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TieredCache
+from app.core.config import get_settings
 from app.core.security import (
     TokenType,
     create_access_token,
@@ -20,6 +23,20 @@ from app.schemas.user import UserCreate
 from app.services.token_blacklist_service import blacklist_token, is_token_blacklisted
 
 
+settings = get_settings()
+
+PRINCIPAL_PREFIX = "auth:principal:"
+
+# No stale window: a principal is never served past its TTL. Writes that change
+# what it carries go through AuthService and evict it; other workers drop their
+# in-process copy within CACHE_LOCAL_TTL_SECONDS.
+principal_cache = TieredCache("auth.principals", ttl_seconds=settings.principal_cache_ttl_seconds, stale_seconds=0)
+
+
+async def invalidate_principal(redis: Redis, user_id: UUID) -> None:
+    await principal_cache.invalidate(redis, f"{PRINCIPAL_PREFIX}{user_id}")
+
+
 class AuthService:
     """Business logic for authentication and authorization."""
 
@@ -41,7 +58,6 @@ class AuthService:
             role=data.role,
         )
         await self.db.commit()
-        await self.db.refresh(user)
         # Return the ORM user object so callers can produce the appropriate
         # response model (e.g. `UserRead` which expects timestamps).
         return user
@@ -57,14 +73,25 @@ class AuthService:
         if not user.is_active:
             raise PermissionError("User is inactive")
 
-        await self.users.update_last_login(user)
+        user = await self.users.update_last_login(user)
         await self.db.commit()
+        await invalidate_principal(self.redis, user.id)
 
         roles: Iterable[UserRole] = [user.role]
         access = create_access_token(subject=str(user.id), roles=roles)
         refresh = create_refresh_token(subject=str(user.id), roles=roles)
         return AuthenticatedUser.model_validate(user), TokenPair(access_token=access, refresh_token=refresh)
 
+    async def set_user_access(self, user_id: UUID, *, is_active: bool, role: UserRole) -> AuthenticatedUser:
+        """Activate, deactivate or change the role of a user, effective on their next request."""
+
+        user = await self.users.update_access(user_id, is_active=is_active, role=role)
+        if user is None:
+            raise LookupError("User not found")
+        await self.db.commit()
+        await invalidate_principal(self.redis, user_id)
+        return AuthenticatedUser.model_validate(user)
+
     async def refresh_tokens(self, refresh_token: str) -> TokenPair:
         payload = decode_token(refresh_token)
         if payload.get("type") != TokenType.REFRESH:
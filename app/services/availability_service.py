@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import calendar
+import json
+from datetime import date, timedelta
+from typing import Iterable, Iterator
+from uuid import UUID
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.repositories.booking_repository import BookingRepository
+from app.repositories.item_repository import ItemRepository
+from app.schemas.booking import AvailabilityBatchResponse, AvailabilityQuery, AvailabilityResult
+from app.schemas.item import ItemAvailabilityWindow, ItemCalendarRead
+from app.services.hold_service import HoldService
+
+
+CALENDAR_CACHE_PREFIX = "items:calendar:"
+
+
+def _month_bounds(month: str) -> tuple[date, date]:
+    try:
+        year, mon = (int(part) for part in month.split("-"))
+        first = date(year, mon, 1)
+    except ValueError as exc:
+        raise ValueError("month must be in YYYY-MM format") from exc
+    return first, first.replace(day=calendar.monthrange(year, mon)[1])
+
+
+def _months_spanned(start_date: date, end_date: date) -> Iterator[str]:
+    current = start_date.replace(day=1)
+    while current <= end_date:
+        yield f"{current.year:04d}-{current.month:02d}"
+        current = (current + timedelta(days=32)).replace(day=1)
+
+
+def _days(start_date: date, end_date: date) -> Iterator[date]:
+    for offset in range((end_date - start_date).days + 1):
+        yield start_date + timedelta(days=offset)
+
+
+class AvailabilityService:
+    """Read-side availability answers built from bookings, items and holds."""
+
+    def __init__(self, db: AsyncSession, redis: Redis | None = None) -> None:
+        self.db = db
+        self.redis = redis
+        self.bookings = BookingRepository(db)
+        self.items = ItemRepository(db)
+        self._calendar_ttl_seconds = get_settings().item_calendar_cache_ttl_seconds
+        self.holds = (
+            HoldService(redis, ttl_seconds=get_settings().booking_hold_ttl_seconds) if redis is not None else None
+        )
+
+    async def check_batch(self, queries: list[AvailabilityQuery]) -> AvailabilityBatchResponse:
+        rows = await self.bookings.check_availability_batch(
+            [(q.item_id, q.start_date, q.end_date) for q in queries]
+        )
+        holds = {}
+        if self.holds is not None:
+            holds = await self.holds.list_active_many(list(dict.fromkeys(q.item_id for q in queries)))
+
+        results: list[AvailabilityResult] = []
+        for query, row in zip(queries, rows):
+            reason = None
+            if not row.found:
+                reason = "Item not found"
+            elif not row.is_active:
+                reason = "Item is not active"
+            elif not row.in_window:
+                reason = "Outside item availability"
+            elif row.booked:
+                reason = "Item is already booked for the selected dates"
+            elif any(h.overlaps(query.start_date, query.end_date) for h in holds.get(query.item_id, [])):
+                reason = "Item is on hold for the selected dates"
+            results.append(
+                AvailabilityResult(
+                    item_id=query.item_id,
+                    start_date=query.start_date,
+                    end_date=query.end_date,
+                    available=reason is None,
+                    reason=reason,
+                )
+            )
+        return AvailabilityBatchResponse(results=results)
+
+    async def _compute_month(self, item_id: UUID, first: date, last: date) -> dict[str, list[str]]:
+        window = await self.items.get_availability_window(item_id)
+        if window is None:
+            raise LookupError("Item not found")
+
+        booked: set[date] = set()
+        for row in await self.bookings.list_live_ranges(item_id=item_id, start_date=first, end_date=last):
+            booked.update(_days(max(row.start_date, first), min(row.end_date, last)))
+
+        unavailable = [
+            day
+            for day in _days(first, last)
+            if not window.is_active
+            or (window.available_from and day < window.available_from)
+            or (window.available_until and day > window.available_until)
+        ]
+        return {
+            "booked": [day.isoformat() for day in sorted(booked)],
+            "unavailable": [day.isoformat() for day in unavailable],
+        }
+
+    async def get_calendar(self, item_id: UUID, month: str) -> ItemCalendarRead:
+        """Booked, held and unavailable days of one item-month.
+
+        Booked and window-derived days are cached per item-month and dropped by
+        `invalidate_calendar` on booking changes. Holds and past days change
+        on their own clock and are applied per request.
+        """
+
+        first, last = _month_bounds(month)
+        cache_key = f"{CALENDAR_CACHE_PREFIX}{item_id}:{month}"
+        data = None
+        if self.redis is not None:
+            cached = await self.redis.get(cache_key)
+            if cached:
+                data = json.loads(cached)
+        if data is None:
+            data = await self._compute_month(item_id, first, last)
+            if self.redis is not None:
+                await self.redis.set(cache_key, json.dumps(data), ex=self._calendar_ttl_seconds)
+
+        booked = {date.fromisoformat(day) for day in data["booked"]}
+        unavailable = {date.fromisoformat(day) for day in data["unavailable"]}
+        today = date.today()
+        unavailable.update(day for day in _days(first, last) if day < today)
+
+        held: set[date] = set()
+        if self.holds is not None:
+            for hold in await self.holds.list_active(item_id):
+                if hold.overlaps(first, last):
+                    held.update(_days(max(hold.start_date, first), min(hold.end_date, last)))
+        held -= booked | unavailable
+
+        return ItemCalendarRead(
+            item_id=item_id,
+            month=month,
+            booked=sorted(booked),
+            held=sorted(held),
+            unavailable=sorted(unavailable - booked),
+        )
+
+    async def get_window(self, item_id: UUID, start_date: date, days: int) -> ItemAvailabilityWindow:
+        """Calendar of `days` consecutive days, assembled from the cached item-months."""
+
+        end_date = start_date + timedelta(days=days - 1)
+        booked: list[date] = []
+        held: list[date] = []
+        unavailable: list[date] = []
+        for month in _months_spanned(start_date, end_date):
+            calendar = await self.get_calendar(item_id, month)
+            booked += [d for d in calendar.booked if start_date <= d <= end_date]
+            held += [d for d in calendar.held if start_date <= d <= end_date]
+            unavailable += [d for d in calendar.unavailable if start_date <= d <= end_date]
+        return ItemAvailabilityWindow(
+            item_id=item_id,
+            start_date=start_date,
+            end_date=end_date,
+            booked=booked,
+            held=held,
+            unavailable=unavailable,
+        )
+
+    async def invalidate_calendars(self, ranges: Iterable[tuple[UUID, date, date]]) -> None:
+        """Drop cached months of many `(item_id, start_date, end_date)` ranges in one call."""
+
+        if self.redis is None:
+            return
+        keys = {
+            f"{CALENDAR_CACHE_PREFIX}{item_id}:{month}"
+            for item_id, start_date, end_date in ranges
+            for month in _months_spanned(start_date, end_date)
+        }
+        if keys:
+            await self.redis.delete(*keys)
+
+    async def invalidate_calendar(
+        self,
+        item_id: UUID,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> None:
+        """Drop cached calendar months of an item; all of them when no range is given."""
+
+        if self.redis is None:
+            return
+        if start_date is None or end_date is None:
+            async for key in self.redis.scan_iter(f"{CALENDAR_CACHE_PREFIX}{item_id}:*"):
+                await self.redis.delete(key)
+            return
+        keys = [f"{CALENDAR_CACHE_PREFIX}{item_id}:{month}" for month in _months_spanned(start_date, end_date)]
+        await self.redis.delete(*keys)
@@ -1,18 +1,52 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from typing import NoReturn
 from uuid import UUID
 
 from redis.asyncio import Redis
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
+from app.core.exceptions import ConflictError
+from app.core.http_cache import ResourceVersion
+from app.db.session import unit_of_work
 from app.models.enums import BookingStatus, UserRole
-from app.models.item import Item
 from app.repositories.booking_repository import BookingRepository
 from app.repositories.item_repository import ItemRepository
-from app.schemas.booking import BookingCreate, BookingListResponse, BookingRead
+from app.schemas.booking import (
+    BookingBulkStatusResponse,
+    BookingBulkStatusResult,
+    BookingCreate,
+    BookingHoldCreate,
+    BookingHoldRead,
+    BookingListResponse,
+    BookingRead,
+)
+from app.services.availability_service import AvailabilityService
 from app.services.escrow_service import EscrowService
-from app.tasks.booking_tasks import auto_release_deposit, send_booking_created_email, send_booking_start_reminder
+from app.services.hold_service import HoldService
+from app.services.pricing_service import compile_pricing
+from app.tasks.booking_tasks import send_booking_created_email, send_booking_start_reminder
+
+
+# Target status -> statuses a booking may move to it from
+BOOKING_TRANSITIONS: dict[BookingStatus, frozenset[BookingStatus]] = {
+    BookingStatus.APPROVED: frozenset({BookingStatus.REQUESTED}),
+    BookingStatus.ACTIVE: frozenset({BookingStatus.APPROVED}),
+    BookingStatus.COMPLETED: frozenset({BookingStatus.ACTIVE}),
+    BookingStatus.CANCELLED: frozenset({BookingStatus.REQUESTED, BookingStatus.APPROVED}),
+}
+
+# Why a transition out of a given current status was refused
+TRANSITION_ERRORS: dict[BookingStatus, str] = {
+    BookingStatus.REQUESTED: "Requested bookings can only be approved or cancelled",
+    BookingStatus.APPROVED: "Approved bookings can only become active or cancelled",
+    BookingStatus.ACTIVE: "Active bookings can only be completed",
+    BookingStatus.COMPLETED: "Booking is already finalized",
+    BookingStatus.CANCELLED: "Booking is already finalized",
+}
 
 
 class BookingService:
@@ -24,12 +58,17 @@ class BookingService:
         self.bookings = BookingRepository(db)
         self.items = ItemRepository(db)
         self.escrow = EscrowService(db)
+        self.availability = AvailabilityService(db, redis)
+        self.holds = (
+            HoldService(redis, ttl_seconds=get_settings().booking_hold_ttl_seconds) if redis is not None else None
+        )
 
     async def _validate_item_available(
         self,
-        item: Item,
+        item: Row,
         start_date,
         end_date,
+        renter_id: UUID | None = None,
     ) -> None:
         if not item.is_active:
             raise ValueError("Item is not active")
@@ -40,68 +79,71 @@ class BookingService:
         if item.available_until and end_date > item.available_until:
             raise ValueError("End date is after item availability")
 
+        # Holds live in Redis, so check them before touching the bookings table
+        if self.holds is not None and await self.holds.has_conflict(
+            item_id=item.id,
+            start_date=start_date,
+            end_date=end_date,
+            renter_id=renter_id,
+        ):
+            raise ConflictError("Item is on hold for the selected dates")
+
         if await self.bookings.has_overlapping_booking(
             item_id=item.id,
             start_date=start_date,
             end_date=end_date,
         ):
-            raise ValueError("Item is already booked for the selected dates")
+            raise ConflictError("Item is already booked for the selected dates")
 
     async def create_booking(
         self,
         renter_id: UUID,
         payload: BookingCreate,
-        idempotency_key: str | None = None,
     ) -> BookingRead:
-        # Idempotency: if key is provided and we have a stored booking, return it
-        if self.redis is not None and idempotency_key:
-            cache_key = f"booking:idempotency:{idempotency_key}"
-            existing_id = await self.redis.get(cache_key)
-            if existing_id:
-                existing = await self.bookings.get_by_id(UUID(existing_id))
-                if existing:
-                    return BookingRead.model_validate(existing)
-
-        item = await self.items.get_by_id(payload.item_id)
+        item = await self.items.get_booking_row(payload.item_id)
         if not item:
             raise ValueError("Item not found")
 
         if item.owner_id == renter_id:
             raise PermissionError("Owners cannot book their own items")
 
-        await self._validate_item_available(item, payload.start_date, payload.end_date)
+        hold = None
+        if payload.hold_id:
+            hold = await self.holds.get(payload.hold_id) if self.holds is not None else None
+            if not hold or hold.renter_id != renter_id:
+                raise ValueError("Hold not found or expired")
+            if hold.item_id != item.id or not hold.covers(payload.start_date, payload.end_date):
+                raise ValueError("Booking does not match the hold")
 
-        # Simple pricing calculation; we will refine with discounts later
-        nights = (payload.end_date - payload.start_date).days or 1
-        total_price = item.daily_price * nights
+        await self._validate_item_available(item, payload.start_date, payload.end_date, renter_id)
 
-        booking = await self.bookings.create(
-            item_id=item.id,
-            renter_id=renter_id,
-            owner_id=item.owner_id,
-            start_date=payload.start_date,
-            end_date=payload.end_date,
-            total_price=total_price,
-            notes=payload.notes,
-        )
+        total_price = compile_pricing(item).quote(payload.start_date, payload.end_date).total
 
-        # Immediately hold the security deposit in simulated escrow
-        if item.security_deposit > 0:
-            await self.escrow.create_and_hold_for_booking(
-                booking_id=booking.id,
+        # Booking and deposit hold commit together or not at all
+        async with unit_of_work(self.db):
+            booking = await self.bookings.create(
+                item_id=item.id,
                 renter_id=renter_id,
                 owner_id=item.owner_id,
-                item_id=item.id,
-                amount_held=item.security_deposit,
+                start_date=payload.start_date,
+                end_date=payload.end_date,
+                total_price=total_price,
+                notes=payload.notes,
             )
-        else:
-            await self.db.commit()
-            await self.db.refresh(booking)
+            if item.security_deposit > 0:
+                await self.escrow.create_and_hold_for_booking(
+                    booking_id=booking.id,
+                    renter_id=renter_id,
+                    owner_id=item.owner_id,
+                    item_id=item.id,
+                    amount_held=item.security_deposit,
+                )
+
+        await self.availability.invalidate_calendar(booking.item_id, booking.start_date, booking.end_date)
 
-        # Store idempotency mapping
-        if self.redis is not None and idempotency_key:
-            cache_key = f"booking:idempotency:{idempotency_key}"
-            await self.redis.set(cache_key, str(booking.id), ex=600)
+        # The booking now blocks the dates itself, so the hold can go
+        if hold is not None and self.holds is not None:
+            await self.holds.release(hold)
 
         # Fire-and-forget background tasks
         send_booking_created_email.delay(str(booking.id))
@@ -111,6 +153,43 @@ class BookingService:
 
         return BookingRead.model_validate(booking)
 
+    async def create_hold(self, renter_id: UUID, payload: BookingHoldCreate) -> BookingHoldRead:
+        if self.holds is None:
+            raise RuntimeError("Reservation holds require Redis")
+
+        item = await self.items.get_booking_row(payload.item_id)
+        if not item:
+            raise ValueError("Item not found")
+
+        if item.owner_id == renter_id:
+            raise PermissionError("Owners cannot book their own items")
+
+        await self._validate_item_available(item, payload.start_date, payload.end_date, renter_id)
+
+        hold = await self.holds.create(
+            item_id=item.id,
+            renter_id=renter_id,
+            start_date=payload.start_date,
+            end_date=payload.end_date,
+        )
+        if hold is None:
+            raise ConflictError("Item is on hold for the selected dates")
+        return BookingHoldRead.model_validate(hold)
+
+    async def release_hold(self, *, hold_id: str, renter_id: UUID) -> None:
+        hold = await self.holds.get(hold_id) if self.holds is not None else None
+        if not hold:
+            raise LookupError("Hold not found or expired")
+        if hold.renter_id != renter_id:
+            raise PermissionError("You do not own this hold")
+        await self.holds.release(hold)
+
+    async def renter_bookings_version(self, renter_id: UUID) -> ResourceVersion:
+        return ResourceVersion.of_collection(await self.bookings.list_version_for_renter(renter_id))
+
+    async def owner_bookings_version(self, owner_id: UUID) -> ResourceVersion:
+        return ResourceVersion.of_collection(await self.bookings.list_version_for_owner(owner_id))
+
     async def list_bookings_for_renter(
         self,
         renter_id: UUID,
@@ -155,39 +234,92 @@ class BookingService:
         role: UserRole,
         new_status: BookingStatus,
     ) -> BookingRead:
-        booking = await self.bookings.get_by_id(booking_id)
-        if not booking:
-            raise LookupError("Booking not found")
-
-        await self._ensure_actor_can_modify(booking=booking, actor_id=actor_id, role=role)
+        allowed_from = BOOKING_TRANSITIONS.get(new_status)
+        if not allowed_from:
+            raise ValueError(f"Bookings cannot be moved to {new_status.value}")
+
+        # Check-and-set in one statement: concurrent transitions cannot both win
+        booking = await self.bookings.transition_status(
+            booking_id=booking_id,
+            new_status=new_status,
+            allowed_from=allowed_from,
+            participant_id=None if role == UserRole.ADMIN else actor_id,
+        )
+        if booking is None:
+            await self._raise_transition_failure(booking_id=booking_id, actor_id=actor_id, role=role)
 
-        # Basic lifecycle guards
-        if booking.status in (BookingStatus.COMPLETED, BookingStatus.CANCELLED):
-            raise ValueError("Booking is already finalized")
+        await self.db.commit()
+        await self.availability.invalidate_calendar(booking.item_id, booking.start_date, booking.end_date)
 
-        if booking.status == BookingStatus.REQUESTED and new_status not in (
-            BookingStatus.APPROVED,
-            BookingStatus.CANCELLED,
-        ):
-            raise ValueError("Requested bookings can only be approved or cancelled")
+        # Deposits of completed bookings are released in bulk by the periodic
+        # escrow.release_due_deposits job once the dispute window has passed.
 
-        if booking.status == BookingStatus.APPROVED and new_status not in (
-            BookingStatus.ACTIVE,
-            BookingStatus.CANCELLED,
-        ):
-            raise ValueError("Approved bookings can only become active or cancelled")
-
-        if booking.status == BookingStatus.ACTIVE and new_status not in (BookingStatus.COMPLETED,):
-            raise ValueError("Active bookings can only be completed")
+        return BookingRead.model_validate(booking)
 
-        booking.status = new_status
+    async def bulk_update_status(
+        self,
+        *,
+        booking_ids: list[UUID],
+        actor_id: UUID,
+        role: UserRole,
+        new_status: BookingStatus,
+    ) -> BookingBulkStatusResponse:
+        """Apply one transition to many of the actor's bookings and report per-ID outcomes."""
+
+        allowed_from = BOOKING_TRANSITIONS.get(new_status)
+        if not allowed_from:
+            raise ValueError(f"Bookings cannot be moved to {new_status.value}")
+
+        booking_ids = list(dict.fromkeys(booking_ids))
+        moved = await self.bookings.transition_status_many(
+            booking_ids=booking_ids,
+            new_status=new_status,
+            allowed_from=allowed_from,
+            owner_id=None if role == UserRole.ADMIN else actor_id,
+        )
         await self.db.commit()
-        await self.db.refresh(booking)
 
-        # When booking is completed, schedule automatic deposit release processing
-        if booking.status == BookingStatus.COMPLETED:
-            # e.g. auto-release after 24h if no disputes
-            auto_release_deposit.apply_async(args=[str(booking.id)], countdown=24 * 3600)
+        moved_ids = {row.id for row in moved}
+        # Only rows that did not move need a second look to explain why
+        failed = {}
+        missing = [booking_id for booking_id in booking_ids if booking_id not in moved_ids]
+        if missing:
+            failed = {row.id: row for row in await self.bookings.list_status_rows(missing)}
+
+        results: list[BookingBulkStatusResult] = []
+        for booking_id in booking_ids:
+            if booking_id in moved_ids:
+                results.append(BookingBulkStatusResult(booking_id=booking_id, ok=True, status=new_status))
+                continue
+            current = failed.get(booking_id)
+            if current is None:
+                error = "Booking not found"
+            elif role != UserRole.ADMIN and current.owner_id != actor_id:
+                error = "You do not own this booking"
+            else:
+                error = TRANSITION_ERRORS.get(current.status, "Booking status changed concurrently")
+            results.append(
+                BookingBulkStatusResult(
+                    booking_id=booking_id,
+                    ok=False,
+                    status=current.status if current is not None else None,
+                    error=error,
+                )
+            )
 
-        return BookingRead.model_validate(booking)
+        # Follow-ups for the whole batch at once. Deposit release needs no
+        # per-booking task: escrow.release_due_deposits sweeps completed bookings.
+        await self.availability.invalidate_calendars(
+            (row.item_id, row.start_date, row.end_date) for row in moved
+        )
+        return BookingBulkStatusResponse(results=results)
+
+    async def _raise_transition_failure(self, *, booking_id: UUID, actor_id: UUID, role: UserRole) -> NoReturn:
+        """Explain why a conditional status update matched no row."""
 
+        await self.db.rollback()
+        current = await self.bookings.get_status_row(booking_id)
+        if current is None:
+            raise LookupError("Booking not found")
+        await self._ensure_actor_can_modify(booking=current, actor_id=actor_id, role=role)
+        raise ConflictError(TRANSITION_ERRORS.get(current.status, "Booking status changed concurrently"))
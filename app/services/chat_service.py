@@ -31,7 +31,6 @@ class ChatService:
             conversation_id=payload.conversation_id,
         )
         await self.db.commit()
-        await self.db.refresh(msg)
         return MessageRead.model_validate(msg)
 
     async def get_conversation(
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+from datetime import datetime
 from decimal import Decimal
+from typing import Sequence
 from uuid import UUID
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.exceptions import ConflictError
 from app.models.enums import EscrowStatus, UserRole
 from app.repositories.booking_repository import BookingRepository
-from app.repositories.escrow_repository import EscrowRepository
+from app.repositories.escrow_repository import OPEN_ESCROW_STATUSES, EscrowRepository
 from app.schemas.escrow import EscrowRead
 
 
@@ -28,15 +32,19 @@ class EscrowService:
         item_id: UUID,
         amount_held: Decimal,
     ) -> EscrowRead:
+        """Insert the escrow record directly in HELD state.
+
+        Does not commit: it runs inside the caller's booking unit of work.
+        """
+
         escrow = await self.escrows.create_for_booking(
             booking_id=booking_id,
             renter_id=renter_id,
             owner_id=owner_id,
             item_id=item_id,
             amount_held=amount_held,
+            status=EscrowStatus.HELD,
         )
-        escrow = await self.escrows.mark_held(escrow)
-        await self.db.commit()
         return EscrowRead.model_validate(escrow)
 
     async def get_for_booking(self, booking_id: UUID) -> EscrowRead:
@@ -72,8 +80,8 @@ class EscrowService:
         if not escrow:
             raise LookupError("Escrow record not found")
 
-        if escrow.status not in (EscrowStatus.PENDING, EscrowStatus.HELD):
-            raise ValueError("Escrow already finalized")
+        if escrow.status not in OPEN_ESCROW_STATUSES:
+            raise ConflictError("Escrow already finalized")
 
         if damage_fee < 0 or damage_fee > escrow.amount_held:
             raise ValueError("Invalid damage fee")
@@ -82,3 +90,23 @@ class EscrowService:
         await self.db.commit()
         return EscrowRead.model_validate(escrow)
 
+    async def release_due_batch(
+        self,
+        *,
+        completed_before: datetime,
+        batch_size: int,
+        booking_ids: Sequence[UUID] | None = None,
+    ) -> Sequence[Row]:
+        """Release one batch of deposits past the dispute window and commit it.
+
+        Each batch is its own transaction, so an interrupted run can simply be
+        restarted; already released escrows no longer match.
+        """
+
+        released = await self.escrows.release_due_batch(
+            completed_before=completed_before,
+            batch_size=batch_size,
+            booking_ids=booking_ids,
+        )
+        await self.db.commit()
+        return released
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import csv
+import enum
+import io
+from collections.abc import AsyncIterator, Callable
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.core.responses import dumps
+from app.db.session import AsyncSessionFactory
+from app.repositories import booking_repository, item_repository, review_repository
+
+
+settings = get_settings()
+
+# Encoded output is flushed to the client in chunks of roughly this size
+FLUSH_BYTES = 64 * 1024
+
+
+class ExportFormat(str, enum.Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+    @property
+    def media_type(self) -> str:
+        return "text/csv" if self is ExportFormat.CSV else "application/x-ndjson"
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    return value
+
+
+async def encode_rows(
+    rows: AsyncIterator[Row],
+    columns: list[str],
+    fmt: ExportFormat,
+) -> AsyncIterator[bytes]:
+    """Encode rows incrementally, holding at most one flush worth of output.
+
+    NDJSON lines go through the API's JSON encoder, so values match responses.
+    """
+
+    if fmt is ExportFormat.NDJSON:
+        lines = bytearray()
+        async for row in rows:
+            lines += dumps(dict(zip(columns, row)))
+            lines += b"\n"
+            if len(lines) >= FLUSH_BYTES:
+                yield bytes(lines)
+                lines.clear()
+        if lines:
+            yield bytes(lines)
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    async for row in rows:
+        writer.writerow("" if v is None else _plain(v) for v in row)
+        if buffer.tell() >= FLUSH_BYTES:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+class ExportService:
+    """Full-history exports streamed from server-side cursors.
+
+    Each export runs on its own session rather than the request one: the body
+    is produced after the route returns. The whole export reads one
+    REPEATABLE READ snapshot, so concurrent writes never shift rows between
+    chunks the way OFFSET paging does.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionFactory,
+        chunk_size: int = settings.export_chunk_size,
+    ) -> None:
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+
+    async def _export(
+        self,
+        columns: tuple[Any, ...],
+        fetch: Callable[[AsyncSession], AsyncIterator[Row]],
+        fmt: ExportFormat,
+    ) -> AsyncIterator[bytes]:
+        async with self.session_factory() as session:
+            await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+            async for chunk in encode_rows(fetch(session), [c.key for c in columns], fmt):
+                yield chunk
+
+    def bookings_for_owner(self, owner_id: UUID, fmt: ExportFormat) -> AsyncIterator[bytes]:
+        return self._export(
+            booking_repository.EXPORT_COLUMNS,
+            lambda session: booking_repository.BookingRepository(session).stream_for_owner(
+                owner_id, chunk_size=self.chunk_size
+            ),
+            fmt,
+        )
+
+    def items_for_owner(self, owner_id: UUID, fmt: ExportFormat) -> AsyncIterator[bytes]:
+        return self._export(
+            item_repository.EXPORT_COLUMNS,
+            lambda session: item_repository.ItemRepository(session).stream_for_owner(
+                owner_id, chunk_size=self.chunk_size
+            ),
+            fmt,
+        )
+
+    def reviews_for_user(self, user_id: UUID, fmt: ExportFormat) -> AsyncIterator[bytes]:
+        return self._export(
+            review_repository.EXPORT_COLUMNS,
+            lambda session: review_repository.ReviewRepository(session).stream_for_user(
+                user_id, chunk_size=self.chunk_size
+            ),
+            fmt,
+        )
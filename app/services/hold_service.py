@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+
+HOLDS_PREFIX = "booking:holds:"
+HOLD_INDEX_PREFIX = "booking:hold:"
+
+# Atomically drop expired holds, reject overlaps with other renters' holds and
+# store the new one. Dates are passed as proleptic ordinals.
+# KEYS[1] = per-item holds hash, KEYS[2] = hold_id -> item_id index key
+# ARGV = hold_id, renter_id, item_id, start, end, now_ms, ttl_ms
+_CREATE_HOLD_SCRIPT = """
+local now = tonumber(ARGV[6])
+local start_day = tonumber(ARGV[4])
+local end_day = tonumber(ARGV[5])
+local entries = redis.call('HGETALL', KEYS[1])
+for i = 1, #entries, 2 do
+    local renter, s, e, exp = string.match(entries[i + 1], '([^|]+)|(%d+)|(%d+)|(%d+)')
+    if tonumber(exp) <= now then
+        redis.call('HDEL', KEYS[1], entries[i])
+    elseif renter ~= ARGV[2] and tonumber(s) <= end_day and tonumber(e) >= start_day then
+        return 0
+    end
+end
+local ttl = tonumber(ARGV[7])
+local expires = now + ttl
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2] .. '|' .. ARGV[4] .. '|' .. ARGV[5] .. '|' .. expires)
+if redis.call('PTTL', KEYS[1]) < ttl then
+    redis.call('PEXPIRE', KEYS[1], ttl)
+end
+redis.call('SET', KEYS[2], ARGV[3], 'PX', ttl)
+return expires
+"""
+
+
+@dataclass(frozen=True)
+class Hold:
+    id: str
+    item_id: UUID
+    renter_id: UUID
+    start_date: date
+    end_date: date
+    expires_at: datetime
+
+    def covers(self, start_date: date, end_date: date) -> bool:
+        return self.start_date <= start_date and end_date <= self.end_date
+
+    def overlaps(self, start_date: date, end_date: date) -> bool:
+        return self.start_date <= end_date and self.end_date >= start_date
+
+
+def _decode(hold_id: str, item_id: UUID, raw: str) -> Hold:
+    renter_id, start, end, expires_ms = raw.split("|")
+    return Hold(
+        id=hold_id,
+        item_id=item_id,
+        renter_id=UUID(renter_id),
+        start_date=date.fromordinal(int(start)),
+        end_date=date.fromordinal(int(end)),
+        expires_at=datetime.fromtimestamp(int(expires_ms) / 1000, tz=timezone.utc),
+    )
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class HoldService:
+    """Short-lived reservation holds on an item's dates, stored in Redis.
+
+    Holds of one item live in a single hash so the overlap check and the
+    insert run atomically in one Lua script.
+    """
+
+    def __init__(self, redis: Redis, ttl_seconds: int) -> None:
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self._create_script = redis.register_script(_CREATE_HOLD_SCRIPT)
+
+    async def create(
+        self,
+        *,
+        item_id: UUID,
+        renter_id: UUID,
+        start_date: date,
+        end_date: date,
+    ) -> Hold | None:
+        """Place a hold, or return None if another renter holds overlapping dates."""
+
+        hold_id = uuid.uuid4().hex
+        expires_ms = await self._create_script(
+            keys=[f"{HOLDS_PREFIX}{item_id}", f"{HOLD_INDEX_PREFIX}{hold_id}"],
+            args=[
+                hold_id,
+                str(renter_id),
+                str(item_id),
+                start_date.toordinal(),
+                end_date.toordinal(),
+                _now_ms(),
+                self.ttl_seconds * 1000,
+            ],
+        )
+        if not expires_ms:
+            return None
+        return Hold(
+            id=hold_id,
+            item_id=item_id,
+            renter_id=renter_id,
+            start_date=start_date,
+            end_date=end_date,
+            expires_at=datetime.fromtimestamp(int(expires_ms) / 1000, tz=timezone.utc),
+        )
+
+    async def list_active(self, item_id: UUID) -> list[Hold]:
+        raw = await self.redis.hgetall(f"{HOLDS_PREFIX}{item_id}")
+        now = datetime.now(timezone.utc)
+        holds = [_decode(hold_id, item_id, value) for hold_id, value in raw.items()]
+        return [h for h in holds if h.expires_at > now]
+
+    async def list_active_many(self, item_ids: list[UUID]) -> dict[UUID, list[Hold]]:
+        """Fetch live holds of several items in one pipelined round trip."""
+
+        pipe = self.redis.pipeline(transaction=False)
+        for item_id in item_ids:
+            pipe.hgetall(f"{HOLDS_PREFIX}{item_id}")
+        now = datetime.now(timezone.utc)
+        result: dict[UUID, list[Hold]] = {}
+        for item_id, raw in zip(item_ids, await pipe.execute()):
+            holds = [_decode(hold_id, item_id, value) for hold_id, value in raw.items()]
+            result[item_id] = [h for h in holds if h.expires_at > now]
+        return result
+
+    async def get(self, hold_id: str) -> Hold | None:
+        item_id = await self.redis.get(f"{HOLD_INDEX_PREFIX}{hold_id}")
+        if not item_id:
+            return None
+        raw = await self.redis.hget(f"{HOLDS_PREFIX}{item_id}", hold_id)
+        if not raw:
+            return None
+        hold = _decode(hold_id, UUID(item_id), raw)
+        if hold.expires_at <= datetime.now(timezone.utc):
+            return None
+        return hold
+
+    async def has_conflict(
+        self,
+        *,
+        item_id: UUID,
+        start_date: date,
+        end_date: date,
+        renter_id: UUID | None = None,
+    ) -> bool:
+        """Return True if a live hold of another renter overlaps the given range."""
+
+        for hold in await self.list_active(item_id):
+            if hold.renter_id == renter_id:
+                continue
+            if hold.overlaps(start_date, end_date):
+                return True
+        return False
+
+    async def release(self, hold: Hold) -> None:
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hdel(f"{HOLDS_PREFIX}{hold.item_id}", hold.id)
+        pipe.delete(f"{HOLD_INDEX_PREFIX}{hold.id}")
+        await pipe.execute()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import date
+from typing import TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.cache import TieredCache
+from app.core.config import get_settings
+from app.core.logging_config import get_logger
+from app.db.session import AsyncSessionFactory
+from app.repositories.item_repository import ItemRepository
+from app.schemas.item import ITEM_READ_FIELDS, ItemAvailabilityWindow, ItemPageRead, ItemRead
+from app.schemas.review import ReviewSummaryRead
+from app.schemas.user import UserTrustRead
+from app.services.availability_service import AvailabilityService
+from app.services.review_summary_service import ReviewSummaryService
+
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+ITEM_DETAIL_PREFIX = "items:detail:"
+OWNER_TRUST_PREFIX = "items:owner-trust:"
+AVAILABILITY_WINDOW_DAYS = 30
+
+item_detail_cache = TieredCache("items.detail", ttl_seconds=settings.item_detail_cache_ttl_seconds)
+owner_trust_cache = TieredCache("items.owner_trust", ttl_seconds=settings.owner_trust_cache_ttl_seconds)
+
+
+class ItemPageService:
+    """Assembles the item detail page from independent parts fetched concurrently.
+
+    Every part runs on its own pooled session (an AsyncSession must not be
+    shared between concurrent tasks) and reads through its own cache. The
+    item is required; the other parts are best effort and come back as null
+    when they fail or exceed their time budget.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionFactory,
+    ) -> None:
+        self.redis = redis
+        self.session_factory = session_factory
+        self.part_timeout = settings.item_page_part_timeout_seconds
+
+    async def get_page(self, item_id: UUID) -> ItemPageRead:
+        item_part = asyncio.create_task(self._item(item_id))
+        optional_parts = {
+            "owner": asyncio.create_task(self._optional(self._owner_trust(item_id))),
+            "reviews": asyncio.create_task(self._optional(self._reviews(item_id))),
+            "availability": asyncio.create_task(self._optional(self._availability(item_id))),
+        }
+        try:
+            item = await item_part
+        except BaseException:
+            for task in optional_parts.values():
+                task.cancel()
+            raise
+
+        parts = {name: await task for name, task in optional_parts.items()}
+        unavailable = [name for name, value in parts.items() if value is None]
+        if unavailable:
+            logger.warning("item_page_degraded", item_id=str(item_id), parts=unavailable)
+        return ItemPageRead(item=item, unavailable_parts=unavailable, **parts)
+
+    async def _optional(self, part: Awaitable[T]) -> T | None:
+        try:
+            return await asyncio.wait_for(part, timeout=self.part_timeout)
+        except Exception:
+            logger.exception("item_page_part_failed")
+            return None
+
+    async def _cached(
+        self,
+        cache: TieredCache,
+        key: str,
+        model: type[M],
+        load: Callable[[AsyncSession], Awaitable[M | None]],
+    ) -> M | None:
+        async def load_json() -> str | None:
+            async with self.session_factory() as session:
+                value = await load(session)
+            return value.model_dump_json() if value is not None else None
+
+        raw = await cache.get(self.redis, key, load_json)
+        return model.model_validate_json(raw) if raw is not None else None
+
+    async def _item(self, item_id: UUID) -> ItemRead:
+        async def load(session: AsyncSession) -> ItemRead | None:
+            row = await ItemRepository(session).get_item_row(item_id, ITEM_READ_FIELDS)
+            return ItemRead.model_validate(row) if row else None
+
+        item = await self._cached(item_detail_cache, f"{ITEM_DETAIL_PREFIX}{item_id}", ItemRead, load)
+        if item is None:
+            raise LookupError("Item not found")
+        return item
+
+    async def _owner_trust(self, item_id: UUID) -> UserTrustRead | None:
+        async def load(session: AsyncSession) -> UserTrustRead | None:
+            row = await ItemRepository(session).get_owner_trust(item_id)
+            return UserTrustRead.model_validate(row) if row else None
+
+        return await self._cached(owner_trust_cache, f"{OWNER_TRUST_PREFIX}{item_id}", UserTrustRead, load)
+
+    async def _reviews(self, item_id: UUID) -> ReviewSummaryRead:
+        # Cached and maintained by ReviewSummaryService itself
+        async with self.session_factory() as session:
+            return await ReviewSummaryService(session, self.redis).get_summary(item_id)
+
+    async def _availability(self, item_id: UUID) -> ItemAvailabilityWindow:
+        # Built from the per-month calendar cache
+        async with self.session_factory() as session:
+            return await AvailabilityService(session, self.redis).get_window(
+                item_id, date.today(), AVAILABILITY_WINDOW_DAYS
+            )
+
+
+async def invalidate_item_detail(redis: Redis, item_id: UUID) -> None:
+    await item_detail_cache.invalidate(redis, f"{ITEM_DETAIL_PREFIX}{item_id}")
+    await owner_trust_cache.invalidate(redis, f"{OWNER_TRUST_PREFIX}{item_id}")
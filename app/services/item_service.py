@@ -1,16 +1,41 @@
 from __future__ import annotations
 
+from datetime import datetime
 from uuid import UUID
-import json
+from collections.abc import Callable, Sequence
 
+import orjson
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TieredCache
+from app.core.config import get_settings
+from app.core.http_cache import ResourceVersion
+from app.core.responses import dumps
 from app.models.enums import UserRole
 from app.models.item import Item
 from app.repositories.category_repository import CategoryRepository
 from app.repositories.item_repository import ItemRepository
-from app.schemas.item import ItemCreate, ItemListResponse, ItemRead, ItemUpdate
+from app.schemas.category import CategoryRead
+from app.schemas.item import (
+    ITEM_READ_FIELDS,
+    ItemCalendarRead,
+    ItemCreate,
+    ItemRead,
+    ItemUpdate,
+    item_list_partial_model,
+)
+from app.services.availability_service import AvailabilityService
+from app.services.item_page_service import ITEM_DETAIL_PREFIX, invalidate_item_detail, item_detail_cache
+
+
+settings = get_settings()
+
+ITEM_LIST_PREFIX = "items:list:"
+CATEGORY_PREFIX = "categories:"
+
+item_list_cache = TieredCache("items.list", ttl_seconds=settings.item_list_cache_ttl_seconds)
+category_cache = TieredCache("categories", ttl_seconds=settings.category_cache_ttl_seconds)
 
 
 class ItemService:
@@ -21,11 +46,11 @@ class ItemService:
         self.redis = redis
         self.items = ItemRepository(db)
         self.categories = CategoryRepository(db)
-        self._cache_ttl_seconds = 60
+        self.availability = AvailabilityService(db, redis)
 
     async def create_item(self, owner_id: UUID, payload: ItemCreate) -> ItemRead:
         if payload.category_id:
-            category = await self.categories.get_by_id(payload.category_id)
+            category = await self.get_category(payload.category_id)
             if not category:
                 raise ValueError("Category not found")
 
@@ -41,12 +66,14 @@ class ItemService:
             available_from=payload.available_from,
             available_until=payload.available_until,
             category_id=payload.category_id,
+            pricing_rules=payload.pricing_rules.model_dump(mode="json") if payload.pricing_rules else None,
         )
         await self.db.commit()
-        await self.db.refresh(item)
+        if self.redis is not None:
+            await item_list_cache.invalidate_prefix(self.redis, ITEM_LIST_PREFIX)
         return ItemRead.model_validate(item)
 
-    async def list_items(
+    async def list_items_json(
         self,
         *,
         owner_id: UUID | None,
@@ -54,39 +81,128 @@ class ItemService:
         is_active: bool | None,
         skip: int,
         limit: int,
-    ) -> ItemListResponse:
-        # Try cache if Redis is available
+        fields: frozenset[str] | None = None,
+        not_modified: Callable[[ResourceVersion], bool] = lambda version: False,
+    ) -> tuple[ResourceVersion, bytes | None]:
+        """A page of items and its version, as ready-to-send JSON bytes.
+
+        Rows are fetched as column mappings and validated once against the
+        (possibly partial) list model, so routes can return the bytes
+        without a second pass through `response_model`.
+
+        Cached pages are stored with the version they were loaded at, so a
+        hit answers both without touching the database. On a miss the cheap
+        collection version is checked first, and the page query only runs
+        when `not_modified(version)` is false. The bytes are None whenever
+        `not_modified` holds.
+        """
+
+        fields = fields or ITEM_READ_FIELDS
+
+        async def version() -> ResourceVersion:
+            return ResourceVersion.of_collection(
+                await self.items.list_version(owner_id=owner_id, category_id=category_id, is_active=is_active)
+            )
+
+        async def load() -> str:
+            total, rows = await self.items.list_item_rows(
+                fields,
+                owner_id=owner_id,
+                category_id=category_id,
+                is_active=is_active,
+                skip=skip,
+                limit=limit,
+            )
+            return item_list_partial_model(fields).model_validate({"total": total, "items": rows}).model_dump_json()
+
+        async def load_versioned() -> str:
+            # Versioned inside the load, after the cache read its epoch: a write
+            # landing later invalidates and fences the store, so a stored page
+            # is never older than its version
+            return _pack_list((await version()).etag, await load())
+
         cache_key = None
         if self.redis is not None:
             cache_key = (
-                f"items:list:owner={owner_id}|cat={category_id}|active={is_active}|"
+                f"{ITEM_LIST_PREFIX}owner={owner_id}|cat={category_id}|active={is_active}|"
                 f"skip={skip}|limit={limit}"
             )
-            cached = await self.redis.get(cache_key)
-            if cached:
-                data = json.loads(cached)
-                return ItemListResponse.model_validate(data)
+            if fields != ITEM_READ_FIELDS:
+                cache_key += f"|fields={','.join(sorted(fields))}"
+            cached = await item_list_cache.peek(self.redis, cache_key)
+            if cached is not None:
+                current, content = _unpack_list(cached)
+                return current, None if not_modified(current) else content
 
-        total, items = await self.items.list_items(
-            owner_id=owner_id,
-            category_id=category_id,
-            is_active=is_active,
-            skip=skip,
-            limit=limit,
-        )
-        response = ItemListResponse(
-            total=total,
-            items=[ItemRead.model_validate(item) for item in items],
-        )
-        if self.redis is not None and cache_key is not None:
-            await self.redis.set(cache_key, response.model_dump_json(), ex=self._cache_ttl_seconds)
-        return response
+        current = await version()
+        if not_modified(current):
+            return current, None
+        if cache_key is None:
+            return current, (await load()).encode()
+        current, content = _unpack_list(await item_list_cache.get(self.redis, cache_key, load_versioned))
+        return current, None if not_modified(current) else content
 
-    async def get_item(self, item_id: UUID) -> ItemRead:
-        item = await self.items.get_by_id(item_id)
-        if not item:
+    async def get_item_json(self, item_id: UUID) -> bytes:
+        """One item as `ItemRead` JSON bytes, shared with the item detail cache."""
+
+        async def load() -> str | None:
+            row = await self.items.get_item_row(item_id, ITEM_READ_FIELDS)
+            return ItemRead.model_validate(row).model_dump_json() if row is not None else None
+
+        if self.redis is None:
+            payload = await load()
+        else:
+            payload = await item_detail_cache.get(self.redis, f"{ITEM_DETAIL_PREFIX}{item_id}", load)
+        if payload is None:
             raise LookupError("Item not found")
-        return ItemRead.model_validate(item)
+        return payload.encode()
+
+    @staticmethod
+    def item_version(content: bytes) -> ResourceVersion:
+        """Validators for an `ItemRead` body returned by `get_item_json`."""
+
+        updated_at = datetime.fromisoformat(orjson.loads(content)["updated_at"])
+        return ResourceVersion.of_body(content, last_modified=updated_at)
+
+    async def get_category(self, category_id: UUID) -> CategoryRead | None:
+        async def load() -> str | None:
+            category = await self.categories.get_by_id(category_id)
+            return CategoryRead.model_validate(category).model_dump_json() if category else None
+
+        if self.redis is None:
+            payload = await load()
+        else:
+            payload = await category_cache.get(self.redis, f"{CATEGORY_PREFIX}{category_id}", load)
+        return CategoryRead.model_validate_json(payload) if payload is not None else None
+
+    async def get_items_json(self, item_ids: Sequence[UUID]) -> bytes:
+        """`ItemBatchResponse` JSON for items in request order, served from the per-item cache where possible."""
+
+        async def load_missing(ids: list[UUID]) -> dict[UUID, str]:
+            return {
+                item.id: ItemRead.model_validate(item).model_dump_json()
+                for item in await self.items.list_by_ids(ids)
+            }
+
+        if self.redis is not None:
+            found = await item_detail_cache.get_many(
+                self.redis,
+                prefix=ITEM_DETAIL_PREFIX,
+                ids=item_ids,
+                load_missing=load_missing,
+            )
+        else:
+            found = await load_missing(list(item_ids))
+        # Cached items are embedded as-is rather than parsed and re-serialized
+        return dumps(
+            {
+                "items": [orjson.Fragment(found[i]) for i in item_ids if i in found],
+                "missing": [i for i in item_ids if i not in found],
+            }
+        )
+
+    async def get_calendar(self, item_id: UUID, month: str) -> ItemCalendarRead:
+        return await self.availability.get_calendar(item_id, month)
 
     async def _ensure_owner_or_admin(self, current_user_id: UUID, role: UserRole, item: Item) -> None:
         if role == UserRole.ADMIN:
@@ -109,15 +225,18 @@ class ItemService:
         await self._ensure_owner_or_admin(current_user_id, role, item)
 
         update_data = payload.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(item, field, value)
+        if payload.pricing_rules is not None:
+            # JSONB column: store JSON-native values rather than Decimals
+            update_data["pricing_rules"] = payload.pricing_rules.model_dump(mode="json")
+        if update_data:
+            item = await self.items.update_item(item.id, update_data) or item
 
         await self.db.commit()
-        await self.db.refresh(item)
-        # Invalidate item list cache
         if self.redis is not None:
-            async for key in self.redis.scan_iter("items:list:*"):
-                await self.redis.delete(key)
+            await invalidate_item_caches(self.redis, item.id)
+        # Activity and availability window feed the calendar
+        if {"is_active", "available_from", "available_until"} & update_data.keys():
+            await self.availability.invalidate_calendar(item.id)
         return ItemRead.model_validate(item)
 
     async def delete_item(
@@ -134,8 +253,23 @@ class ItemService:
         await self._ensure_owner_or_admin(current_user_id, role, item)
         await self.items.delete(item)
         await self.db.commit()
-        # Invalidate item list cache
         if self.redis is not None:
-            async for key in self.redis.scan_iter("items:list:*"):
-                await self.redis.delete(key)
+            await invalidate_item_caches(self.redis, item_id)
+        await self.availability.invalidate_calendar(item_id)
+
+
+async def invalidate_item_caches(redis: Redis, item_id: UUID) -> None:
+    """Drop every cached representation of an item: its detail and every list page."""
+
+    await item_list_cache.invalidate_prefix(redis, ITEM_LIST_PREFIX)
+    await invalidate_item_detail(redis, item_id)
+
+
+def _pack_list(etag: str, body: str) -> str:
+    # Serialized JSON never contains a raw newline
+    return f"{etag}\n{body}"
+
 
+def _unpack_list(value: str) -> tuple[ResourceVersion, bytes]:
+    etag, _, body = value.partition("\n")
+    return ResourceVersion(etag=etag), body.encode()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.booking_repository import BookingRepository
+from app.repositories.owner_stats_repository import OwnerStatsRepository
+from app.schemas.owner_stats import ItemStats, OwnerStatsRead, UpcomingBooking
+
+
+ROLLUP_NAME = "item_daily_stats"
+# Arbitrary constant identifying the rollup refresh in pg advisory locks
+ROLLUP_LOCK_KEY = 0x0C0FFEE1
+MAX_STATS_RANGE_DAYS = 366
+UPCOMING_LIMIT = 10
+
+_CENT = Decimal("0.01")
+
+
+def _rate(booked_nights: int, capacity: int) -> float:
+    return round(booked_nights / capacity, 4) if capacity else 0.0
+
+
+class OwnerStatsService:
+    """Owner dashboard numbers served from the daily rollup tables."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.stats = OwnerStatsRepository(db)
+        self.bookings = BookingRepository(db)
+
+    async def refresh_rollups(self, *, until: datetime) -> int | None:
+        """Fold booking and escrow changes up to `until` into the rollups.
+
+        Returns the number of rebuilt item windows, or None if another refresh
+        holds the lock. Everything, including the watermark, commits together.
+        """
+
+        if not await self.stats.try_lock(ROLLUP_LOCK_KEY):
+            await self.db.rollback()
+            return None
+
+        since = await self.stats.get_watermark(ROLLUP_NAME)
+        windows = await self.stats.list_changed_windows(since=since, until=until)
+        if windows:
+            await self.stats.rebuild_windows([(w.item_id, w.start_date, w.end_date) for w in windows])
+        await self.stats.set_watermark(ROLLUP_NAME, until)
+        await self.db.commit()
+        return len(windows)
+
+    async def get_owner_stats(self, owner_id: UUID, start_date: date, end_date: date) -> OwnerStatsRead:
+        if end_date < start_date:
+            raise ValueError("end_date must be on or after start_date")
+        days = (end_date - start_date).days + 1
+        if days > MAX_STATS_RANGE_DAYS:
+            raise ValueError(f"Date range cannot exceed {MAX_STATS_RANGE_DAYS} days")
+
+        rows = await self.stats.summarize_items(owner_id=owner_id, start_date=start_date, end_date=end_date)
+        items = [
+            ItemStats(
+                item_id=row.item_id,
+                title=row.title,
+                booked_nights=row.booked_nights,
+                bookings_started=row.bookings_started,
+                occupancy_rate=_rate(row.booked_nights, days),
+                earnings=Decimal(row.earnings).quantize(_CENT, rounding=ROUND_HALF_UP),
+                damage_fees=Decimal(row.damage_fees).quantize(_CENT, rounding=ROUND_HALF_UP),
+            )
+            for row in rows
+        ]
+        upcoming = await self.bookings.list_upcoming_for_owner(
+            owner_id,
+            from_date=datetime.now(timezone.utc).date(),
+            limit=UPCOMING_LIMIT,
+        )
+
+        booked_nights = sum(i.booked_nights for i in items)
+        return OwnerStatsRead(
+            start_date=start_date,
+            end_date=end_date,
+            booked_nights=booked_nights,
+            bookings_started=sum(i.bookings_started for i in items),
+            occupancy_rate=_rate(booked_nights, days * len(items)),
+            earnings=sum((i.earnings for i in items), Decimal("0")),
+            damage_fees=sum((i.damage_fees for i in items), Decimal("0")),
+            items=items,
+            upcoming=[UpcomingBooking.model_validate(b) for b in upcoming],
+        )
+
+    @staticmethod
+    def default_range(today: date | None = None) -> tuple[date, date]:
+        """The last 30 days including today."""
+
+        today = today or datetime.now(timezone.utc).date()
+        return today - timedelta(days=29), today
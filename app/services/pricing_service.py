@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Sequence
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.item_repository import ItemRepository
+from app.schemas.booking import DateRange
+from app.schemas.pricing import PricingRules, Quote, QuoteResponse
+
+
+WEEKLY_MIN_NIGHTS = 7
+MONTHLY_MIN_NIGHTS = 28
+# Upper bound on the day grid priced for a single quote call
+MAX_QUOTE_GRID_DAYS = 3 * 366
+
+_CENT = Decimal("0.01")
+_HUNDRED = Decimal("100")
+
+
+def nights_between(start_date: date, end_date: date) -> int:
+    """Number of charged nights; same-day rentals are charged as one."""
+
+    return (end_date - start_date).days or 1
+
+
+@dataclass(frozen=True)
+class CompiledPricing:
+    """Pricing rules of one item reduced to plain values for fast quoting."""
+
+    daily_price: Decimal
+    weekend_daily_price: Decimal | None
+    weekly_discount: Decimal
+    monthly_discount: Decimal
+    seasonal_rates: tuple[tuple[date, date, Decimal], ...]
+
+    def nightly_price(self, day: date) -> Decimal:
+        for start, end, price in reversed(self.seasonal_rates):
+            if start <= day <= end:
+                return price
+        if self.weekend_daily_price is not None and day.weekday() >= 5:
+            return self.weekend_daily_price
+        return self.daily_price
+
+    def discount_rate(self, nights: int) -> Decimal:
+        if nights >= MONTHLY_MIN_NIGHTS:
+            return self.monthly_discount
+        if nights >= WEEKLY_MIN_NIGHTS:
+            return self.weekly_discount
+        return Decimal("0")
+
+    def quote_many(self, ranges: Sequence[tuple[date, date]]) -> list[Quote]:
+        """Price many date ranges against one shared day grid.
+
+        Nightly prices are computed once for every day between the earliest
+        start and the latest charged night, then each range is answered from
+        prefix sums in O(1).
+        """
+
+        if not ranges:
+            return []
+        grid_start = min(start for start, _ in ranges)
+        grid_end = max(start + timedelta(days=nights_between(start, end)) for start, end in ranges)
+        grid_days = (grid_end - grid_start).days
+        if grid_days > MAX_QUOTE_GRID_DAYS:
+            raise ValueError("Requested ranges span too many days")
+
+        prefix = [Decimal("0")]
+        for offset in range(grid_days):
+            prefix.append(prefix[-1] + self.nightly_price(grid_start + timedelta(days=offset)))
+
+        quotes: list[Quote] = []
+        for start, end in ranges:
+            nights = nights_between(start, end)
+            first = (start - grid_start).days
+            subtotal = (prefix[first + nights] - prefix[first]).quantize(_CENT, rounding=ROUND_HALF_UP)
+            discount = (subtotal * self.discount_rate(nights)).quantize(_CENT, rounding=ROUND_HALF_UP)
+            quotes.append(
+                Quote(
+                    start_date=start,
+                    end_date=end,
+                    nights=nights,
+                    subtotal=subtotal,
+                    discount=discount,
+                    total=subtotal - discount,
+                )
+            )
+        return quotes
+
+    def quote(self, start_date: date, end_date: date) -> Quote:
+        return self.quote_many([(start_date, end_date)])[0]
+
+
+def _compile(daily_price: Decimal, raw_rules: dict[str, Any] | None) -> CompiledPricing:
+    rules = PricingRules.model_validate(raw_rules or {})
+    return CompiledPricing(
+        daily_price=Decimal(daily_price),
+        weekend_daily_price=rules.weekend_daily_price,
+        weekly_discount=rules.weekly_discount_percent / _HUNDRED,
+        monthly_discount=rules.monthly_discount_percent / _HUNDRED,
+        seasonal_rates=tuple((r.start_date, r.end_date, r.daily_price) for r in rules.seasonal_rates),
+    )
+
+
+class _CompiledPricingCache:
+    """Per-process LRU of compiled rules keyed by item id and `updated_at`.
+
+    Any item update bumps `updated_at`, so stale entries are never hit and
+    simply age out.
+    """
+
+    def __init__(self, maxsize: int = 2048) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[UUID, datetime], CompiledPricing] = OrderedDict()
+
+    def get(
+        self,
+        item_id: UUID,
+        updated_at: datetime,
+        daily_price: Decimal,
+        raw_rules: dict[str, Any] | None,
+    ) -> CompiledPricing:
+        key = (item_id, updated_at)
+        compiled = self._entries.get(key)
+        if compiled is not None:
+            self._entries.move_to_end(key)
+            return compiled
+        compiled = _compile(daily_price, raw_rules)
+        self._entries[key] = compiled
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return compiled
+
+
+compiled_pricing_cache = _CompiledPricingCache()
+
+
+def compile_pricing(item: Any) -> CompiledPricing:
+    """Compiled pricing for anything exposing the item pricing columns."""
+
+    return compiled_pricing_cache.get(item.id, item.updated_at, item.daily_price, item.pricing_rules)
+
+
+class PricingService:
+    """Quotes for renting an item over one or more date ranges."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.items = ItemRepository(db)
+
+    async def quote(self, item_id: UUID, ranges: Sequence[DateRange]) -> QuoteResponse:
+        row = await self.items.get_pricing_row(item_id)
+        if row is None:
+            raise LookupError("Item not found")
+        pricing = compile_pricing(row)
+        return QuoteResponse(
+            item_id=item_id,
+            quotes=pricing.quote_many([(r.start_date, r.end_date) for r in ranges]),
+        )
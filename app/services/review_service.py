@@ -2,23 +2,31 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlalchemy import func, select
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.booking import Booking
+from app.core.http_cache import ResourceVersion
 from app.models.enums import BookingStatus, UserRole
-from app.models.item import Item
-from app.models.user import User
+from app.repositories.booking_repository import BookingRepository
+from app.repositories.item_repository import ItemRepository
 from app.repositories.review_repository import ReviewRepository
-from app.schemas.review import ReviewCreate, ReviewListResponse, ReviewRead
+from app.repositories.user_repository import UserRepository
+from app.schemas.review import ReviewCreate, ReviewListResponse, ReviewRead, ReviewSummaryRead
+from app.services.item_service import invalidate_item_caches
+from app.services.review_summary_service import ReviewSummaryService
 
 
 class ReviewService:
     """Business logic for reviews and trust scores."""
 
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, redis: Redis | None = None) -> None:
         self.db = db
+        self.redis = redis
         self.reviews = ReviewRepository(db)
+        self.bookings = BookingRepository(db)
+        self.items = ItemRepository(db)
+        self.users = UserRepository(db)
+        self.summaries = ReviewSummaryService(db, redis) if redis is not None else None
 
     async def _ensure_booking_reviewable(
         self,
@@ -27,8 +35,8 @@ class ReviewService:
         author_id: UUID,
         item_id: UUID,
         target_user_id: UUID,
-    ) -> Booking:
-        booking = await self.db.get(Booking, booking_id)
+    ) -> None:
+        booking = await self.bookings.get_status_row(booking_id)
         if not booking:
             raise LookupError("Booking not found")
         if booking.status != BookingStatus.COMPLETED:
@@ -41,41 +49,6 @@ class ReviewService:
             raise ValueError("Target user is not part of this booking")
         if target_user_id == author_id:
             raise ValueError("Cannot review yourself")
-        return booking
-
-    async def _recalculate_item_rating(self, item_id: UUID) -> None:
-        stmt = (
-            select(func.avg(Item.reviews.property.mapper.class_.rating), func.count(Item.reviews.property.mapper.class_.id))
-            .select_from(Item)
-            .join(Item.reviews)
-            .where(Item.id == item_id)
-        )
-        res = await self.db.execute(stmt)
-        avg_rating, count = res.first() or (None, 0)
-        item = await self.db.get(Item, item_id)
-        if item:
-            item.avg_rating = float(avg_rating) if avg_rating is not None else None
-            item.rating_count = int(count or 0)
-            await self.db.flush()
-
-    async def _recalculate_user_trust(self, user_id: UUID) -> None:
-        stmt = (
-            select(func.avg(User.reviews_received.property.mapper.class_.rating), func.count(User.reviews_received.property.mapper.class_.id))
-            .select_from(User)
-            .join(User.reviews_received)
-            .where(User.id == user_id)
-        )
-        res = await self.db.execute(stmt)
-        avg_rating, count = res.first() or (None, 0)
-        user = await self.db.get(User, user_id)
-        if user:
-            user.avg_rating = float(avg_rating) if avg_rating is not None else None
-            user.rating_count = int(count or 0)
-            # Simple trust score heuristic: base on rating and volume
-            if user.avg_rating is not None:
-                volume_factor = min(user.rating_count / 10, 1)  # up to 10 reviews to reach full weight
-                user.trust_score = round(user.avg_rating * 20 * volume_factor, 2)  # 0–100
-            await self.db.flush()
 
     async def create_review(
         self,
@@ -100,14 +73,32 @@ class ReviewService:
             target_user_id=payload.target_user_id,
         )
 
-        # Recalculate aggregates
-        await self._recalculate_item_rating(payload.item_id)
-        await self._recalculate_user_trust(payload.target_user_id)
+        # O(1) aggregate updates; reconcile_rating_aggregates corrects rounding drift
+        rating_count = await self.items.add_rating(payload.item_id, payload.rating)
+        await self.users.add_rating(payload.target_user_id, payload.rating)
 
         await self.db.commit()
-        await self.db.refresh(review)
+        # add_rating changed the item's rating fields and updated_at
+        if self.redis is not None:
+            await invalidate_item_caches(self.redis, payload.item_id)
+        if self.summaries is not None:
+            await self.summaries.record_review(
+                item_id=review.item_id,
+                rating_count=rating_count,
+                review_id=review.id,
+                rating=review.rating,
+                comment=review.comment,
+                author_id=review.author_id,
+                created_at=review.created_at,
+            )
         return ReviewRead.model_validate(review)
 
+    async def item_reviews_version(self, item_id: UUID) -> ResourceVersion:
+        return ResourceVersion.of_collection(await self.reviews.list_version_for_item(item_id))
+
+    async def user_reviews_version(self, user_id: UUID) -> ResourceVersion:
+        return ResourceVersion.of_collection(await self.reviews.list_version_for_user(user_id))
+
     async def list_item_reviews(self, item_id: UUID, skip: int, limit: int) -> ReviewListResponse:
         total, reviews = await self.reviews.list_for_item(item_id=item_id, skip=skip, limit=limit)
         return ReviewListResponse(
@@ -115,6 +106,11 @@ class ReviewService:
             reviews=[ReviewRead.model_validate(r) for r in reviews],
         )
 
+    async def get_item_summary(self, item_id: UUID) -> ReviewSummaryRead:
+        if self.summaries is None:
+            raise RuntimeError("Review summaries require Redis")
+        return await self.summaries.get_summary(item_id)
+
     async def list_user_reviews(self, user_id: UUID, skip: int, limit: int) -> ReviewListResponse:
         total, reviews = await self.reviews.list_for_user(user_id=user_id, skip=skip, limit=limit)
         return ReviewListResponse(
@@ -122,3 +118,10 @@ class ReviewService:
             reviews=[ReviewRead.model_validate(r) for r in reviews],
         )
 
+    async def reconcile_rating_aggregates(self) -> dict[str, int]:
+        """Rebuild drifted item and user rating aggregates from the reviews table."""
+
+        items_fixed = await self.items.reconcile_ratings()
+        users_fixed = await self.users.reconcile_ratings()
+        await self.db.commit()
+        return {"items_fixed": items_fixed, "users_fixed": users_fixed}
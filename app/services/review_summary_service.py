@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TieredCache
+from app.core.config import get_settings
+from app.repositories.item_repository import ItemRepository
+from app.repositories.review_repository import ReviewRepository
+from app.schemas.review import ReviewSnippet, ReviewSummaryRead
+
+
+settings = get_settings()
+
+SUMMARY_HISTOGRAM_PREFIX = "reviews:summary:histogram:"
+SUMMARY_LATEST_PREFIX = "reviews:summary:latest:"
+# Highest item rating_count recorded so far, so a rebuild can tell its snapshot is already behind
+SUMMARY_RECORDED_PREFIX = "reviews:summary:recorded:"
+# Assembled ReviewSummaryRead JSON, in front of the histogram hash and snippet list
+SUMMARY_PREFIX = "reviews:summary:read:"
+STARS = (1, 2, 3, 4, 5)
+SNIPPET_MAX_CHARS = 280
+
+# Reviews are identified by the item's rating_count after each one: ItemRepository.add_rating
+# numbers them consecutively in commit order. The histogram hash keeps that number for
+# the last review it includes in its `count` field, so each review is applied exactly once.
+
+# Apply one new review to a cached summary. A review that is already counted is
+# skipped; one that arrives ahead of an earlier review drops the summary, and the
+# next read rebuilds it from the database. Uncached summaries are left alone.
+# KEYS[1] = histogram hash, KEYS[2] = latest snippets list, KEYS[3] = recorded marker
+# ARGV = rating_count, rating, snippet JSON, number of snippets kept, ttl
+_RECORD_REVIEW_SCRIPT = """
+local n = tonumber(ARGV[1])
+if n > tonumber(redis.call('GET', KEYS[3]) or '0') then
+    redis.call('SET', KEYS[3], n, 'EX', ARGV[5])
+end
+local count = redis.call('HGET', KEYS[1], 'count')
+if not count or n <= tonumber(count) then
+    return 0
+end
+if n > tonumber(count) + 1 then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return 0
+end
+redis.call('HINCRBY', KEYS[1], ARGV[2], 1)
+redis.call('HSET', KEYS[1], 'count', n)
+-- A rebuild may have listed this review already
+redis.call('LREM', KEYS[2], 0, ARGV[3])
+redis.call('LPUSH', KEYS[2], ARGV[3])
+redis.call('LTRIM', KEYS[2], 0, tonumber(ARGV[4]) - 1)
+return 1
+"""
+
+# Store a summary rebuilt from the database unless a review newer than its
+# snapshot has been recorded since, or an equally recent summary is cached.
+# KEYS as above; ARGV = count, ttl, then one histogram count per star, then snippet JSONs
+_STORE_REBUILD_SCRIPT = """
+local count = tonumber(ARGV[1])
+if tonumber(redis.call('GET', KEYS[3]) or '0') > count then
+    return 0
+end
+local cached = redis.call('HGET', KEYS[1], 'count')
+if cached and tonumber(cached) >= count then
+    return 0
+end
+redis.call('DEL', KEYS[1], KEYS[2])
+redis.call('HSET', KEYS[1], 'count', count, '1', ARGV[3], '2', ARGV[4], '3', ARGV[5], '4', ARGV[6], '5', ARGV[7])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+if #ARGV > 7 then
+    redis.call('RPUSH', KEYS[2], unpack(ARGV, 8))
+    redis.call('EXPIRE', KEYS[2], ARGV[2])
+end
+return 1
+"""
+
+
+summary_cache = TieredCache("reviews.summary", ttl_seconds=settings.review_summary_ttl_seconds)
+
+
+def _snippet_json(
+    *,
+    review_id: UUID,
+    rating: int,
+    comment: str | None,
+    author_id: UUID,
+    created_at: datetime,
+) -> str:
+    if comment is not None and len(comment) > SNIPPET_MAX_CHARS:
+        comment = comment[: SNIPPET_MAX_CHARS - 1].rstrip() + "…"
+    return ReviewSnippet(
+        id=review_id,
+        rating=rating,
+        comment=comment,
+        author_id=author_id,
+        created_at=created_at,
+    ).model_dump_json()
+
+
+def _summary(item_id: UUID, histogram: dict[int, int], snippets: list[str]) -> ReviewSummaryRead:
+    count = sum(histogram.values())
+    avg_rating = round(sum(star * n for star, n in histogram.items()) / count, 2) if count else None
+    return ReviewSummaryRead(
+        item_id=item_id,
+        count=count,
+        avg_rating=avg_rating,
+        histogram=histogram,
+        latest=[ReviewSnippet.model_validate_json(raw) for raw in snippets],
+    )
+
+
+class ReviewSummaryService:
+    """Per-item star histogram and latest review snippets, kept in Redis.
+
+    The histogram is a hash with one field per star and the snippets a capped
+    list, so a new review is applied with HINCRBY + LPUSH/LTRIM instead of
+    recounting the reviews table.
+    """
+
+    def __init__(self, db: AsyncSession, redis: Redis) -> None:
+        self.redis = redis
+        self.reviews = ReviewRepository(db)
+        self.items = ItemRepository(db)
+        self.latest_limit = settings.review_summary_latest
+        self.ttl_seconds = settings.review_summary_ttl_seconds
+        self._record_script = redis.register_script(_RECORD_REVIEW_SCRIPT)
+        self._store_rebuild_script = redis.register_script(_STORE_REBUILD_SCRIPT)
+
+    async def get_summary(self, item_id: UUID) -> ReviewSummaryRead:
+        async def load() -> str:
+            return (await self._assemble(item_id)).model_dump_json()
+
+        raw = await summary_cache.get(self.redis, f"{SUMMARY_PREFIX}{item_id}", load)
+        return ReviewSummaryRead.model_validate_json(raw)
+
+    async def _assemble(self, item_id: UUID) -> ReviewSummaryRead:
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hgetall(f"{SUMMARY_HISTOGRAM_PREFIX}{item_id}")
+        pipe.lrange(f"{SUMMARY_LATEST_PREFIX}{item_id}", 0, self.latest_limit - 1)
+        raw_histogram, snippets = await pipe.execute()
+        if "count" in raw_histogram:
+            histogram = {star: int(raw_histogram.get(str(star), 0)) for star in STARS}
+            return _summary(item_id, histogram, snippets)
+        return await self._rebuild(item_id)
+
+    async def _rebuild(self, item_id: UUID) -> ReviewSummaryRead:
+        if await self.items.get_availability_window(item_id) is None:
+            raise LookupError("Item not found")
+
+        counts = await self.reviews.rating_histogram(item_id)
+        histogram = {star: counts.get(star, 0) for star in STARS}
+        snippets = [
+            _snippet_json(
+                review_id=row.id,
+                rating=row.rating,
+                comment=row.comment,
+                author_id=row.author_id,
+                created_at=row.created_at,
+            )
+            for row in await self.reviews.list_latest_for_item(item_id, self.latest_limit)
+        ]
+
+        # Every star gets a field, so even an item without reviews has a cached hash
+        await self._store_rebuild_script(
+            keys=self._keys(item_id),
+            args=[sum(histogram.values()), self.ttl_seconds, *(histogram[star] for star in STARS), *snippets],
+        )
+        return _summary(item_id, histogram, snippets)
+
+    def _keys(self, item_id: UUID) -> list[str]:
+        return [
+            f"{SUMMARY_HISTOGRAM_PREFIX}{item_id}",
+            f"{SUMMARY_LATEST_PREFIX}{item_id}",
+            f"{SUMMARY_RECORDED_PREFIX}{item_id}",
+        ]
+
+    async def record_review(
+        self,
+        *,
+        item_id: UUID,
+        rating_count: int,
+        review_id: UUID,
+        rating: int,
+        comment: str | None,
+        author_id: UUID,
+        created_at: datetime,
+    ) -> None:
+        """Apply a committed review to the cached summary of its item.
+
+        `rating_count` is the item's count including this review, as returned
+        by `ItemRepository.add_rating`.
+        """
+
+        snippet = _snippet_json(
+            review_id=review_id,
+            rating=rating,
+            comment=comment,
+            author_id=author_id,
+            created_at=created_at,
+        )
+        await self._record_script(
+            keys=self._keys(item_id),
+            args=[rating_count, rating, snippet, self.latest_limit, self.ttl_seconds],
+        )
+        await summary_cache.invalidate(self.redis, f"{SUMMARY_PREFIX}{item_id}")
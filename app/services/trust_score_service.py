@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.repositories.review_repository import ReviewRepository
+from app.repositories.user_repository import UserRepository
+
+
+settings = get_settings()
+
+# Reviews are aggregated per user in age buckets of this many days
+AGE_BUCKET_DAYS = 30
+# trust_score is Numeric(4, 2)
+TRUST_SCORE_MAX = 99.99
+DISTRIBUTION_PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def compute_trust_scores(
+    user_codes: np.ndarray,
+    buckets: np.ndarray,
+    counts: np.ndarray,
+    rating_sums: np.ndarray,
+    *,
+    n_users: int,
+    prior_weight: float,
+    half_life_days: float,
+    bucket_days: int = AGE_BUCKET_DAYS,
+) -> np.ndarray:
+    """Bayesian-smoothed, recency-weighted trust scores on a 0-99.99 scale.
+
+    Inputs are parallel arrays with one entry per (user, age bucket). Each
+    bucket is weighted by `0.5 ** (age / half_life)`; the weighted mean rating
+    of every user is then shrunk towards the global weighted mean with the
+    strength of `prior_weight` reviews, so a handful of ratings cannot
+    produce an extreme score.
+    """
+
+    weights = np.power(0.5, buckets * bucket_days / half_life_days)
+    weighted_counts = np.bincount(user_codes, weights=counts * weights, minlength=n_users)
+    weighted_sums = np.bincount(user_codes, weights=rating_sums * weights, minlength=n_users)
+
+    prior_mean = weighted_sums.sum() / weighted_counts.sum()
+    smoothed = (prior_weight * prior_mean + weighted_sums) / (prior_weight + weighted_counts)
+    return np.round(np.minimum(smoothed * 20, TRUST_SCORE_MAX), 2)
+
+
+def score_distribution(scores: np.ndarray) -> dict[str, Any]:
+    """Summary of a score array: percentiles, mean and a 10-point histogram."""
+
+    if scores.size == 0:
+        return {"users": 0}
+    histogram, edges = np.histogram(scores, bins=10, range=(0, 100))
+    return {
+        "users": int(scores.size),
+        "mean": round(float(scores.mean()), 2),
+        "min": float(scores.min()),
+        "max": float(scores.max()),
+        "percentiles": {
+            f"p{p}": round(float(v), 2)
+            for p, v in zip(DISTRIBUTION_PERCENTILES, np.percentile(scores, DISTRIBUTION_PERCENTILES))
+        },
+        "histogram": {f"{int(lo)}-{int(hi)}": int(n) for lo, hi, n in zip(edges[:-1], edges[1:], histogram)},
+    }
+
+
+class TrustScoreService:
+    """Recomputes every user's trust score in one batch pass."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.reviews = ReviewRepository(db)
+        self.users = UserRepository(db)
+
+    async def _load_buckets(self) -> tuple[list[UUID], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        user_ids: list[UUID] = []
+        codes: list[int] = []
+        buckets: list[int] = []
+        counts: list[int] = []
+        sums: list[int] = []
+        rows = self.reviews.stream_rating_buckets(
+            bucket_days=AGE_BUCKET_DAYS,
+            chunk_size=settings.trust_score_write_batch_size,
+        )
+        # Rows are ordered by user, so a new code starts whenever the id changes
+        async for row in rows:
+            if not user_ids or user_ids[-1] != row.user_id:
+                user_ids.append(row.user_id)
+            codes.append(len(user_ids) - 1)
+            buckets.append(max(row.bucket, 0))
+            counts.append(row.review_count)
+            sums.append(row.rating_sum)
+        return (
+            user_ids,
+            np.asarray(codes, dtype=np.int64),
+            np.asarray(buckets, dtype=np.float64),
+            np.asarray(counts, dtype=np.float64),
+            np.asarray(sums, dtype=np.float64),
+        )
+
+    async def recompute_all(self) -> dict[str, Any]:
+        """Recompute, write back in batches and return run metrics plus the score distribution."""
+
+        started = time.perf_counter()
+        user_ids, codes, buckets, counts, sums = await self._load_buckets()
+        loaded = time.perf_counter()
+        if not user_ids:
+            return {"users": 0, "updated": 0}
+
+        scores = compute_trust_scores(
+            codes,
+            buckets,
+            counts,
+            sums,
+            n_users=len(user_ids),
+            prior_weight=settings.trust_score_prior_weight,
+            half_life_days=settings.trust_score_half_life_days,
+        )
+        computed = time.perf_counter()
+
+        updated = 0
+        batch_size = settings.trust_score_write_batch_size
+        score_list = scores.tolist()
+        for offset in range(0, len(user_ids), batch_size):
+            updated += await self.users.bulk_set_trust_scores(
+                user_ids[offset : offset + batch_size],
+                score_list[offset : offset + batch_size],
+            )
+            await self.db.commit()
+
+        return {
+            "updated": updated,
+            "load_ms": round((loaded - started) * 1000, 2),
+            "compute_ms": round((computed - loaded) * 1000, 2),
+            "write_ms": round((time.perf_counter() - computed) * 1000, 2),
+            "distribution": score_distribution(scores),
+        }
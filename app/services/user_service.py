@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from uuid import UUID
+
+import orjson
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TieredCache
+from app.core.config import get_settings
+from app.core.responses import dumps
+from app.repositories.user_repository import UserRepository
+from app.schemas.user import UserPublicRead
+
+
+settings = get_settings()
+
+USER_PUBLIC_PREFIX = "users:public:"
+
+user_public_cache = TieredCache("users.public", ttl_seconds=settings.user_public_cache_ttl_seconds)
+
+
+class UserService:
+    """Read access to other users' public profiles."""
+
+    def __init__(self, db: AsyncSession, redis: Redis | None = None) -> None:
+        self.db = db
+        self.redis = redis
+        self.users = UserRepository(db)
+
+    async def get_public_users_json(self, user_ids: Sequence[UUID]) -> bytes:
+        """`UserPublicListResponse` JSON for profiles in request order, served from the per-user cache where possible."""
+
+        async def load_missing(ids: list[UUID]) -> dict[UUID, str]:
+            return {
+                user.id: UserPublicRead.model_validate(user).model_dump_json()
+                for user in await self.users.list_by_ids(ids)
+            }
+
+        if self.redis is not None:
+            found = await user_public_cache.get_many(
+                self.redis,
+                prefix=USER_PUBLIC_PREFIX,
+                ids=user_ids,
+                load_missing=load_missing,
+            )
+        else:
+            found = await load_missing(list(user_ids))
+        return dumps(
+            {
+                "users": [orjson.Fragment(found[i]) for i in user_ids if i in found],
+                "missing": [i for i in user_ids if i not in found],
+            }
+        )
@@ -1,83 +1,83 @@
 from __future__ import annotations
 
-import asyncio
 import logging
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
-from app.db.session import AsyncSessionFactory
+from app.core.config import get_settings
 from app.models.booking import Booking
 from app.models.enums import BookingStatus
-from app.tasks.worker import celery_app
+from app.services.escrow_service import EscrowService
+from app.tasks.runtime import async_task, task_session
 from app.tasks.email_tasks import send_email_notification
 
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 
 async def _get_booking(booking_id: UUID) -> Booking | None:
-    async with AsyncSessionFactory() as session:
+    async with task_session() as session:
         return await session.get(Booking, booking_id)
 
 
-@celery_app.task(name="booking.send_created_email")
-def send_booking_created_email(booking_id: str) -> None:
+@async_task(name="booking.send_created_email")
+async def send_booking_created_email(booking_id: str) -> None:
     """Send confirmation emails when a booking is created."""
 
-    async def _inner() -> None:
-        booking = await _get_booking(UUID(booking_id))
-        if not booking:
-            return
-        # In a real system, we would join to user emails; for now we log.
-        logger.info(
-            "Booking created",
-            extra={
-                "booking_id": str(booking.id),
-                "item_id": str(booking.item_id),
-                "renter_id": str(booking.renter_id),
-                "owner_id": str(booking.owner_id),
-            },
-        )
-
-    asyncio.run(_inner())
-
-
-@celery_app.task(name="booking.send_start_reminder")
-def send_booking_start_reminder(booking_id: str) -> None:
+    booking = await _get_booking(UUID(booking_id))
+    if not booking:
+        return
+    # In a real system, we would join to user emails; for now we log.
+    logger.info(
+        "Booking created",
+        extra={
+            "booking_id": str(booking.id),
+            "item_id": str(booking.item_id),
+            "renter_id": str(booking.renter_id),
+            "owner_id": str(booking.owner_id),
+        },
+    )
+
+
+@async_task(name="booking.send_start_reminder")
+async def send_booking_start_reminder(booking_id: str) -> None:
     """Reminder shortly before a booking becomes active."""
 
-    async def _inner() -> None:
-        booking = await _get_booking(UUID(booking_id))
-        if not booking or booking.status not in (BookingStatus.APPROVED, BookingStatus.ACTIVE):
-            return
+    booking = await _get_booking(UUID(booking_id))
+    if not booking or booking.status not in (BookingStatus.APPROVED, BookingStatus.ACTIVE):
+        return
+    logger.info(
+        "Booking reminder",
+        extra={
+            "booking_id": str(booking.id),
+            "start_date": booking.start_date.isoformat(),
+        },
+    )
+
+
+@async_task(name="booking.auto_release_deposit")
+async def auto_release_deposit(booking_id: str) -> None:
+    """Release the deposit of a single completed booking past the dispute window.
+
+    Deposits are released in bulk by `escrow.release_due_deposits`; this task is
+    kept for messages that were scheduled per booking and goes through the same
+    batch path, so it is a no-op for escrows that were already released.
+    """
+
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.escrow_dispute_window_hours)
+    async with task_session() as session:
+        rows = await EscrowService(session).release_due_batch(
+            completed_before=cutoff,
+            batch_size=1,
+            booking_ids=[UUID(booking_id)],
+        )
+    for row in rows:
         logger.info(
-            "Booking reminder",
+            "Auto-released deposit",
             extra={
-                "booking_id": str(booking.id),
-                "start_date": booking.start_date.isoformat(),
+                "booking_id": str(row.booking_id),
+                "escrow_id": str(row.id),
+                "amount_released": str(row.amount_released),
             },
         )
-
-    asyncio.run(_inner())
-
-
-@celery_app.task(name="booking.auto_release_deposit")
-def auto_release_deposit(booking_id: str) -> None:
-    """Automatically release deposit after a delay if booking is completed and no disputes."""
-
-    async def _inner() -> None:
-        booking = await _get_booking(UUID(booking_id))
-        if not booking or booking.status != BookingStatus.COMPLETED:
-            return
-
-        if booking.escrow_record and booking.escrow_record.amount_released == 0:
-            # Simulate auto-release; in a real system we'd call EscrowService
-            logger.info(
-                "Auto-releasing deposit",
-                extra={
-                    "booking_id": str(booking.id),
-                    "escrow_id": str(booking.escrow_record.id),
-                },
-            )
-
-    asyncio.run(_inner())
-
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+
+from app.core.config import get_settings
+from app.services.escrow_service import EscrowService
+from app.tasks.runtime import async_task, task_session
+
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+@async_task(name="escrow.release_due_deposits")
+async def release_due_deposits() -> dict[str, Any]:
+    """Release every HELD deposit whose booking completed before the dispute window.
+
+    Runs periodically from celery beat and drains the backlog in set-based
+    batches, logging per-batch metrics.
+    """
+
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.escrow_dispute_window_hours)
+    batch_size = settings.escrow_release_batch_size
+    batches = 0
+    released_count = 0
+    released_amount = Decimal("0")
+    started = time.perf_counter()
+
+    async with task_session() as session:
+        service = EscrowService(session)
+        while True:
+            batch_started = time.perf_counter()
+            rows = await service.release_due_batch(completed_before=cutoff, batch_size=batch_size)
+            if not rows:
+                break
+
+            batch_amount = sum((row.amount_released for row in rows), Decimal("0"))
+            batches += 1
+            released_count += len(rows)
+            released_amount += batch_amount
+            logger.info(
+                "Escrow release batch",
+                extra={
+                    "batch": batches,
+                    "released": len(rows),
+                    "amount_released": str(batch_amount),
+                    "duration_ms": round((time.perf_counter() - batch_started) * 1000, 2),
+                },
+            )
+            if len(rows) < batch_size:
+                break
+
+    summary = {
+        "cutoff": cutoff.isoformat(),
+        "batches": batches,
+        "released": released_count,
+        "amount_released": str(released_amount),
+        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+    logger.info("Escrow release run finished", extra=summary)
+    return summary
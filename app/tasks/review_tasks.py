@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from app.services.review_service import ReviewService
+from app.tasks.runtime import async_task, task_session
+
+
+logger = logging.getLogger(__name__)
+
+
+@async_task(name="reviews.reconcile_rating_aggregates")
+async def reconcile_rating_aggregates() -> dict[str, Any]:
+    """Correct drift in the incrementally maintained rating aggregates."""
+
+    started = time.perf_counter()
+    async with task_session() as session:
+        summary: dict[str, Any] = await ReviewService(session).reconcile_rating_aggregates()
+    summary["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    logger.info("Rating aggregates reconciled", extra=summary)
+    return summary
@@ -0,0 +1,96 @@
+"""Per-process async runtime for Celery workers.
+
+Each worker process owns one long-lived event loop and one async engine bound
+to it, so pooled asyncpg connections survive across tasks instead of being
+re-established on every `asyncio.run(...)`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from celery.signals import worker_process_init, worker_process_shutdown
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.db.session import get_engine
+from app.tasks.worker import celery_app
+
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def _init_runtime() -> None:
+    global _loop, _engine, _session_factory
+
+    _loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_loop)
+    _engine = get_engine()
+    _session_factory = async_sessionmaker(
+        bind=_engine,
+        expire_on_commit=False,
+        autoflush=False,
+        autocommit=False,
+    )
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**_: Any) -> None:
+    """Create the loop and engine after fork so nothing is shared with the parent."""
+
+    _init_runtime()
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(**_: Any) -> None:
+    global _loop, _engine, _session_factory
+
+    if _loop is None:
+        return
+    if _engine is not None:
+        _loop.run_until_complete(_engine.dispose())
+    _loop.close()
+    _loop = None
+    _engine = None
+    _session_factory = None
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the worker's persistent event loop."""
+
+    if _loop is None:
+        # Solo pool, eager mode or ad-hoc scripts never fire worker_process_init.
+        _init_runtime()
+    assert _loop is not None
+    return _loop.run_until_complete(coro)
+
+
+def task_session() -> AsyncSession:
+    """Return a new session bound to the worker's engine."""
+
+    if _session_factory is None:
+        _init_runtime()
+    assert _session_factory is not None
+    return _session_factory()
+
+
+def async_task(*task_args: Any, **task_kwargs: Any) -> Callable[[Callable[..., Awaitable[T]]], Any]:
+    """Register an `async def` as a Celery task executed on the persistent loop.
+
+    Accepts the same arguments as `celery_app.task`.
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Any:
+        @functools.wraps(func)
+        def runner(*args: Any, **kwargs: Any) -> T:
+            return run_async(func(*args, **kwargs))
+
+        return celery_app.task(*task_args, **task_kwargs)(runner)
+
+    return decorator
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from app.core.config import get_settings
+from app.services.owner_stats_service import OwnerStatsService
+from app.tasks.runtime import async_task, task_session
+
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+@async_task(name="stats.refresh_owner_rollups")
+async def refresh_owner_rollups() -> dict[str, Any]:
+    """Fold booking and escrow changes since the last run into the daily rollups.
+
+    The first run has no watermark and backfills the whole history.
+    """
+
+    until = datetime.now(timezone.utc) - timedelta(seconds=settings.owner_stats_refresh_lag_seconds)
+    started = time.perf_counter()
+
+    async with task_session() as session:
+        windows = await OwnerStatsService(session).refresh_rollups(until=until)
+
+    summary = {
+        "until": until.isoformat(),
+        "skipped": windows is None,
+        "windows": windows or 0,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+    logger.info("Owner stats rollup refreshed", extra=summary)
+    return summary
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from app.services.trust_score_service import TrustScoreService
+from app.tasks.runtime import async_task, task_session
+
+
+logger = logging.getLogger(__name__)
+
+
+@async_task(name="users.recompute_trust_scores")
+async def recompute_trust_scores() -> dict[str, Any]:
+    """Nightly batch recomputation of every reviewed user's trust score."""
+
+    async with task_session() as session:
+        summary = await TrustScoreService(session).recompute_all()
+    logger.info("Trust scores recomputed", extra=summary)
+    return summary
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from celery import Celery
+from celery.schedules import crontab
 
 from app.core.config import get_settings
 
@@ -23,7 +24,29 @@ celery_app.conf.update(
         "app.tasks.worker",
         "app.tasks.email_tasks",
         "app.tasks.booking_tasks",
+        "app.tasks.escrow_tasks",
+        "app.tasks.stats_tasks",
+        "app.tasks.review_tasks",
+        "app.tasks.trust_tasks",
     ],
+    beat_schedule={
+        "escrow-release-due-deposits": {
+            "task": "escrow.release_due_deposits",
+            "schedule": float(settings.escrow_release_interval_seconds),
+        },
+        "stats-refresh-owner-rollups": {
+            "task": "stats.refresh_owner_rollups",
+            "schedule": float(settings.owner_stats_refresh_interval_seconds),
+        },
+        "reviews-reconcile-rating-aggregates": {
+            "task": "reviews.reconcile_rating_aggregates",
+            "schedule": float(settings.rating_reconcile_interval_seconds),
+        },
+        "users-recompute-trust-scores": {
+            "task": "users.recompute_trust_scores",
+            "schedule": crontab(hour=settings.trust_score_recompute_hour_utc, minute=0),
+        },
+    },
 )
 
 
@@ -0,0 +1,4 @@
+import os
+
+# Settings require a secret; tests and benchmarks never issue real tokens
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
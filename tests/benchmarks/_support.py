@@ -0,0 +1,49 @@
+"""Shared plumbing for the benchmark scripts in this package.
+
+Benchmarks run against the same disposable database as the test suite
+(TEST_DATABASE_URL) and rebuild its schema on start.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import sys
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from unittest import mock
+
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.models import Base
+from app.tasks import booking_tasks
+
+
+async def fresh_engine(*, pool_size: int = 5) -> AsyncEngine:
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        sys.exit("Set TEST_DATABASE_URL to a disposable Postgres database (its schema is dropped).")
+    engine = create_async_engine(url, pool_size=pool_size, max_overflow=0)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    return engine
+
+
+@contextmanager
+def without_task_dispatch() -> Iterator[None]:
+    """Skip the Celery sends in `create_booking`; the broker round trip is not what we measure."""
+
+    with (
+        mock.patch.object(booking_tasks.send_booking_created_email, "delay"),
+        mock.patch.object(booking_tasks.send_booking_start_reminder, "apply_async"),
+    ):
+        yield
+
+
+def describe_latencies(seconds: Sequence[float]) -> str:
+    if not seconds:
+        return "no samples"
+    ms = sorted(s * 1000 for s in seconds)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    return f"p50 {statistics.median(ms):.2f} ms  p95 {p95:.2f} ms  max {ms[-1]:.2f} ms  (n={len(ms)})"
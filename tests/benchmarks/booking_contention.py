@@ -0,0 +1,129 @@
+"""Bookings/sec on a single hot item under concurrent requests.
+
+    TEST_DATABASE_URL=postgresql+asyncpg://... python -m tests.benchmarks.booking_contention --workers 32 --seconds 10
+
+Every worker books short random ranges of the same item through
+`BookingService.create_booking`, one session per attempt as a request would.
+Overlaps are refused with ConflictError, either by the pre-check or by the
+`ex_bookings_item_no_overlap` constraint when two requests race. The run
+ends by checking that no two live bookings of the item overlap.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.exceptions import ConflictError
+from app.models.enums import UserRole
+from app.schemas.booking import BookingCreate
+from app.services.booking_service import BookingService
+from tests.benchmarks._support import describe_latencies, fresh_engine, without_task_dispatch
+from tests.factories import make_item, make_user
+
+
+OVERLAPPING_LIVE_BOOKINGS = text(
+    """
+    SELECT count(*) FROM bookings a JOIN bookings b
+      ON a.item_id = b.item_id AND a.id < b.id
+     AND daterange(a.start_date, a.end_date, '[]') && daterange(b.start_date, b.end_date, '[]')
+    WHERE a.status IN ('REQUESTED', 'APPROVED', 'ACTIVE')
+      AND b.status IN ('REQUESTED', 'APPROVED', 'ACTIVE')
+    """
+)
+
+
+@dataclass
+class Tally:
+    booked: int = 0
+    conflicts: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+
+async def worker(
+    sessions: async_sessionmaker,
+    *,
+    item_id: UUID,
+    renter_ids: list[UUID],
+    first_day: date,
+    horizon_days: int,
+    max_nights: int,
+    deadline: float,
+    tally: Tally,
+) -> None:
+    while time.perf_counter() < deadline:
+        start = first_day + timedelta(days=random.randrange(horizon_days))
+        payload = BookingCreate(
+            item_id=item_id,
+            start_date=start,
+            end_date=start + timedelta(days=random.randrange(max_nights)),
+        )
+        began = time.perf_counter()
+        async with sessions() as session:
+            try:
+                await BookingService(session).create_booking(random.choice(renter_ids), payload)
+            except ConflictError:
+                tally.conflicts += 1
+                continue
+        tally.booked += 1
+        tally.latencies.append(time.perf_counter() - began)
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = await fresh_engine(pool_size=args.workers)
+    sessions = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+
+    async with sessions() as session:
+        owner = await make_user(session, role=UserRole.OWNER)
+        item = await make_item(session, owner)
+        renter_ids = [(await make_user(session)).id for _ in range(args.workers)]
+        await session.commit()
+
+    tally = Tally()
+    deadline = time.perf_counter() + args.seconds
+    with without_task_dispatch():
+        await asyncio.gather(
+            *(
+                worker(
+                    sessions,
+                    item_id=item.id,
+                    renter_ids=renter_ids,
+                    first_day=date.today() + timedelta(days=1),
+                    horizon_days=args.horizon_days,
+                    max_nights=args.max_nights,
+                    deadline=deadline,
+                    tally=tally,
+                )
+                for _ in range(args.workers)
+            )
+        )
+
+    async with engine.connect() as conn:
+        overlaps = (await conn.execute(OVERLAPPING_LIVE_BOOKINGS)).scalar_one()
+    await engine.dispose()
+
+    attempts = tally.booked + tally.conflicts
+    print(f"workers={args.workers} seconds={args.seconds} horizon={args.horizon_days}d")
+    print(f"bookings/sec   {tally.booked / args.seconds:.1f}  ({tally.booked} booked)")
+    print(f"attempts/sec   {attempts / args.seconds:.1f}  ({tally.conflicts} conflicts)")
+    print(f"booked latency {describe_latencies(tally.latencies)}")
+    print(f"overlapping live bookings: {overlaps}")
+    if overlaps:
+        raise SystemExit("double booking detected")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--horizon-days", type=int, default=3650, help="spread of start dates")
+    parser.add_argument("--max-nights", type=int, default=3)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,68 @@
+"""Latency of `BookingService.create_booking`, one request at a time.
+
+    TEST_DATABASE_URL=postgresql+asyncpg://... python -m tests.benchmarks.create_booking_latency --bookings 500
+
+Books consecutive, non-overlapping days of one item (with a security
+deposit, so every booking also writes its escrow record). Prints p50/p95
+and the number of SQL statements per booking. Latency is reported for the
+first and last quarter of the run separately: it should not grow with the
+number of bookings the item already has.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models.enums import UserRole
+from app.schemas.booking import BookingCreate
+from app.services.booking_service import BookingService
+from tests.benchmarks._support import describe_latencies, fresh_engine, without_task_dispatch
+from tests.conftest import StatementLog
+from tests.factories import make_item, make_user
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = await fresh_engine()
+    sessions = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+
+    async with sessions() as session:
+        owner = await make_user(session, role=UserRole.OWNER)
+        renter = await make_user(session)
+        item = await make_item(session, owner)
+        await session.commit()
+
+    statements = StatementLog()
+    event.listen(engine.sync_engine, "before_cursor_execute", statements)
+    first_day = date.today() + timedelta(days=1)
+    latencies: list[float] = []
+    with without_task_dispatch():
+        for n in range(args.warmup + args.bookings):
+            day = first_day + timedelta(days=n)
+            payload = BookingCreate(item_id=item.id, start_date=day, end_date=day)
+            if n == args.warmup:
+                statements.clear()
+            began = time.perf_counter()
+            async with sessions() as session:
+                await BookingService(session).create_booking(renter.id, payload)
+            if n >= args.warmup:
+                latencies.append(time.perf_counter() - began)
+    await engine.dispose()
+
+    quarter = max(1, len(latencies) // 4)
+    print(f"create_booking  {describe_latencies(latencies)}")
+    print(f"first quarter   {describe_latencies(latencies[:quarter])}")
+    print(f"last quarter    {describe_latencies(latencies[-quarter:])}")
+    print(f"statements/booking {len(statements) / args.bookings:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bookings", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,119 @@
+"""Throughput and latency of `GET /items?limit=100` through the full ASGI app.
+
+    TEST_DATABASE_URL=postgresql+asyncpg://... python -m tests.benchmarks.item_list --requests 500
+
+Seeds items across a few categories and requests full 100-item pages
+in-process via httpx. Redis is replaced by None, so every request takes
+the uncached path: column projection, one validation pass and raw JSON
+bytes. For comparison, the same page is also built the ORM way: load
+entities, `ItemRead.model_validate` each one, then encode the response
+model as FastAPI does for a `response_model` return.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from decimal import Decimal
+
+import httpx
+import structlog
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import lazyload, selectinload
+
+from app.core.responses import dumps
+from app.db.redis import get_redis
+from app.db.session import get_db_session
+from app.main import create_app
+from app.models.enums import UserRole
+from app.models.item import Item
+from app.repositories.category_repository import CategoryRepository
+from app.schemas.item import ItemListResponse, ItemRead
+from tests.benchmarks._support import describe_latencies, fresh_engine
+from tests.factories import make_item, make_user
+
+
+PAGE_SIZE = 100
+
+
+async def orm_page(session) -> bytes:
+    total = (await session.execute(select(func.count()).select_from(Item).where(Item.is_active))).scalar_one()
+    res = await session.execute(
+        select(Item)
+        .where(Item.is_active)
+        .options(lazyload("*"), selectinload(Item.category).lazyload("*"))
+        .order_by(Item.created_at.desc())
+        .limit(PAGE_SIZE)
+    )
+    page = ItemListResponse(total=total, items=[ItemRead.model_validate(item) for item in res.scalars()])
+    # What FastAPI does with a returned model under response_model
+    return dumps(jsonable_encoder(ItemListResponse.model_validate(page.model_dump())))
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = await fresh_engine()
+    sessions = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+
+    async with sessions() as session:
+        owner = await make_user(session, role=UserRole.OWNER)
+        categories = [
+            await CategoryRepository(session).create(f"Category {n}", f"category-{n}", None) for n in range(5)
+        ]
+        for n in range(args.items):
+            await make_item(
+                session,
+                owner,
+                title=f"Item {n}",
+                description="A well-kept item available for short rentals. " * 3,
+                daily_price=Decimal("12.50"),
+                category_id=categories[n % len(categories)].id,
+            )
+        await session.commit()
+
+    async def db_session():
+        async with sessions() as session:
+            yield session
+
+    async def no_redis():
+        yield None
+
+    app = create_app()
+    app.dependency_overrides[get_db_session] = db_session
+    app.dependency_overrides[get_redis] = no_redis
+    # Keep per-request access logs off the benchmark's stdout
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    latencies: list[float] = []
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for n in range(args.warmup + args.requests):
+            began = time.perf_counter()
+            response = await client.get("/items", params={"limit": PAGE_SIZE})
+            response.raise_for_status()
+            if n >= args.warmup:
+                latencies.append(time.perf_counter() - began)
+        assert len(response.json()["items"]) == PAGE_SIZE
+
+    orm_latencies: list[float] = []
+    for n in range(args.warmup + args.requests):
+        began = time.perf_counter()
+        async with sessions() as session:
+            await orm_page(session)
+        if n >= args.warmup:
+            orm_latencies.append(time.perf_counter() - began)
+    await engine.dispose()
+
+    print(f"items={args.items} limit={PAGE_SIZE}")
+    print(f"GET /items        {describe_latencies(latencies)}  {len(latencies) / sum(latencies):.0f} req/s")
+    print(f"ORM page (no HTTP) {describe_latencies(orm_latencies)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,72 @@
+"""Database tests run against a disposable Postgres named by TEST_DATABASE_URL.
+
+The schema is dropped and recreated for every test, so never point it at real
+data. The server needs the btree_gist extension (Postgres contrib) for the
+bookings exclusion constraint. Without TEST_DATABASE_URL these tests are skipped.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import AsyncIterator, Iterator
+
+import fakeredis
+import pytest
+import pytest_asyncio
+from redis.asyncio import Redis
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from app.models import Base
+
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+class StatementLog:
+    """Records every SQL statement sent to the database (`before_cursor_execute`)."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def clear(self) -> None:
+        self.statements.clear()
+
+
+@pytest_asyncio.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session(engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    async with AsyncSession(engine, expire_on_commit=False, autoflush=False) as session:
+        yield session
+
+
+@pytest.fixture
+def statements(engine: AsyncEngine) -> Iterator[StatementLog]:
+    log = StatementLog()
+    event.listen(engine.sync_engine, "before_cursor_execute", log)
+    yield log
+    event.remove(engine.sync_engine, "before_cursor_execute", log)
+
+
+@pytest_asyncio.fixture
+async def redis() -> AsyncIterator[Redis]:
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    yield client
+    await client.aclose()
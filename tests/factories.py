@@ -0,0 +1,42 @@
+"""Minimal rows for tests and benchmarks, written through the repositories."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.enums import UserRole
+from app.models.item import Item
+from app.models.user import User
+from app.repositories.item_repository import ItemRepository
+from app.repositories.user_repository import UserRepository
+
+
+async def make_user(session: AsyncSession, *, role: UserRole = UserRole.RENTER) -> User:
+    return await UserRepository(session).create_user(
+        email=f"{uuid4().hex}@example.com",
+        hashed_password="not-a-real-hash",
+        full_name=None,
+        role=role,
+    )
+
+
+async def make_item(session: AsyncSession, owner: User, **overrides: Any) -> Item:
+    values: dict[str, Any] = {
+        "owner_id": owner.id,
+        "title": "Cordless drill",
+        "description": None,
+        "daily_price": Decimal("10.00"),
+        "security_deposit": Decimal("50.00"),
+        "location_lat": 52.52,
+        "location_lng": 13.40,
+        "location_text": None,
+        "available_from": None,
+        "available_until": None,
+        "category_id": None,
+    }
+    values.update(overrides)
+    return await ItemRepository(session).create_item(**values)
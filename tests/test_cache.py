@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID, uuid4
+
+from app.core.cache import TieredCache
+
+
+async def test_concurrent_misses_share_one_load(redis):
+    cache = TieredCache("test.single_flight", ttl_seconds=60)
+    loads = 0
+
+    async def load() -> str:
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)
+        return '{"v": 1}'
+
+    values = await asyncio.gather(*(cache.get(redis, "k", load) for _ in range(20)))
+
+    assert loads == 1
+    assert set(values) == {'{"v": 1}'}
+    assert await redis.get("k") == '{"v": 1}'
+
+
+async def test_load_racing_an_invalidation_is_not_stored(redis):
+    cache = TieredCache("test.fence", ttl_seconds=60)
+    loads = 0
+
+    async def load() -> str:
+        nonlocal loads
+        loads += 1
+        if loads == 1:
+            # A write lands and invalidates while this load still holds the old value
+            await cache.invalidate(redis, "k")
+            return "old"
+        return "new"
+
+    assert await cache.get(redis, "k", load) == "old"
+    assert await redis.get("k") is None
+    assert await cache.get(redis, "k", load) == "new"
+    assert await redis.get("k") == "new"
+    assert cache.metrics["fenced"] == 1
+
+
+async def test_get_many_loads_only_missing_ids_and_stores_them_like_get(redis):
+    cache = TieredCache("test.get_many", ttl_seconds=60, stale_seconds=5)
+    a, b, c = uuid4(), uuid4(), uuid4()
+    await redis.set(f"p:{a}", "a-cached", ex=65)
+    requested: list[list[UUID]] = []
+
+    async def load_missing(ids: list[UUID]) -> dict[UUID, str]:
+        requested.append(ids)
+        # c does not exist
+        return {i: f"{i}-loaded" for i in ids if i != c}
+
+    found = await cache.get_many(redis, prefix="p:", ids=[a, b, c], load_missing=load_missing)
+
+    assert found == {a: "a-cached", b: f"{b}-loaded"}
+    assert requested == [[b, c]]
+    assert await redis.get(f"p:{b}") == f"{b}-loaded"
+    # Same TTL plus stale tail as a single `get` store
+    assert 60 < await redis.ttl(f"p:{b}") <= 65
+
+    # Now served from the local layer without loading
+    assert await cache.get_many(redis, prefix="p:", ids=[a, b], load_missing=load_missing) == {
+        a: "a-cached",
+        b: f"{b}-loaded",
+    }
+    assert len(requested) == 1
+    assert await cache.get(redis, f"p:{b}", load_missing) == f"{b}-loaded"
+
+
+async def test_get_many_load_racing_an_invalidation_is_not_stored(redis):
+    cache = TieredCache("test.get_many_fence", ttl_seconds=60)
+    a = uuid4()
+
+    async def load_missing(ids: list[UUID]) -> dict[UUID, str]:
+        await cache.invalidate(redis, f"p:{a}")
+        return {a: "old"}
+
+    assert await cache.get_many(redis, prefix="p:", ids=[a], load_missing=load_missing) == {a: "old"}
+    assert await redis.get(f"p:{a}") is None
+    assert cache.metrics["fenced"] == 1
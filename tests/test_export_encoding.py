@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+from app.core.responses import dumps
+from app.models.enums import BookingStatus
+from app.services.export_service import ExportFormat, encode_rows
+
+
+ROW = (UUID(int=1), Decimal("12.50"), datetime(2026, 1, 1, 9, 30, tzinfo=timezone.utc), BookingStatus.APPROVED, None)
+COLUMNS = ["id", "total_price", "created_at", "status", "notes"]
+
+
+async def rows(count: int):
+    for _ in range(count):
+        yield ROW
+
+
+async def encode(fmt: ExportFormat, count: int = 2) -> bytes:
+    return b"".join([chunk async for chunk in encode_rows(rows(count), COLUMNS, fmt)])
+
+
+async def test_ndjson_lines_match_api_encoding():
+    body = await encode(ExportFormat.NDJSON)
+
+    line = dumps(dict(zip(COLUMNS, ROW)))
+    assert body == line + b"\n" + line + b"\n"
+    assert line == (
+        b'{"id":"00000000-0000-0000-0000-000000000001","total_price":"12.50",'
+        b'"created_at":"2026-01-01T09:30:00+00:00","status":"APPROVED","notes":null}'
+    )
+
+
+async def test_csv_has_header_and_blank_nulls():
+    body = await encode(ExportFormat.CSV, count=1)
+
+    assert body.decode().splitlines() == [
+        "id,total_price,created_at,status,notes",
+        "00000000-0000-0000-0000-000000000001,12.50,2026-01-01T09:30:00+00:00,APPROVED,",
+    ]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.core.idempotency import REPLAYED_HEADER, IdempotencyMiddleware
+from app.core.security import create_access_token
+
+
+@pytest.fixture
+def calls() -> list[dict]:
+    return []
+
+
+@pytest.fixture
+def api(redis, calls):
+    app = FastAPI()
+    app.state.before_return = None
+
+    @app.post("/things")
+    async def create_thing(payload: dict) -> dict:
+        calls.append(payload)
+        n = len(calls)
+        if app.state.before_return is not None:
+            await app.state.before_return()
+        return {"n": n}
+
+    app.add_middleware(IdempotencyMiddleware, redis=redis, ttl_seconds=3600, lock_ttl_seconds=60)
+    return app
+
+
+@pytest.fixture
+async def client(api):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=api), base_url="http://test") as client:
+        yield client
+
+
+def headers(token: str, key: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}", "Idempotency-Key": key}
+
+
+async def test_retry_with_a_refreshed_token_is_replayed(client, calls):
+    user_id = str(uuid4())
+    first = await client.post("/things", json={"a": 1}, headers=headers(create_access_token(subject=user_id), "k1"))
+    # A refreshed access token for the same user has a new jti and expiry
+    retry = await client.post("/things", json={"a": 1}, headers=headers(create_access_token(subject=user_id), "k1"))
+
+    assert len(calls) == 1
+    assert retry.headers[REPLAYED_HEADER] == "true"
+    assert retry.content == first.content == b'{"n":1}'
+
+
+async def test_same_key_from_another_user_runs_separately(client, calls):
+    for _ in range(2):
+        response = await client.post(
+            "/things", json={"a": 1}, headers=headers(create_access_token(subject=str(uuid4())), "k1")
+        )
+        assert REPLAYED_HEADER not in response.headers
+
+    assert len(calls) == 2
+
+
+async def test_unverified_token_is_scoped_to_the_raw_header(client, calls):
+    for token in ("not-a-jwt", "another-garbage-token"):
+        await client.post("/things", json={"a": 1}, headers=headers(token, "k1"))
+
+    assert len(calls) == 2
+
+
+async def test_expired_claim_taken_over_by_a_retry_is_not_overwritten(api, client, redis, calls):
+    token = create_access_token(subject=str(uuid4()))
+    retry: list[httpx.Response] = []
+
+    async def claim_expires_and_retry_arrives() -> None:
+        api.state.before_return = None
+        for key in await redis.keys("idempotency:*"):
+            await redis.delete(key)
+        retry.append(await client.post("/things", json={"a": 1}, headers=headers(token, "k1")))
+
+    api.state.before_return = claim_expires_and_retry_arrives
+    first = await client.post("/things", json={"a": 1}, headers=headers(token, "k1"))
+    replay = await client.post("/things", json={"a": 1}, headers=headers(token, "k1"))
+
+    # The retry's record stands: the slow first request did not clobber it
+    assert first.content == b'{"n":1}'
+    assert retry[0].content == b'{"n":2}'
+    assert replay.content == b'{"n":2}'
+    assert replay.headers[REPLAYED_HEADER] == "true"
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import update
+
+from app.api.routes.items import router
+from app.db.redis import get_redis
+from app.db.session import get_db_session
+from app.models.enums import UserRole
+from app.models.item import Item
+from app.schemas.item import ItemCreate
+from app.services.item_service import ITEM_LIST_PREFIX, ItemService, invalidate_item_caches, item_list_cache
+from tests.factories import make_item, make_user
+
+
+@pytest.fixture
+async def client(session, redis):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db_session] = lambda: session
+    app.dependency_overrides[get_redis] = lambda: redis
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def test_item_etag_describes_the_body_served_from_the_cache(session, redis, client):
+    owner = await make_user(session, role=UserRole.OWNER)
+    item = await make_item(session, owner, title="Drill")
+    await session.commit()
+
+    first = await client.get(f"/items/{item.id}")
+    etag = first.headers["etag"]
+
+    # A write that has not invalidated the cache yet: the cached body and its ETag still agree
+    await session.execute(update(Item).where(Item.id == item.id).values(title="Hammer"))
+    await session.commit()
+    cached = await client.get(f"/items/{item.id}")
+    assert cached.json()["title"] == "Drill"
+    assert cached.headers["etag"] == etag
+
+    await invalidate_item_caches(redis, item.id)
+    revalidated = await client.get(f"/items/{item.id}", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 200
+    assert revalidated.json()["title"] == "Hammer"
+    assert revalidated.headers["etag"] != etag
+
+    not_modified = await client.get(f"/items/{item.id}", headers={"If-None-Match": revalidated.headers["etag"]})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["last-modified"] == revalidated.headers["last-modified"]
+
+
+async def test_create_item_invalidates_cached_lists(session, redis, client):
+    owner = await make_user(session, role=UserRole.OWNER)
+    await make_item(session, owner)
+    await session.commit()
+
+    before = await client.get("/items", params={"owner_id": str(owner.id)})
+    assert before.json()["total"] == 1
+
+    await ItemService(session, redis).create_item(
+        owner.id,
+        ItemCreate(title="Ladder", daily_price="5.00", security_deposit="20.00", location_lat=52.5, location_lng=13.4),
+    )
+    after = await client.get(
+        "/items", params={"owner_id": str(owner.id)}, headers={"If-None-Match": before.headers["etag"]}
+    )
+    assert after.status_code == 200
+    assert after.json()["total"] == 2
+
+
+async def test_list_revalidation_skips_the_page_query(session, redis, client, statements):
+    owner = await make_user(session, role=UserRole.OWNER)
+    await make_item(session, owner)
+    await session.commit()
+    params = {"owner_id": str(owner.id)}
+
+    etag = (await client.get("/items", params=params)).headers["etag"]
+
+    # Cached page: the stored ETag answers without the database
+    statements.clear()
+    cached = await client.get("/items", params=params, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert len(statements) == 0
+
+    # Evicted page: only the version lookup runs
+    await item_list_cache.invalidate_prefix(redis, ITEM_LIST_PREFIX)
+    statements.clear()
+    evicted = await client.get("/items", params=params, headers={"If-None-Match": etag})
+    assert evicted.status_code == 304
+    assert evicted.headers["etag"] == etag
+    assert len(statements) == 1
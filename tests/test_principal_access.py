@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.deps.auth import get_current_active_user, get_current_user
+from app.core.security import TokenType
+from app.models.enums import UserRole
+from app.models.user import User
+from app.schemas.auth import TokenPayload
+from app.services.auth_service import AuthService
+from tests.factories import make_user
+
+
+def access_token_for(user: User) -> TokenPayload:
+    return TokenPayload(sub=str(user.id), type=TokenType.ACCESS, exp=0, iat=0, jti=uuid4().hex)
+
+
+async def test_access_changes_evict_the_cached_principal(session, redis, statements):
+    user = await make_user(session, role=UserRole.RENTER)
+    await session.commit()
+    payload = access_token_for(user)
+
+    principal = await get_current_user(payload, session, redis)
+    assert principal.is_active and principal.role == UserRole.RENTER
+
+    # Cached: no database round trip
+    statements.clear()
+    assert await get_current_user(payload, session, redis) == principal
+    assert len(statements) == 0
+
+    await AuthService(session, redis).set_user_access(user.id, is_active=False, role=UserRole.ADMIN)
+
+    principal = await get_current_user(payload, session, redis)
+    assert not principal.is_active
+    assert principal.role == UserRole.ADMIN
+    with pytest.raises(HTTPException) as exc:
+        await get_current_active_user(principal)
+    assert exc.value.status_code == 403
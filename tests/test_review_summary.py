@@ -0,0 +1,138 @@
+"""Cached review summaries count each committed review exactly once."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.services.review_summary_service import ReviewSummaryService
+
+
+ITEM_ID = uuid4()
+AUTHOR_ID = uuid4()
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class CommittedReviews:
+    """Stands in for the review and item reads, over reviews committed so far."""
+
+    def __init__(self) -> None:
+        self.rows: list[SimpleNamespace] = []
+        self.histogram_reads = 0
+        # Runs once right after the next histogram snapshot is taken
+        self.after_snapshot: Callable[[], Awaitable[None]] | None = None
+
+    def commit(self, rating: int) -> int:
+        """Commit a review; returns the item's rating_count, as add_rating does."""
+
+        self.rows.append(
+            SimpleNamespace(
+                id=uuid4(),
+                rating=rating,
+                comment=f"review {len(self.rows) + 1}",
+                author_id=AUTHOR_ID,
+                created_at=EPOCH + timedelta(minutes=len(self.rows)),
+            )
+        )
+        return len(self.rows)
+
+    async def get_availability_window(self, item_id):
+        return SimpleNamespace(is_active=True)
+
+    async def rating_histogram(self, item_id) -> dict[int, int]:
+        self.histogram_reads += 1
+        snapshot = dict(Counter(row.rating for row in self.rows))
+        if self.after_snapshot is not None:
+            hook, self.after_snapshot = self.after_snapshot, None
+            await hook()
+        return snapshot
+
+    async def list_latest_for_item(self, item_id, limit: int):
+        return list(reversed(self.rows))[:limit]
+
+
+@pytest.fixture
+def committed() -> CommittedReviews:
+    return CommittedReviews()
+
+
+@pytest.fixture
+def service(redis, committed) -> ReviewSummaryService:
+    service = ReviewSummaryService(None, redis)
+    service.reviews = committed
+    service.items = committed
+    return service
+
+
+async def record(service: ReviewSummaryService, committed: CommittedReviews, rating_count: int) -> None:
+    row = committed.rows[rating_count - 1]
+    await service.record_review(
+        item_id=ITEM_ID,
+        rating_count=rating_count,
+        review_id=row.id,
+        rating=row.rating,
+        comment=row.comment,
+        author_id=row.author_id,
+        created_at=row.created_at,
+    )
+
+
+async def test_new_review_is_applied_incrementally(service, committed):
+    committed.commit(5)
+    await service._assemble(ITEM_ID)
+
+    await record(service, committed, committed.commit(3))
+    summary = await service._assemble(ITEM_ID)
+
+    assert committed.histogram_reads == 1
+    assert summary.count == 2
+    assert summary.histogram == {1: 0, 2: 0, 3: 1, 4: 0, 5: 1}
+    assert [s.comment for s in summary.latest] == ["review 2", "review 1"]
+
+
+async def test_review_already_in_a_rebuild_is_not_counted_twice(service, committed):
+    committed.commit(4)
+    rating_count = committed.commit(5)
+    # The rebuild reads the database after the review committed but before it was recorded
+    await service._assemble(ITEM_ID)
+
+    await record(service, committed, rating_count)
+    summary = await service._assemble(ITEM_ID)
+
+    assert summary.count == 2
+    assert summary.histogram[5] == 1
+    assert [s.comment for s in summary.latest] == ["review 2", "review 1"]
+
+
+async def test_review_recorded_during_a_rebuild_is_not_lost(service, committed):
+    committed.commit(4)
+
+    async def review_lands():
+        await record(service, committed, committed.commit(1))
+
+    committed.after_snapshot = review_lands
+    stale = await service._assemble(ITEM_ID)
+    summary = await service._assemble(ITEM_ID)
+
+    assert stale.count == 1
+    assert summary.count == 2
+    assert summary.histogram[1] == 1
+
+
+async def test_review_ahead_of_an_unrecorded_one_drops_the_summary(service, committed):
+    committed.commit(5)
+    await service._assemble(ITEM_ID)
+    second, third = committed.commit(4), committed.commit(3)
+
+    await record(service, committed, third)
+    await record(service, committed, second)
+    summary = await service._assemble(ITEM_ID)
+
+    assert committed.histogram_reads == 2
+    assert summary.count == 3
+    assert summary.histogram == {1: 0, 2: 0, 3: 1, 4: 1, 5: 1}
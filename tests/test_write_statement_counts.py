@@ -0,0 +1,194 @@
+"""Each repository write is a single INSERT/UPDATE ... RETURNING round trip."""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.models.enums import BookingStatus, EscrowStatus, UserRole
+from app.repositories.booking_repository import BookingRepository
+from app.repositories.category_repository import CategoryRepository
+from app.repositories.escrow_repository import EscrowRepository
+from app.repositories.item_repository import ItemRepository
+from app.repositories.message_repository import MessageRepository
+from app.repositories.review_repository import ReviewRepository
+from app.repositories.user_repository import UserRepository
+from tests.factories import make_item, make_user
+
+
+@pytest.fixture
+async def owner(session):
+    return await make_user(session, role=UserRole.OWNER)
+
+
+@pytest.fixture
+async def renter(session):
+    return await make_user(session)
+
+
+@pytest.fixture
+async def item(session, owner):
+    return await make_item(session, owner)
+
+
+@pytest.fixture
+async def booking(session, item, renter):
+    return await BookingRepository(session).create(
+        item_id=item.id,
+        renter_id=renter.id,
+        owner_id=item.owner_id,
+        start_date=date(2030, 1, 1),
+        end_date=date(2030, 1, 3),
+        total_price=Decimal("30.00"),
+        notes=None,
+    )
+
+
+@pytest.fixture
+async def escrow(session, booking):
+    return await EscrowRepository(session).create_for_booking(
+        booking_id=booking.id,
+        renter_id=booking.renter_id,
+        owner_id=booking.owner_id,
+        item_id=booking.item_id,
+        amount_held=Decimal("50.00"),
+        status=EscrowStatus.HELD,
+    )
+
+
+def assert_single_statement(statements, verb: str) -> None:
+    assert len(statements) == 1, statements.statements
+    statement = statements.statements[0]
+    assert statement.lstrip().upper().startswith(verb)
+    assert "RETURNING" in statement.upper()
+
+
+async def test_create_user(session, statements):
+    user = await make_user(session)
+
+    assert_single_statement(statements, "INSERT")
+    assert user.created_at is not None and user.updated_at is not None
+
+
+async def test_update_last_login(session, renter, statements):
+    user = await UserRepository(session).update_last_login(renter)
+
+    assert_single_statement(statements, "UPDATE")
+    assert user.last_login_at is not None
+
+
+async def test_create_category(session, statements):
+    category = await CategoryRepository(session).create("Tools", "tools", None)
+
+    assert_single_statement(statements, "INSERT")
+    assert category.created_at is not None
+
+
+async def test_create_item(session, owner, statements):
+    item = await make_item(session, owner)
+
+    assert_single_statement(statements, "INSERT")
+    assert item.category is None
+    assert item.rating_count == 0
+
+
+async def test_create_item_with_category_adds_only_the_category_load(session, owner, statements):
+    category = await CategoryRepository(session).create("Tools", "tools", None)
+    statements.clear()
+
+    item = await make_item(session, owner, category_id=category.id)
+
+    # ItemRead embeds the category; it is the only extra read
+    assert len(statements) == 2, statements.statements
+    assert statements.statements[0].lstrip().upper().startswith("INSERT")
+    assert "FROM categories" in statements.statements[1]
+    assert item.category.slug == "tools"
+
+
+async def test_update_item(session, item, statements):
+    updated = await ItemRepository(session).update_item(item.id, {"title": "Hammer drill"})
+
+    assert_single_statement(statements, "UPDATE")
+    assert updated.title == "Hammer drill"
+
+
+async def test_create_booking(session, item, renter, statements):
+    booking = await BookingRepository(session).create(
+        item_id=item.id,
+        renter_id=renter.id,
+        owner_id=item.owner_id,
+        start_date=date(2030, 2, 1),
+        end_date=date(2030, 2, 2),
+        total_price=Decimal("20.00"),
+        notes=None,
+    )
+
+    assert_single_statement(statements, "INSERT")
+    assert booking.status == BookingStatus.REQUESTED
+
+
+async def test_transition_booking_status(session, booking, statements):
+    approved = await BookingRepository(session).transition_status(
+        booking_id=booking.id,
+        new_status=BookingStatus.APPROVED,
+        allowed_from=(BookingStatus.REQUESTED,),
+    )
+
+    assert_single_statement(statements, "UPDATE")
+    assert approved.status == BookingStatus.APPROVED
+
+
+async def test_create_escrow(session, booking, statements):
+    escrow = await EscrowRepository(session).create_for_booking(
+        booking_id=booking.id,
+        renter_id=booking.renter_id,
+        owner_id=booking.owner_id,
+        item_id=booking.item_id,
+        amount_held=Decimal("50.00"),
+        status=EscrowStatus.HELD,
+    )
+
+    assert_single_statement(statements, "INSERT")
+    assert escrow.status == EscrowStatus.HELD
+
+
+async def test_settle_escrow(session, escrow, statements):
+    settled = await EscrowRepository(session).settle(escrow, Decimal("5.00"))
+
+    assert_single_statement(statements, "UPDATE")
+    assert settled.amount_released == Decimal("45.00")
+
+
+async def test_cancel_escrow(session, escrow, statements):
+    cancelled = await EscrowRepository(session).cancel(escrow)
+
+    assert_single_statement(statements, "UPDATE")
+    assert cancelled.status == EscrowStatus.CANCELLED
+
+
+async def test_create_review(session, booking, statements):
+    review = await ReviewRepository(session).create(
+        rating=5,
+        comment=None,
+        item_id=booking.item_id,
+        booking_id=booking.id,
+        author_id=booking.renter_id,
+        target_user_id=booking.owner_id,
+    )
+
+    assert_single_statement(statements, "INSERT")
+    assert review.created_at is not None
+
+
+async def test_create_message(session, owner, renter, statements):
+    message = await MessageRepository(session).create(
+        sender_id=renter.id,
+        receiver_id=owner.id,
+        content="Is it still available?",
+        conversation_id=None,
+    )
+
+    assert_single_statement(statements, "INSERT")
+    assert message.created_at is not None